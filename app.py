@@ -5,11 +5,31 @@ import numpy as np
 import re
 import io
 import base64
+import time
+import json
+from collections import deque
 from datetime import datetime, timedelta
 import pytz
 from streamlit_option_menu import option_menu
 import plotly.express as px
-from utils import calculate_team_progress,calculate_team_status_summary, calculate_srs_created_per_week, _get_week_display_str, extract_approver_name, calculate_daily_backlog_growth, calculate_breached_incidents_by_month, calculate_incident_status_summary_with_totals
+from utils import (
+    extract_approver_name, calculate_incident_status_summary_with_totals,
+    build_categorical_option_masks, apply_categorical_option_masks, calculate_facet_counts, build_dataset_catalog,
+    compute_sort_permutation, get_page_bounds, compute_index_fingerprint, fit_table_to_payload_budget,
+    build_case_id_index, search_case_id_prefix, lookup_case_position, build_note_search_index, search_note_index,
+    compile_filter_mask, load_filter_presets, update_filter_preset, FilterResultMemo,
+    compute_analysis_summaries, build_sr_status_breakdown,
+    build_day_slice_index, get_day_positions, calculate_user_type_breakdown, calculate_daily_triage_counts,
+    compute_iso_week_codes, get_iso_week_labels,
+    build_incident_rollup_cube, rollup_cube_counts, rollup_counts_with_total, OPEN_INCIDENT_STATUSES,
+    calculate_open_backlog_series,
+    build_backlog_growth_matrix, calculate_backlog_growth_from_matrix, rollup_backlog_growth,
+    build_team_progress_index, query_team_progress, get_team_progress_sparklines, build_status_team_grid,
+    build_ticket_case_adjacency, get_linked_tickets, get_ticket_case_positions,
+    normalize_ticket_ids, build_ticket_positions, lookup_ticket, anti_join_ticket_positions, build_open_orphan_tickets,
+    WORK_QUEUE_ORDERS, build_user_work_queue_index, query_user_work_queue,
+    AGE_BUCKET_EDGES, calculate_age_bucket_counts,
+)
 
 # Set page configuration
 st.set_page_config(
@@ -266,6 +286,31 @@ if 'incident_overview_df' not in st.session_state:
     st.session_state.incident_overview_df = None
 if 'report_datetime' not in st.session_state:
     st.session_state.report_datetime = None
+# Version tokens identify each uploaded file so cached computations are reused until a new upload
+if 'main_df_version' not in st.session_state:
+    st.session_state.main_df_version = None
+if 'sr_df_version' not in st.session_state:
+    st.session_state.sr_df_version = None
+if 'incident_df_version' not in st.session_state:
+    st.session_state.incident_df_version = None
+# Recent section render times, kept across full and fragment reruns for the debug panel
+if 'rerun_latency' not in st.session_state:
+    st.session_state.rerun_latency = deque(maxlen=50)
+if 'dataset_catalogs' not in st.session_state:
+    st.session_state.dataset_catalogs = {}
+if 'table_payload_bytes' not in st.session_state:
+    st.session_state.table_payload_bytes = {}
+if 'analysis_filter_state' not in st.session_state:
+    st.session_state.analysis_filter_state = {'triage_status': 'All', 'type': 'All', 'status': 'All'}
+if 'filter_presets' not in st.session_state:
+    st.session_state.filter_presets = None
+# Per-session LRU of filter results (row positions) keyed by dataset version and filter state
+if 'filter_result_memo' not in st.session_state:
+    st.session_state.filter_result_memo = FilterResultMemo(max_entries=16)
+
+script_started_at = time.perf_counter()
+# Set until the end of the script, so sections timed without it were redrawn by a fragment-only rerun
+st.session_state.full_rerun_in_progress = True
 
 @st.cache_data
 def load_data(file):
@@ -431,6 +476,399 @@ def generate_excel_download(data):
     output.seek(0)
     return output
 
+# Function to build a version token for an uploaded file (changes on every new upload)
+def get_file_version(file):
+    return f"{file.name}:{file.size}:{getattr(file, 'file_id', '')}"
+
+# Function to record how long a section took to render on this (partial) rerun; shown in the sidebar debug panel
+def report_section_latency(section_name, started_at):
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    rerun_kind = "Full" if st.session_state.get('full_rerun_in_progress') else "Fragment"
+    st.session_state.rerun_latency.append({
+        'At': datetime.now().strftime('%H:%M:%S'),
+        'Section': section_name,
+        'Rerun': rerun_kind,
+        'Render (ms)': round(elapsed_ms),
+    })
+    # Drawn at the end of the section, so fragment-only reruns show their own time in place
+    if st.session_state.get('show_section_latency'):
+        st.caption(f"⏱️ {section_name}: {elapsed_ms:.0f} ms ({rerun_kind.lower()} rerun)")
+    print(f"--- INFO: {section_name} rendered in {elapsed_ms:.1f} ms ---")
+
+# Cached per-column option codes for the Incident Overview filters (built once per incident upload)
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_incident_option_masks(_overview_df, dataset_version):
+    return build_categorical_option_masks(_overview_df, ['Creator', 'Team', 'Priority', 'Status'])
+
+# Facet counts for the Incident Overview filters, cached per filter state
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_incident_facet_counts(_option_masks, dataset_version, selections_key, n_rows):
+    return calculate_facet_counts(_option_masks, {col: list(values) for col, values in selections_key}, n_rows)
+
+# Incident rollup cube: counts per (created day, team, status, priority, source, creator, breach) cell,
+# built once per incident upload and sliced by the Incident Overview and Daily Meeting Report tabs
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_incident_rollup_cube(_incident_df, dataset_version):
+    return build_incident_rollup_cube(_incident_df)
+
+# Created-day x team x Source matrix for the Ivanti backlog growth views, built once per incident upload
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_backlog_growth_matrix(_incident_cube, dataset_version):
+    return build_backlog_growth_matrix(_incident_cube)
+
+# Statuses that close an item for the open-backlog sweep (compared case-insensitively)
+SR_CLOSED_STATUSES = ["closed", "completed", "cancelled", "approval rejected", "rejected by ps"]
+INCIDENT_CLOSED_STATUSES = ["closed", "cancelled"]
+
+# Daily open-backlog series (created/closed event sweep), cached per upload and split
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_open_backlog_series(_df, dataset_version, closed_col, closed_statuses, group_col, end_day):
+    return calculate_open_backlog_series(_df, closed_col, list(closed_statuses), group_col, end_day=end_day)
+
+# Function to render the open-backlog chart of an SR or incident upload
+@st.fragment
+def render_open_backlog(df, dataset_version, item_label, closed_col, closed_statuses, split_options, key_prefix):
+    section_started_at = time.perf_counter()
+    st.subheader(f"📉 Open {item_label} Backlog")
+    split_by = st.selectbox(
+        "Split backlog by",
+        ["None"] + [col for col in split_options if col in df.columns],
+        key=f"{key_prefix}_backlog_split"
+    )
+    group_col = None if split_by == "None" else split_by
+    today = datetime.now().date()
+    backlog_df = get_open_backlog_series(df, dataset_version, closed_col, tuple(closed_statuses), group_col, today)
+
+    if backlog_df.empty:
+        st.info(f"No valid 'Created On' dates to build the open {item_label} backlog.")
+    else:
+        # Future-dated events extend the series past today, so read today's row rather than the last one
+        today_day = backlog_df.index.asof(pd.Timestamp(today))
+        open_today = 0 if pd.isna(today_day) else int(backlog_df.loc[today_day].sum())
+        st.metric(f"Open {item_label} Today", open_today)
+        # Wide form: one line per backlog column, so group labels never clash with value names
+        fig_backlog = px.line(
+            backlog_df,
+            title=f"Open {item_label} at End of Day",
+            labels={'value': f'Open {item_label}', 'Day': 'Day', 'variable': group_col or ''}
+        )
+        fig_backlog.update_layout(showlegend=group_col is not None)
+        st.plotly_chart(fig_backlog, use_container_width=True, key=f"{key_prefix}_backlog_chart")
+        st.caption(f"Created items count from 'Created On'; {item_label} in a closed status leave the backlog on their '{closed_col}' day.")
+    report_section_latency(f"Open {item_label} Backlog", section_started_at)
+
+# Member x day check counts with cumulative sums for Team Progress, per incident upload and team filter
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_team_progress_index(_incident_df, dataset_version, teams_key):
+    return build_team_progress_index(_incident_df)
+
+# Columns that may hold the incident id in the incident report, in order of preference
+INCIDENT_ID_COLUMN_OPTIONS = ['Incident', 'Incident ID', 'IncidentID', 'ID', 'Number']
+
+# Ticket number and type classified from each case's last note, once per main upload
+@st.cache_data(show_spinner="Classifying case notes...", max_entries=2)
+def get_case_ticket_refs(_main_df, dataset_version):
+    refs = [classify_and_extract(note)[1:] for note in _main_df['Last Note']]
+    return pd.DataFrame(refs, columns=['Ticket Number', 'Type'])
+
+# Ticket id -> row positions of one uploaded file (optionally of one ticket type), built once per upload
+@st.cache_data(show_spinner="Indexing tickets...", max_entries=12)
+def get_ticket_positions(_id_df, dataset_version, id_column, ticket_type=None):
+    ids = _id_df[id_column]
+    if ticket_type is not None:
+        ids = ids.where(_id_df['Type'] == ticket_type)
+    return build_ticket_positions(ids)
+
+# Function to list the uploaded files that can be searched by ticket number
+def get_ticket_sources():
+    ticket_sources = {}
+    main_df = st.session_state.main_df
+    if main_df is not None and 'Last Note' in main_df.columns:
+        ticket_sources['Cases'] = {
+            'df': main_df, 'version': st.session_state.main_df_version, 'id_column': 'Ticket Number',
+            'id_df': get_case_ticket_refs(main_df, st.session_state.main_df_version),
+            'preview_cols': ['Case Id', 'Current User Id', 'Case Start Date', 'Last Note Date'],
+        }
+    sr_df = st.session_state.sr_df
+    if sr_df is not None and 'Service Request' in sr_df.columns:
+        ticket_sources['SR'] = {
+            'df': sr_df, 'version': st.session_state.sr_df_version, 'id_column': 'Service Request', 'id_df': sr_df,
+            'preview_cols': ['Service Request', 'Status', 'Created On', 'LastModDateTime'],
+        }
+    incident_df = st.session_state.incident_df
+    incident_id_col = next((col for col in INCIDENT_ID_COLUMN_OPTIONS if incident_df is not None and col in incident_df.columns), None)
+    if incident_id_col:
+        ticket_sources['Incident'] = {
+            'df': incident_df, 'version': st.session_state.incident_df_version, 'id_column': incident_id_col, 'id_df': incident_df,
+            'preview_cols': [incident_id_col, 'Status', 'Team', 'Created On', 'Last Checked at'],
+        }
+    return ticket_sources
+
+# Function to render the sidebar ticket lookup: the cases, SR row and incident row of one ticket
+@st.fragment
+def render_ticket_lookup():
+    section_started_at = time.perf_counter()
+    st.subheader("🎫 Ticket Lookup")
+    ticket_sources = get_ticket_sources()
+
+    if not ticket_sources:
+        st.caption("Upload data to look tickets up.")
+    else:
+        ticket_query = st.text_input("Ticket number", key="ticket_lookup_query", placeholder="e.g. 12345 or SR 12345")
+        if ticket_query.strip():
+            ticket_positions = {
+                name: get_ticket_positions(source['id_df'], source['version'], source['id_column'])
+                for name, source in ticket_sources.items()
+            }
+            ticket_matches = lookup_ticket(ticket_positions, ticket_query)
+            if not ticket_matches:
+                st.warning("Enter a ticket number with at least 4 digits.")
+            for name, positions in ticket_matches.items():
+                df = ticket_sources[name]['df']
+                st.markdown(f"**{name}:** {len(positions)} found")
+                if len(positions):
+                    preview_cols = [col for col in ticket_sources[name]['preview_cols'] if col in df.columns]
+                    render_table(df.iloc[positions][preview_cols], f"ticket_lookup_{name.lower()}_table", hide_index=True)
+    report_section_latency("Ticket Lookup", section_started_at)
+
+# Orphan tickets as anti-joins of the per-upload ticket indexes: open SRs/incidents that no case references,
+# and cases referencing a ticket missing from the matching status file. Cached per set of uploads.
+@st.cache_data(show_spinner=False, max_entries=2)
+def get_ticket_orphans(_ticket_sources, source_versions):
+    cases = _ticket_sources['Cases']
+    open_orphans = []
+    missing_ticket_positions = []
+    for ticket_type, closed_statuses in [('SR', SR_CLOSED_STATUSES), ('Incident', INCIDENT_CLOSED_STATUSES)]:
+        if ticket_type not in _ticket_sources:
+            continue
+        source = _ticket_sources[ticket_type]
+        status_positions = get_ticket_positions(source['id_df'], source['version'], source['id_column'])
+        case_positions = get_ticket_positions(cases['id_df'], cases['version'], cases['id_column'], ticket_type)
+        open_orphans.append(build_open_orphan_tickets(
+            source['df'], anti_join_ticket_positions(status_positions, case_positions),
+            source['id_column'], ticket_type, closed_statuses
+        ))
+        missing_ticket_positions.append(anti_join_ticket_positions(case_positions, status_positions))
+
+    missing_positions = np.sort(np.concatenate(missing_ticket_positions))
+    case_cols = [col for col in cases['preview_cols'] if col in cases['df'].columns]
+    missing_tickets_df = pd.concat([
+        cases['df'].iloc[missing_positions][case_cols].reset_index(drop=True),
+        cases['id_df'].iloc[missing_positions].reset_index(drop=True)
+    ], axis=1)
+    missing_tickets_df['Ticket Number'] = missing_tickets_df['Ticket Number'].astype('Int64')
+    return pd.concat(open_orphans, ignore_index=True), missing_tickets_df
+
+# Function to render the orphan tickets with counts and exports
+@st.fragment
+def render_ticket_orphans():
+    section_started_at = time.perf_counter()
+    st.subheader("🧩 Orphan Tickets")
+    ticket_sources = get_ticket_sources()
+
+    if 'Cases' not in ticket_sources or len(ticket_sources) == 1:
+        st.info("Upload the main file and an SR status or incident report file to detect orphan tickets.")
+    else:
+        source_versions = tuple((name, source['version']) for name, source in ticket_sources.items())
+        open_orphans_df, missing_tickets_df = get_ticket_orphans(ticket_sources, source_versions)
+        export_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        orphan_col1, orphan_col2 = st.columns(2)
+        with orphan_col1:
+            st.metric("Open tickets without a case", f"{len(open_orphans_df):,}")
+            if not open_orphans_df.empty:
+                render_table(open_orphans_df, "open_orphan_tickets_table", hide_index=True)
+                # Deferred export: the workbook is only written when the button is clicked
+                st.download_button(
+                    label="📥 Download Open Tickets Without a Case",
+                    data=lambda: generate_excel_download(open_orphans_df),
+                    file_name=f"open_tickets_without_case_{export_stamp}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+        with orphan_col2:
+            st.metric("Cases referencing missing tickets", f"{len(missing_tickets_df):,}")
+            if not missing_tickets_df.empty:
+                render_table(missing_tickets_df, "cases_missing_tickets_table", hide_index=True)
+                st.download_button(
+                    label="📥 Download Cases With Missing Tickets",
+                    data=lambda: generate_excel_download(missing_tickets_df),
+                    file_name=f"cases_with_missing_tickets_{export_stamp}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+        st.caption("SRs are matched against the SR status file and incidents against the incident report, on the normalised ticket number.")
+    report_section_latency("Orphan Tickets", section_started_at)
+
+# Columns cataloged per dataset: (session key of the DataFrame, session key of its version, columns)
+DATASET_CATALOG_SPECS = {
+    'main': ('main_df', 'main_df_version', ['Current User Id', 'Case Start Date']),
+    'incident': ('incident_df', 'incident_df_version', ['Team', 'Last Check By']),
+    'incident_overview': ('incident_overview_df', 'incident_df_version', ['Creator', 'Team', 'Priority', 'Status', 'Breach Date']),
+}
+
+# Function to get a dataset's catalog (unique values, null counts, min/max), built once per upload
+def get_dataset_catalog(dataset_name):
+    df_key, version_key, columns = DATASET_CATALOG_SPECS[dataset_name]
+    df = st.session_state.get(df_key)
+    if df is None:
+        return {}
+    version = st.session_state.get(version_key)
+    cached = st.session_state.dataset_catalogs.get(dataset_name)
+    if cached is None or cached[0] != version:
+        print(f"--- INFO: Building catalog for '{dataset_name}' dataset ---")
+        cached = (version, build_dataset_catalog(df, columns))
+        st.session_state.dataset_catalogs[dataset_name] = cached
+    return cached[1]
+
+# Function to read a column's sorted unique values from a dataset catalog
+def get_catalog_options(dataset_name, column):
+    return list(get_dataset_catalog(dataset_name).get(column, {}).get('unique', []))
+
+# Function to read the currently applied Incident Overview filter selections
+def get_incident_overview_selections():
+    return {
+        'Creator': st.session_state.get('selected_creators'),
+        'Team': st.session_state.get('selected_teams'),
+        'Priority': st.session_state.get('selected_priorities'),
+        'Status': st.session_state.get('selected_statuses'),
+    }
+
+# Function to turn one column's facet counts into a table sorted by count
+def build_facet_count_table(option_counts, column_name):
+    facet_table = pd.DataFrame({column_name: list(option_counts.keys()), 'Incidents': list(option_counts.values())})
+    return facet_table.sort_values('Incidents', ascending=False, kind='stable')
+
+TABLE_PAYLOAD_BUDGET_BYTES = 1024 * 1024
+TABLE_TEXT_PREVIEW_CHARS = 200
+
+# Function to render a table within the browser payload budget: long text is previewed, types are downcast, bytes are logged
+def render_table(df, table_key, **dataframe_kwargs):
+    show_full_text = st.session_state.get(f"{table_key}_show_full_text", False)
+    display_df, payload_bytes, truncated, truncated_rows = fit_table_to_payload_budget(
+        df,
+        TABLE_PAYLOAD_BUDGET_BYTES,
+        max_text_chars=None if show_full_text else TABLE_TEXT_PREVIEW_CHARS
+    )
+    table_event = st.dataframe(display_df, **dataframe_kwargs)
+    st.session_state.table_payload_bytes[table_key] = payload_bytes
+    print(f"--- INFO: Table '{table_key}' sent {payload_bytes:,} bytes ({len(display_df)} rows x {len(display_df.columns)} columns) ---")
+    if truncated_rows:
+        st.caption(f"Showing the first {len(display_df):,} of {len(df):,} rows to keep the page fast.")
+    if truncated or show_full_text:
+        st.toggle("Show full text", key=f"{table_key}_show_full_text", help="Long text is shortened to a preview to keep the page fast.")
+    return table_event
+
+FILTER_PRESETS_FILE = "filter_presets.json"
+
+# Widget keys of the Analysis tab filters, by filter spec field
+ANALYSIS_FILTER_WIDGET_KEYS = {
+    'triage_status': 'analysis_triage_status_filter',
+    'type': 'analysis_type_filter',
+    'status': 'analysis_unified_status_filter',
+}
+
+# Function to seed an Analysis filter selectbox from the stored filter state (kept across tabs, set by presets)
+def seed_filter_widget(filter_field, options):
+    widget_key = ANALYSIS_FILTER_WIDGET_KEYS[filter_field]
+    if st.session_state.get(widget_key) not in options:
+        stored_value = st.session_state.analysis_filter_state.get(filter_field, 'All')
+        st.session_state[widget_key] = stored_value if stored_value in options else options[0]
+
+# Function to capture the current sidebar and Analysis filters in the same shape as a saved preset
+def get_current_filter_spec():
+    date_range_value = st.session_state.get('sidebar_date_range_value')
+    return {
+        'users': list(st.session_state.get('selected_users', [])),
+        'date_range': [d.isoformat() for d in date_range_value] if isinstance(date_range_value, tuple) and len(date_range_value) == 2 else None,
+        **st.session_state.analysis_filter_state,
+    }
+
+# Function to get saved filter presets; the file is shared by every session, so it is re-read whenever it changes on disk
+def get_filter_presets():
+    try:
+        presets_mtime = os.path.getmtime(FILTER_PRESETS_FILE)
+    except OSError:
+        presets_mtime = None
+    cached = st.session_state.filter_presets
+    if cached is None or cached[0] != presets_mtime:
+        st.session_state.filter_presets = (presets_mtime, load_filter_presets(FILTER_PRESETS_FILE))
+    return st.session_state.filter_presets[1]
+
+# Callback to apply a saved preset: sets every controlled filter state at once, before the widgets are drawn
+def apply_filter_preset(preset_name, preset, all_users, date_bounds):
+    users = [u for u in preset.get('users', []) if u in all_users]
+    st.session_state.selected_users = users
+    st.session_state.sidebar_user_widget_selection_controlled = list(users)
+    # Dropping the widget states makes the sidebar widgets start again from the controlled values
+    st.session_state.pop('multi_select_sidebar_users', None)
+
+    if preset.get('date_range') and date_bounds:
+        min_date, max_date = date_bounds
+        start_date, end_date = (min(max(pd.Timestamp(d).date(), min_date), max_date) for d in preset['date_range'])
+        st.session_state.sidebar_date_range_value = (start_date, end_date) if start_date <= end_date else (min_date, max_date)
+        st.session_state.pop('date_input_sidebar', None)
+
+    st.session_state.analysis_filter_state = {
+        filter_field: preset.get(filter_field, 'All') for filter_field in ANALYSIS_FILTER_WIDGET_KEYS
+    }
+    for filter_field, widget_key in ANALYSIS_FILTER_WIDGET_KEYS.items():
+        st.session_state[widget_key] = st.session_state.analysis_filter_state[filter_field]
+    # The user and date part the preset leaves in effect, compiled over the main upload on the next run
+    applied_date_range = st.session_state.get('sidebar_date_range_value') if date_bounds else None
+    st.session_state.applied_filter_preset_key = get_sidebar_filter_key(users, applied_date_range)
+    print(f"--- INFO: Applied filter preset '{preset_name}' ---")
+
+# Function to serialise the sidebar user and date filters, as the cache key of their compiled row positions
+def get_sidebar_filter_key(users, date_range):
+    return json.dumps({'users': list(users), 'date_range': list(date_range) if date_range else None}, sort_keys=True, default=str)
+
+# Row positions of a preset's user and date filters over the main upload, compiled once per upload and preset
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_preset_filter_positions(_df_main, dataset_version, sidebar_filter_key):
+    return np.flatnonzero(compile_filter_mask(_df_main, json.loads(sidebar_filter_key)))
+
+PAGE_SIZE_OPTIONS = [25, 50, 100, 250, 500]
+ORIGINAL_ORDER_OPTION = "(Original order)"
+
+# Cached sort order for a paged table, one permutation per table state, column and direction
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_sort_permutation(_df, table_token, sort_column, ascending):
+    return compute_sort_permutation(_df[sort_column], ascending)
+
+# Function to render a large table one page at a time (only the visible page is sent to the browser)
+def render_paged_table(df, columns, table_key, data_version, **dataframe_kwargs):
+    columns = [col for col in columns if col in df.columns]
+    total_rows = len(df)
+
+    control_cols = st.columns([3, 2, 2, 2])
+    with control_cols[0]:
+        sort_column = st.selectbox("Sort by", [ORIGINAL_ORDER_OPTION] + columns, key=f"{table_key}_sort_column")
+    with control_cols[1]:
+        sort_direction = st.selectbox("Order", ["Ascending", "Descending"], key=f"{table_key}_sort_direction")
+    with control_cols[2]:
+        page_size = st.selectbox("Rows per page", PAGE_SIZE_OPTIONS, index=1, key=f"{table_key}_page_size")
+
+    # Keep the stored page within range when filters shrink the table
+    page_key = f"{table_key}_page_number"
+    n_pages = get_page_bounds(total_rows, page_size, 1)[3]
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    elif page_key not in st.session_state:
+        st.session_state[page_key] = 1
+    with control_cols[3]:
+        requested_page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    start, stop, page_number, n_pages = get_page_bounds(total_rows, page_size, int(requested_page))
+    if sort_column == ORIGINAL_ORDER_OPTION:
+        page_positions = np.arange(start, stop)
+    else:
+        table_token = (data_version, compute_index_fingerprint(df), datetime.now().date())
+        permutation = get_sort_permutation(df, table_token, sort_column, sort_direction == "Ascending")
+        page_positions = permutation[start:stop]
+
+    render_table(df.iloc[page_positions][columns], table_key, hide_index=True, **dataframe_kwargs)
+    if total_rows:
+        st.caption(f"Showing rows {start + 1:,}–{stop:,} of {total_rows:,} (page {page_number:,} of {n_pages:,})")
+
 # Sidebar - File Upload Section
 with st.sidebar:
     # Display the logo
@@ -451,6 +889,8 @@ with st.sidebar:
             df, parsed_dt = load_data(uploaded_file)
             if df is not None:
                 st.session_state.main_df = process_main_df(df)
+                st.session_state.main_df_version = get_file_version(uploaded_file)
+                get_dataset_catalog('main')
                 abu_dhabi_tz = pytz.timezone('Asia/Dubai')
                 st.session_state.last_upload_time = datetime.now(abu_dhabi_tz).strftime("%Y-%m-%d %H:%M:%S")
                 st.success(f"Main data loaded: {df.shape[0]} records")
@@ -469,6 +909,7 @@ with st.sidebar:
             sr_df, parsed_dt_sr = load_data(sr_status_file)
             if sr_df is not None:
                 st.session_state.sr_df = sr_df
+                st.session_state.sr_df_version = get_file_version(sr_status_file)
                 st.success(f"SR status data loaded: {sr_df.shape[0]} records")
                 if st.session_state.report_datetime is None and parsed_dt_sr:
                     st.session_state.report_datetime = parsed_dt_sr
@@ -479,6 +920,8 @@ with st.sidebar:
             incident_df, parsed_dt_incident = load_data(incident_status_file)
             if incident_df is not None:
                 st.session_state.incident_df = incident_df
+                st.session_state.incident_df_version = get_file_version(incident_status_file)
+                get_dataset_catalog('incident')
                 st.success(f"Incident report data loaded: {incident_df.shape[0]} records")
                 if st.session_state.report_datetime is None and parsed_dt_incident:
                     st.session_state.report_datetime = parsed_dt_incident
@@ -520,6 +963,7 @@ with st.sidebar:
                     # For now, we proceed with successfully parsed dates.
 
                 st.session_state.incident_overview_df = overview_df
+                get_dataset_catalog('incident_overview')
                 st.success(f"Incident Overview data loaded: {len(overview_df)} records, {len(overview_df.columns)} columns.")
             else:
                 st.session_state.incident_overview_df = None
@@ -537,8 +981,8 @@ with st.sidebar:
     # Filters section (existing logic, depends on st.session_state.data_loaded)
     if st.session_state.data_loaded:
         st.subheader("🔍 Filters")
-        df_main = st.session_state.main_df.copy() # Should be safe as data_loaded is True
-        all_users = df_main['Current User Id'].dropna().unique().tolist()
+        df_main = st.session_state.main_df # Should be safe as data_loaded is True; only read for its columns
+        all_users = get_catalog_options('main', 'Current User Id')
         SELECT_ALL_USERS_OPTION = "[Select All Users]"
         default_users_hardcoded = ['ali.babiker', 'anas.hasan', 'ahmed.mostafa','GPSSA_H.Salah','alharith.alfki']
         default_users = [u for u in default_users_hardcoded if u in all_users]
@@ -591,9 +1035,14 @@ with st.sidebar:
                 else:
                     st.session_state.sidebar_user_widget_selection_controlled = list(currently_selected_actual_items)
         
-        if 'Case Start Date' in df_main.columns:
-            min_date = df_main['Case Start Date'].min().date()
-            max_date = df_main['Case Start Date'].max().date()
+        # The catalog has no min/max when every 'Case Start Date' is missing or unparseable
+        case_start_stats = get_dataset_catalog('main').get('Case Start Date') if 'Case Start Date' in df_main.columns else None
+        has_case_start_dates = case_start_stats is not None and case_start_stats['min'] is not None
+        if case_start_stats is not None and not has_case_start_dates:
+            st.caption("No valid 'Case Start Date' values, so the date range filter is not available.")
+        if has_case_start_dates:
+            min_date = case_start_stats['min'].date()
+            max_date = case_start_stats['max'].date()
             if 'sidebar_date_range_value' not in st.session_state:
                 st.session_state.sidebar_date_range_value = (min_date, max_date)
             if st.button("Select Full Range", key="btn_select_full_date_range"):
@@ -609,6 +1058,37 @@ with st.sidebar:
                 st.session_state.sidebar_date_range_value = current_date_range_from_widget
             date_range = st.session_state.sidebar_date_range_value
 
+        # Saved filter presets: one click sets users, date range and the Analysis filters together
+        st.markdown("---")
+        st.subheader("⭐ Filter Presets")
+        filter_presets = get_filter_presets()
+        date_bounds = (min_date, max_date) if has_case_start_dates else None
+        if filter_presets:
+            preset_name = st.selectbox("Saved presets", sorted(filter_presets), key="filter_preset_select")
+            preset_col1, preset_col2 = st.columns(2)
+            with preset_col1:
+                st.button(
+                    "Apply",
+                    key="btn_apply_filter_preset",
+                    on_click=apply_filter_preset,
+                    args=(preset_name, filter_presets[preset_name], all_users, date_bounds)
+                )
+            with preset_col2:
+                if st.button("Delete", key="btn_delete_filter_preset"):
+                    update_filter_preset(FILTER_PRESETS_FILE, preset_name)
+                    st.rerun()
+        else:
+            st.caption("No saved presets yet.")
+        st.caption("Presets are shared by everyone using this app.")
+
+        new_preset_name = st.text_input("Save current filters as", key="filter_preset_name")
+        if st.button("Save Preset", key="btn_save_filter_preset"):
+            if new_preset_name.strip():
+                update_filter_preset(FILTER_PRESETS_FILE, new_preset_name.strip(), get_current_filter_spec())
+                st.success(f"Preset '{new_preset_name.strip()}' saved.")
+            else:
+                st.warning("Please enter a name for the preset.")
+
 # Main content
 if not st.session_state.data_loaded:
     st.title("📊 Intellipen SmartQ Test")
@@ -632,27 +1112,22 @@ if not st.session_state.data_loaded:
     """)
 else:
     # Process and filter data
-    df_main = st.session_state.main_df.copy()
+    df_main = st.session_state.main_df
     
-    # Apply user filters
-    if st.session_state.selected_users:
-        df_filtered = df_main[df_main['Current User Id'].isin(st.session_state.selected_users)].copy()
+    # Apply user and date filters. The matching row positions are memoised per session,
+    # so flipping back to a recent combination is a single positional lookup.
+    sidebar_date_range = date_range if 'date_range' in locals() and isinstance(date_range, tuple) and len(date_range) == 2 else None
+    sidebar_filter_spec = {'users': list(st.session_state.selected_users), 'date_range': sidebar_date_range}
+    sidebar_filter_key = get_sidebar_filter_key(st.session_state.selected_users, sidebar_date_range)
+    if st.session_state.get('applied_filter_preset_key') == sidebar_filter_key:
+        # An applied preset is still in effect: its mask is compiled once per upload and shared across sessions
+        main_filter_positions = get_preset_filter_positions(df_main, st.session_state.main_df_version, sidebar_filter_key)
     else:
-        df_filtered = df_main.copy()
-    
-    # Apply date filter if date range is selected and column exists
-    if 'date_range' in locals() and 'Case Start Date' in df_filtered.columns:
-        # Ensure date_range is a tuple of two dates
-        if isinstance(date_range, tuple) and len(date_range) == 2:
-            start_date, end_date = date_range
-            # Additional check to ensure dates are not NaT or None
-            if pd.notna(start_date) and pd.notna(end_date):
-                # Ensure the 'Case Start Date' column is in datetime format before filtering
-                if pd.api.types.is_datetime64_any_dtype(df_filtered['Case Start Date']):
-                    df_filtered = df_filtered[
-                        (df_filtered['Case Start Date'].dt.date >= start_date) &
-                        (df_filtered['Case Start Date'].dt.date <= end_date)
-                    ]
+        main_filter_positions = st.session_state.filter_result_memo.get_or_compute(
+            ('main_filter', st.session_state.main_df_version, tuple(st.session_state.selected_users), sidebar_date_range),
+            lambda: np.flatnonzero(compile_filter_mask(df_main, sidebar_filter_spec))
+        )
+    df_filtered = df_main.iloc[main_filter_positions]
     
     # Prepare tab interface
     selected = option_menu(
@@ -716,8 +1191,7 @@ else:
             sr_df_copy = st.session_state.sr_df.copy()
             
             if 'Service Request' in sr_df_copy.columns:
-                sr_df_copy['Service Request'] = sr_df_copy['Service Request'].astype(str).str.extract(r'(\d{4,})')
-                sr_df_copy['Service Request'] = pd.to_numeric(sr_df_copy['Service Request'], errors='coerce')
+                sr_df_copy['Service Request'] = normalize_ticket_ids(sr_df_copy['Service Request'])
                 sr_df_copy.dropna(subset=['Service Request'], inplace=True)
 
                 # Proactively rename columns from the SR file to avoid suffix ambiguity
@@ -758,16 +1232,14 @@ else:
         # Merge with Incident status data if available
         if hasattr(st.session_state, 'incident_df') and st.session_state.incident_df is not None:
             incident_df_copy = st.session_state.incident_df.copy()
-            incident_id_col_options = ['Incident', 'Incident ID', 'IncidentID', 'ID', 'Number']
             incident_id_col = None
-            for col_option in incident_id_col_options:
+            for col_option in INCIDENT_ID_COLUMN_OPTIONS:
                 if col_option in incident_df_copy.columns:
                     incident_id_col = col_option
                     break
             
             if incident_id_col:
-                incident_df_copy[incident_id_col] = incident_df_copy[incident_id_col].astype(str).str.extract(r'(\d{4,})')
-                incident_df_copy[incident_id_col] = pd.to_numeric(incident_df_copy[incident_id_col], errors='coerce')
+                incident_df_copy[incident_id_col] = normalize_ticket_ids(incident_df_copy[incident_id_col])
                 incident_df_copy.dropna(subset=[incident_id_col], inplace=True)
                 
                 inc_rename_map = {incident_id_col: 'Incident_Number_temp'}
@@ -864,8 +1336,61 @@ else:
             
         return df_enriched
     
-    # Enrich data with classifications and metrics
-    df_enriched = enrich_data(df_filtered)
+    # Analysis tab summary tables (single grouped pass), cached per filtered view
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_analysis_summaries(_df_enriched, enrichment_key):
+        return compute_analysis_summaries(_df_enriched)
+
+    # SR status summary with the approver breakdown, cached per filtered view
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_sr_status_breakdown(_df_enriched, enrichment_key, _sr_status_summary):
+        return build_sr_status_breakdown(_df_enriched[_df_enriched['Type'] == 'SR'], _sr_status_summary)
+
+    # Row positions per 'Last Note Date' day, cached per filtered view
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_last_note_day_index(_df_enriched, enrichment_key):
+        return build_day_slice_index(_df_enriched['Last Note Date'])
+
+    # Per (day, user, type) counts of triaged notes for the trend window
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_daily_triage_counts(_df_enriched, enrichment_key, end_day, n_days):
+        return calculate_daily_triage_counts(_df_enriched, end_day, n_days)
+
+    # Ticket -> linked cases adjacency, ranked by case count, cached per filtered view
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_ticket_case_adjacency(_df_enriched, enrichment_key):
+        return build_ticket_case_adjacency(_df_enriched)
+
+    # Per-user case orderings (oldest, stalest) for the work queue, cached per filtered view
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def get_user_work_queue_index(_df_enriched, enrichment_key):
+        return build_user_work_queue_index(_df_enriched)
+
+    # Ageing bucket x group counts for the age distribution charts, cached per filtered view and bucket edges
+    @st.cache_data(show_spinner=False, max_entries=16)
+    def get_age_bucket_counts(_df_enriched, enrichment_key, group_column, edges, missing_label=None):
+        return calculate_age_bucket_counts(_df_enriched, group_column, list(edges), missing_label)
+
+    # Inverted index over 'Last Note' for the note search, built once per main upload
+    @st.cache_data(show_spinner="Indexing notes...", max_entries=2)
+    def get_note_search_index(_main_df, dataset_version):
+        return build_note_search_index(_main_df['Last Note']), _main_df['Case Id'].to_numpy()
+
+    # Enrich data with classifications and metrics.
+    # Cached per uploaded files + sidebar filters so widget and fragment reruns reuse the same result.
+    @st.cache_data(show_spinner="Enriching data...", max_entries=8)
+    def get_enriched_data(_df_filtered, enrichment_key):
+        return enrich_data(_df_filtered)
+
+    enrichment_key = (
+        st.session_state.main_df_version,
+        st.session_state.sr_df_version,
+        st.session_state.incident_df_version,
+        tuple(st.session_state.selected_users),
+        tuple(date_range) if 'date_range' in locals() and isinstance(date_range, tuple) else None,
+        datetime.now().date(), # Age (Days) and Created Today depend on the current date
+    )
+    df_enriched = get_enriched_data(df_filtered, enrichment_key)
     
     # Store the enriched dataframe for use across tabs
     st.session_state.filtered_df = df_enriched
@@ -895,50 +1420,77 @@ else:
         col1, col2,col3 = st.columns(3)
         
         with col1:
+            triage_options = ["All"] + df_enriched["Triage Status"].dropna().unique().tolist()
+            seed_filter_widget('triage_status', triage_options)
             status_filter = st.selectbox(
                 "Filter by Triage Status",
-                ["All"] + df_enriched["Triage Status"].dropna().unique().tolist()
+                triage_options,
+                key=ANALYSIS_FILTER_WIDGET_KEYS['triage_status']
             )
         
         with col2:
+            type_options = ["All", "SR", "Incident"]
+            seed_filter_widget('type', type_options)
             type_filter = st.selectbox(
                 "Filter by Type",
-                ["All", "SR", "Incident"]
+                type_options,
+                key=ANALYSIS_FILTER_WIDGET_KEYS['type']
             )
         
         with col3:
             # Unified Status filter
             if 'Status' in df_enriched.columns:
                 status_options = ["All"] + df_enriched['Status'].dropna().unique().tolist() + ["None"]
-                unified_status_filter = st.selectbox("Filter by Status", status_options)
+                seed_filter_widget('status', status_options)
+                unified_status_filter = st.selectbox(
+                    "Filter by Status",
+                    status_options,
+                    key=ANALYSIS_FILTER_WIDGET_KEYS['status']
+                )
             else:
                 unified_status_filter = "All"
+
+        note_search_query = st.text_input(
+            "Search notes (all words must match)",
+            key="analysis_note_search_query",
+            placeholder="e.g. ORA-12154 or رقم مرجعي"
+        )
         
-        # Apply filters
-        df_display = df_enriched.copy()
-        
-        if status_filter != "All":
-            df_display = df_display[df_display["Triage Status"] == status_filter]
-        
-        if type_filter != "All":
-            df_display = df_display[df_display["Type"] == type_filter]
-        
-        if unified_status_filter != "All":
-            if unified_status_filter == "None":
-                df_display = df_display[df_display["Status"].isna()]
-            else:
-                df_display = df_display[df_display["Status"] == unified_status_filter]
+        st.session_state.analysis_filter_state = {
+            'triage_status': status_filter,
+            'type': type_filter,
+            'status': unified_status_filter,
+        }
+
+        # Apply filters: df_enriched already has the sidebar user and date filters (they are part of
+        # enrichment_key). Triage Status, Type and Status only exist once that subset is enriched, so the
+        # Analysis filters (a preset's included) compile to a mask here, memoised as row positions
+        analysis_filter_spec = dict(st.session_state.analysis_filter_state)
+        analysis_filter_positions = st.session_state.filter_result_memo.get_or_compute(
+            ('analysis_display', enrichment_key, json.dumps(analysis_filter_spec, sort_keys=True, default=str)),
+            lambda: np.flatnonzero(compile_filter_mask(df_enriched, analysis_filter_spec))
+        )
+        df_display = df_enriched.iloc[analysis_filter_positions]
+
+        # Full-text note search: the inverted index covers the whole dataset, its matches are one more filter step
+        if note_search_query.strip() and 'Last Note' in st.session_state.main_df.columns:
+            search_started_at = time.perf_counter()
+            note_index, indexed_case_ids = get_note_search_index(st.session_state.main_df, st.session_state.main_df_version)
+            matched_case_ids = indexed_case_ids[search_note_index(note_index, note_search_query)]
+            df_display = df_display[df_display['Case Id'].isin(matched_case_ids)]
+            st.caption(f"🔎 {len(matched_case_ids):,} cases in the dataset match the note search ({(time.perf_counter() - search_started_at) * 1000:.0f} ms); {len(df_display):,} pass the other filters.")
         
         # Statistics and summary
         st.subheader("📊 Summary Analysis")
         
+        # All four summary tables come from one grouped pass, cached per filtered view
+        analysis_summaries = get_analysis_summaries(df_enriched, enrichment_key)
+
         summary_col1, summary_col2 = st.columns(2)
         
         with summary_col1:
             st.markdown("**🔸 Triage Status Count**")
-            triage_summary = df_enriched['Triage Status'].value_counts().rename_axis('Triage Status').reset_index(name='Count')
-            triage_total = {'Triage Status': 'Total', 'Count': triage_summary['Count'].sum()}
-            triage_df = pd.concat([triage_summary, pd.DataFrame([triage_total])], ignore_index=True)
+            triage_df = analysis_summaries['triage']
             
             st.dataframe(
                 triage_df.style.apply(
@@ -948,9 +1500,7 @@ else:
             )
         with summary_col2:
             st.markdown("**🔹 SR vs Incident Count**")
-            type_summary = df_enriched['Type'].value_counts().rename_axis('Type').reset_index(name='Count')
-            type_total = {'Type': 'Total', 'Count': type_summary['Count'].sum()}
-            type_df = pd.concat([type_summary, pd.DataFrame([type_total])], ignore_index=True)
+            type_df = analysis_summaries['type']
             
             st.dataframe(
                 type_df.style.apply(
@@ -961,67 +1511,10 @@ else:
         summary_col3, summary_col4 = st.columns(2)
         with summary_col3:
             st.markdown("**🟢 SR Status Summary**")
-            if 'Status' in df_enriched.columns and 'Type' in df_enriched.columns and not df_enriched[df_enriched['Type'] == 'SR'].empty:
-                # Filter only for SRs
-                df_srs = df_enriched[df_enriched['Type'] == 'SR'].copy()
-                df_srs_status_valid = df_srs.dropna(subset=['Status'])
-                
-                if not df_srs_status_valid.empty:
-                    # All SR status count
-                    status_all_counts = df_srs_status_valid['Status'].value_counts().rename_axis('Status').reset_index(name='Cases Count')
-                    
-                    # Unique SR tickets
-                    ticket_unique = df_srs_status_valid.dropna(subset=['Ticket Number'])[['Ticket Number', 'Status']].drop_duplicates()
-                    ticket_unique_counts = ticket_unique['Status'].value_counts().rename_axis('Status').reset_index(name='SR Count')
-                    
-                    # Merge both summaries
-                    merged_status = pd.merge(status_all_counts, ticket_unique_counts, on='Status', how='outer').fillna(0)
-                    merged_status[['Cases Count', 'SR Count']] = merged_status[['Cases Count', 'SR Count']].astype(int)
-                    
-                    # New logic for breakdown
-                    new_rows = []
-                    for _, row in merged_status.iterrows():
-                        new_rows.append(row)
-                        # Use case-insensitive and whitespace-agnostic comparison
-                        if str(row['Status']).strip().lower() == 'waiting for approval':
-                            # Get the breakdown for this status
-                            srs_waiting = df_srs_status_valid[df_srs_status_valid['Status'].apply(lambda x: str(x).strip().lower() == 'waiting for approval')]
-
-                            if not srs_waiting.empty and 'Pending With' in srs_waiting.columns:
-                                # Breakdown for cases
-                                case_breakdown = srs_waiting['Pending With'].value_counts().reset_index()
-                                case_breakdown.columns = ['Pending With', 'Cases Count']
-
-                                # Breakdown for unique SRs
-                                sr_breakdown = srs_waiting.drop_duplicates(subset=['Ticket Number'])['Pending With'].value_counts().reset_index()
-                                sr_breakdown.columns = ['Pending With', 'SR Count']
-
-                                # Merge breakdowns
-                                final_breakdown = pd.merge(case_breakdown, sr_breakdown, on='Pending With', how='outer').fillna(0)
-
-                                for _, breakdown_row in final_breakdown.iterrows():
-                                    if pd.notna(breakdown_row['Pending With']):
-                                        new_row = {
-                                            'Status': f"    \u21b3 {breakdown_row['Pending With']}", # Indent with spaces and an arrow
-                                            'Cases Count': int(breakdown_row['Cases Count']),
-                                            'SR Count': int(breakdown_row['SR Count'])
-                                        }
-                                        new_rows.append(pd.Series(new_row))
-
-                    # Create the new summary dataframe
-                    if new_rows:
-                        status_summary_df_with_breakdown = pd.DataFrame(new_rows)
-                    else:
-                        status_summary_df_with_breakdown = merged_status.copy()
-
-                    # Total row
-                    total_row = {
-                        'Status': 'Total',
-                        'Cases Count': merged_status['Cases Count'].sum(),
-                        'SR Count': merged_status['SR Count'].sum()
-                    }
-                    
-                    status_summary_df = pd.concat([status_summary_df_with_breakdown, pd.DataFrame([total_row])], ignore_index=True)
+            if 'Status' in df_enriched.columns and 'Type' in df_enriched.columns and (df_enriched['Type'] == 'SR').any():
+                if not analysis_summaries['sr_status'].empty:
+                    # Status rows with the 'Waiting for approval' approver breakdown, as one grouped table
+                    status_summary_df = get_sr_status_breakdown(df_enriched, enrichment_key, analysis_summaries['sr_status'])
                     
                     # Display with original styling
                     st.dataframe(
@@ -1038,30 +1531,10 @@ else:
         #Incident Status Summary
         with summary_col4: # Or create new columns if layout needs adjustment
             st.markdown("**🟣 Incident Status Summary**")
-            if 'Status' in df_enriched.columns and 'Type' in df_enriched.columns and not df_enriched[df_enriched['Type'] == 'Incident'].empty:
-                df_incidents = df_enriched[df_enriched['Type'] == 'Incident'].copy()
-                df_incidents_status_valid = df_incidents.dropna(subset=['Status'])
+            if 'Status' in df_enriched.columns and 'Type' in df_enriched.columns and (df_enriched['Type'] == 'Incident').any():
+                incident_status_summary_df = analysis_summaries['incident_status']
 
-                if not df_incidents_status_valid.empty:
-                    # All incident status count
-                    incident_status_all_counts = df_incidents_status_valid['Status'].value_counts().rename_axis('Status').reset_index(name='Cases Count')
-                    
-                    # Unique incident tickets
-                    incident_ticket_unique = df_incidents_status_valid.dropna(subset=['Ticket Number'])[['Ticket Number', 'Status']].drop_duplicates()
-                    incident_ticket_unique_counts = incident_ticket_unique['Status'].value_counts().rename_axis('Status').reset_index(name='Incident Count')
-                    
-                    # Merge both summaries for incidents
-                    merged_incident_status = pd.merge(incident_status_all_counts, incident_ticket_unique_counts, on='Status', how='outer').fillna(0)
-                    merged_incident_status[['Cases Count', 'Incident Count']] = merged_incident_status[['Cases Count', 'Incident Count']].astype(int)
-                    
-                    # Total row for incidents
-                    incident_total_row = {
-                        'Status': 'Total',
-                        'Cases Count': merged_incident_status['Cases Count'].sum(),
-                        'Incident Count': merged_incident_status['Incident Count'].sum()
-                    }
-                    
-                    incident_status_summary_df = pd.concat([merged_incident_status, pd.DataFrame([incident_total_row])], ignore_index=True)
+                if not incident_status_summary_df.empty:
                     
                     # Display Incident Status Summary
                     st.dataframe(
@@ -1077,180 +1550,305 @@ else:
             else:
                 st.info("No incident data available to summarize.")
         
-        # Detailed Results
-        st.subheader("📋 Filtered Results")
+        @st.fragment
+        def render_filtered_results(df_display):
+            section_started_at = time.perf_counter()
+            # Detailed Results
+            st.subheader("📋 Filtered Results")
         
-        # Results count and download button
-        results_col1, results_col2 = st.columns([3, 1])
+            # Results count and download button
+            results_col1, results_col2 = st.columns([3, 1])
         
-        with results_col1:
-            st.markdown(f"**Total Filtered Records:** {df_display.shape[0]}")
+            with results_col1:
+                st.markdown(f"**Total Filtered Records:** {df_display.shape[0]}")
         
-        with results_col2:
-            if not df_display.empty:
-                excel_data = generate_excel_download(df_display)
-                st.download_button(
-                    label="📥 Download Results",
-                    data=excel_data,
-                    file_name=f"sr_incident_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
+            with results_col2:
+                if not df_display.empty:
+                    excel_data = generate_excel_download(df_display)
+                    st.download_button(
+                        label="📥 Download Results",
+                        data=excel_data,
+                        file_name=f"sr_incident_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                    )
         
-        # Display data table with customizable columns
-        if not df_display.empty:
-            all_columns = df_display.columns.tolist()
-            SELECT_ALL_COLS_ANALYSIS_OPTION = "[Select All Columns]"
+            # Display data table with customizable columns
+            if not df_display.empty:
+                all_columns = df_display.columns.tolist()
+                SELECT_ALL_COLS_ANALYSIS_OPTION = "[Select All Columns]"
+
+                # Define default columns (original logic)
+                default_selected_cols_initial = ['Last Note', 'Case Id', 'Current User Id', 'Case Start Date', 'Triage Status', 'Type', 'Ticket Number']
+                if 'Status' in df_display.columns:
+                    default_selected_cols_initial.extend(['Status', 'Last Update'])
+                if 'Breach Passed' in df_display.columns:
+                    default_selected_cols_initial.append('Breach Passed')
+
+                # Ensure default columns are valid and exist in df_display
+                default_selected_cols = [col for col in default_selected_cols_initial if col in all_columns]
 
-            # Define default columns (original logic)
-            default_selected_cols_initial = ['Last Note', 'Case Id', 'Current User Id', 'Case Start Date', 'Triage Status', 'Type', 'Ticket Number']
-            if 'Status' in df_display.columns:
-                default_selected_cols_initial.extend(['Status', 'Last Update'])
-            if 'Breach Passed' in df_display.columns:
-                default_selected_cols_initial.append('Breach Passed')
+                if 'analysis_tab_column_widget_selection_controlled' not in st.session_state:
+                    st.session_state.selected_display_cols = list(default_selected_cols) # Actual columns to display
 
-            # Ensure default columns are valid and exist in df_display
-            default_selected_cols = [col for col in default_selected_cols_initial if col in all_columns]
+                    if not default_selected_cols and all_columns: # If default_selected_cols is empty and there are columns, select all
+                        st.session_state.selected_display_cols = list(all_columns)
+                        st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
+                    elif all_columns and set(default_selected_cols) == set(all_columns): # If default_selected_cols happens to be all columns
+                        st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
+                    elif not all_columns: # If there are no columns at all
+                        st.session_state.selected_display_cols = []
+                        st.session_state.analysis_tab_column_widget_selection_controlled = []
+                    else: # Default columns are a subset
+                        st.session_state.analysis_tab_column_widget_selection_controlled = list(default_selected_cols)
+
+                options_for_cols_widget = [SELECT_ALL_COLS_ANALYSIS_OPTION] + all_columns
+                raw_cols_widget_selection = st.multiselect(
+                    "Select columns to display:",
+                    options=options_for_cols_widget,
+                    default=st.session_state.analysis_tab_column_widget_selection_controlled,
+                    key="multi_select_analysis_columns"
+                )
+
+                prev_widget_display_state = list(st.session_state.analysis_tab_column_widget_selection_controlled)
+                current_select_all_option_selected = SELECT_ALL_COLS_ANALYSIS_OPTION in raw_cols_widget_selection
+                currently_selected_actual_items = [c for c in raw_cols_widget_selection if c != SELECT_ALL_COLS_ANALYSIS_OPTION]
 
-            if 'analysis_tab_column_widget_selection_controlled' not in st.session_state:
-                st.session_state.selected_display_cols = list(default_selected_cols) # Actual columns to display
+                user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_COLS_ANALYSIS_OPTION not in prev_widget_display_state)
+                user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_COLS_ANALYSIS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
 
-                if not default_selected_cols and all_columns: # If default_selected_cols is empty and there are columns, select all
+                if user_clicked_select_all:
                     st.session_state.selected_display_cols = list(all_columns)
                     st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
-                elif all_columns and set(default_selected_cols) == set(all_columns): # If default_selected_cols happens to be all columns
-                    st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
-                elif not all_columns: # If there are no columns at all
+                elif user_clicked_unselect_all:
                     st.session_state.selected_display_cols = []
                     st.session_state.analysis_tab_column_widget_selection_controlled = []
-                else: # Default columns are a subset
-                    st.session_state.analysis_tab_column_widget_selection_controlled = list(default_selected_cols)
-
-            options_for_cols_widget = [SELECT_ALL_COLS_ANALYSIS_OPTION] + all_columns
-            raw_cols_widget_selection = st.multiselect(
-                "Select columns to display:",
-                options=options_for_cols_widget,
-                default=st.session_state.analysis_tab_column_widget_selection_controlled,
-                key="multi_select_analysis_columns"
-            )
+                else:
+                    if current_select_all_option_selected:
+                        if len(currently_selected_actual_items) < len(all_columns):
+                            st.session_state.selected_display_cols = list(currently_selected_actual_items)
+                            st.session_state.analysis_tab_column_widget_selection_controlled = list(currently_selected_actual_items)
+                        else:
+                            st.session_state.selected_display_cols = list(all_columns)
+                            st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
+                    else:
+                        st.session_state.selected_display_cols = list(currently_selected_actual_items)
+                        if all_columns and set(currently_selected_actual_items) == set(all_columns):
+                            st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
+                        else:
+                            st.session_state.analysis_tab_column_widget_selection_controlled = list(currently_selected_actual_items)
 
-            prev_widget_display_state = list(st.session_state.analysis_tab_column_widget_selection_controlled)
-            current_select_all_option_selected = SELECT_ALL_COLS_ANALYSIS_OPTION in raw_cols_widget_selection
-            currently_selected_actual_items = [c for c in raw_cols_widget_selection if c != SELECT_ALL_COLS_ANALYSIS_OPTION]
+                columns_to_show = st.session_state.get('selected_display_cols', []) # Default to empty list if not set
+                if not columns_to_show and all_columns:
+                     columns_to_show = all_columns
 
-            user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_COLS_ANALYSIS_OPTION not in prev_widget_display_state)
-            user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_COLS_ANALYSIS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
+                if columns_to_show: # Ensure there are columns to show
+                    render_paged_table(df_display, columns_to_show, "filtered_results_table", enrichment_key)
+                else: # This case should ideally be covered by the logic above, but as a fallback
+                    st.info("Please select at least one column to display, or all columns will be shown if the selection is empty and columns are available.")
 
-            if user_clicked_select_all:
-                st.session_state.selected_display_cols = list(all_columns)
-                st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
-            elif user_clicked_unselect_all:
-                st.session_state.selected_display_cols = []
-                st.session_state.analysis_tab_column_widget_selection_controlled = []
+            elif df_display.empty: # This elif should be at the same level as the first if not df_display.empty
+                st.info("No data to display based on current filters.")
+            # If df_display is not empty but columns_to_show ended up empty (e.g. if all_columns was also empty initially)
+            # This case is unlikely if df_display was not empty, but good to be robust.
             else:
-                if current_select_all_option_selected:
-                    if len(currently_selected_actual_items) < len(all_columns):
-                        st.session_state.selected_display_cols = list(currently_selected_actual_items)
-                        st.session_state.analysis_tab_column_widget_selection_controlled = list(currently_selected_actual_items)
-                    else:
-                        st.session_state.selected_display_cols = list(all_columns)
-                        st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
+                st.info("No columns available to display.")
+            report_section_latency("Filtered Results", section_started_at)
+
+        render_filtered_results(df_display)
+
+        @st.fragment
+        def render_linked_cases_summary(df_display):
+            section_started_at = time.perf_counter()
+            # Incidents/SRs Linked Cases Summary
+            st.subheader("🔗 Incidents/SRs Linked Cases Summary")
+            min_linked_cases = st.number_input("Minimum Linked Cases", min_value=1, value=2, step=1)
+
+            if 'Case Count' in df_display.columns and 'Ticket Number' in df_display.columns:
+                # Threshold query: a prefix of the tickets ranked by case count, narrowed to the displayed cases
+                ticket_adjacency = get_ticket_case_adjacency(df_enriched, enrichment_key)
+                linked_summary_df = get_linked_tickets(ticket_adjacency, min_linked_cases, df_display)
+
+                # Row selections are positions, so drop the selection once the listed tickets can change
+                linked_selection_scope = (min_linked_cases, enrichment_key, json.dumps(analysis_filter_spec, sort_keys=True, default=str), note_search_query.strip())
+                if st.session_state.get('linked_cases_selection_scope') != linked_selection_scope:
+                    st.session_state.pop('linked_cases_table_selection', None)
+                    st.session_state.linked_cases_selection_scope = linked_selection_scope
+
+                if not linked_summary_df.empty:
+                    st.caption("Select a ticket to list its linked cases.")
+                    linked_table_event = render_table(
+                        linked_summary_df, "linked_cases_table", hide_index=True,
+                        on_select="rerun", selection_mode="single-row", key="linked_cases_table_selection"
+                    )
+                    selected_rows = linked_table_event.selection.rows if linked_table_event is not None else []
+                    if selected_rows and selected_rows[0] < len(linked_summary_df):
+                        selected_ticket = linked_summary_df.iloc[selected_rows[0]]
+                        linked_case_positions = get_ticket_case_positions(ticket_adjacency, linked_summary_df.index[selected_rows[0]])
+                        linked_case_columns = [c for c in ['Case Id', 'Current User Id', 'Case Start Date', 'Age (Days)', 'Triage Status', 'Last Note Date'] if c in df_enriched.columns]
+                        st.markdown(f"**Cases linked to {selected_ticket['Type']} {selected_ticket['Ticket Number']}**")
+                        render_table(df_enriched.iloc[linked_case_positions][linked_case_columns], "linked_cases_detail_table", hide_index=True)
                 else:
-                    st.session_state.selected_display_cols = list(currently_selected_actual_items)
-                    if all_columns and set(currently_selected_actual_items) == set(all_columns):
-                        st.session_state.analysis_tab_column_widget_selection_controlled = [SELECT_ALL_COLS_ANALYSIS_OPTION]
-                    else:
-                        st.session_state.analysis_tab_column_widget_selection_controlled = list(currently_selected_actual_items)
+                    st.info(f"No Incidents/SRs found with at least {min_linked_cases} linked cases based on current filters.")
+            else:
+                st.warning("Required columns ('Case Count', 'Ticket Number') not available for linked cases summary.")
+            report_section_latency("Linked Cases Summary", section_started_at)
 
-            columns_to_show = st.session_state.get('selected_display_cols', []) # Default to empty list if not set
-            if not columns_to_show and all_columns:
-                 columns_to_show = all_columns
+        render_linked_cases_summary(df_display)
 
-            if columns_to_show: # Ensure there are columns to show
-                st.dataframe(df_display[columns_to_show], hide_index=True)
-            else: # This case should ideally be covered by the logic above, but as a fallback
-                st.info("Please select at least one column to display, or all columns will be shown if the selection is empty and columns are available.")
+        render_ticket_orphans()
 
-        elif df_display.empty: # This elif should be at the same level as the first if not df_display.empty
-            st.info("No data to display based on current filters.")
-        # If df_display is not empty but columns_to_show ended up empty (e.g. if all_columns was also empty initially)
-        # This case is unlikely if df_display was not empty, but good to be robust.
-        else:
-            st.info("No columns available to display.")
+        @st.fragment
+        def render_work_queue():
+            section_started_at = time.perf_counter()
+            # Top K oldest / stalest cases per user, sliced from the per-user orderings
+            st.subheader("🗂️ Work Queue")
+            if not {'Current User Id', 'Age (Days)', 'Last Note Date'}.issubset(df_enriched.columns):
+                st.warning("Required columns ('Current User Id', 'Age (Days)', 'Last Note Date') not available for the work queue.")
+            else:
+                queue_index = get_user_work_queue_index(df_enriched, enrichment_key)
+                queue_col1, queue_col2, queue_col3 = st.columns([2, 2, 1])
+                with queue_col1:
+                    queue_users = st.multiselect("Users", list(queue_index['users']), key="work_queue_users", placeholder="All users")
+                with queue_col2:
+                    queue_order = st.radio("Rank by", WORK_QUEUE_ORDERS, horizontal=True, key="work_queue_order")
+                with queue_col3:
+                    queue_k = st.number_input("Cases per user", min_value=1, max_value=100, value=5, step=1, key="work_queue_k")
+
+                queue_positions = query_user_work_queue(queue_index, queue_users, int(queue_k), queue_order)
+                if len(queue_positions):
+                    queue_cols = [c for c in ['Current User Id', 'Case Id', 'Age (Days)', 'Last Note Date', 'Triage Status', 'Ticket Number', 'Type', 'Status'] if c in df_enriched.columns]
+                    queue_df = df_enriched.iloc[queue_positions][queue_cols].reset_index(drop=True)
+                    queue_df.insert(queue_cols.index('Last Note Date') + 1, 'Days Since Last Note', queue_index['days_since_last_note'][queue_positions])
+                    queue_df.insert(1, 'Rank', queue_df.groupby('Current User Id').cumcount() + 1)
+                    render_table(queue_df, "work_queue_table", hide_index=True)
+                else:
+                    st.info("No cases in the work queue for the selected users.")
+            report_section_latency("Work Queue", section_started_at)
+
+        render_work_queue()
+
+        @st.fragment
+        def render_age_distribution():
+            section_started_at = time.perf_counter()
+            # Ageing buckets: 'Age (Days)' bucketed once per filtered view, split by user and by type
+            st.subheader("⏳ Case Age Distribution")
+            if 'Age (Days)' not in df_enriched.columns:
+                st.warning("Required column ('Age (Days)') not available for the age distribution.")
+            else:
+                default_edges_text = ", ".join(str(edge) for edge in AGE_BUCKET_EDGES)
+                edges_text = st.text_input(
+                    "Bucket edges (days)", value=default_edges_text, key="age_bucket_edges",
+                    help="First day of every bucket after the first, e.g. '3, 8, 15, 31' gives 0-2, 3-7, 8-14, 15-30 and 31+."
+                )
+                try:
+                    age_edges = tuple(int(edge) for edge in edges_text.split(",") if edge.strip())
+                except ValueError:
+                    age_edges = ()
+                if not age_edges or age_edges[0] <= 0 or any(lo >= hi for lo, hi in zip(age_edges[:-1], age_edges[1:])):
+                    st.warning(f"Bucket edges must be increasing positive whole numbers; using {default_edges_text}.")
+                    age_edges = tuple(AGE_BUCKET_EDGES)
+
+                age_col1, age_col2 = st.columns(2)
+                for age_col, group_column, missing_label, title in [
+                    (age_col1, 'Current User Id', None, "Case Age by User"),
+                    (age_col2, 'Type', 'No Ticket', "Case Age by Type"),
+                ]:
+                    with age_col:
+                        if group_column not in df_enriched.columns:
+                            continue
+                        age_counts = get_age_bucket_counts(df_enriched, enrichment_key, group_column, age_edges, missing_label)
+                        if age_counts.empty:
+                            st.info("No case ages to display.")
+                            continue
+                        # Wide form: one stacked bar segment per group column
+                        fig_age = px.bar(
+                            age_counts,
+                            title=title,
+                            labels={'value': 'Cases', 'Age Bucket': 'Age (Days)', group_column: group_column}
+                        )
+                        fig_age.update_layout(barmode='stack')
+                        st.plotly_chart(fig_age, use_container_width=True, key=f"age_distribution_{group_column}")
+            report_section_latency("Case Age Distribution", section_started_at)
 
-        # Incidents/SRs Linked Cases Summary
-        st.subheader("🔗 Incidents/SRs Linked Cases Summary")
-        min_linked_cases = st.number_input("Minimum Linked Cases", min_value=1, value=2, step=1)
+        render_age_distribution()
 
-        if 'Case Count' in df_display.columns and 'Ticket Number' in df_display.columns:
-            linked_cases_df = df_display[
-                (df_display['Case Count'] >= min_linked_cases) &
-                (df_display['Ticket Number'].notna())
-            ]
+        CASE_SEARCH_LIMIT = 200
 
-            if not linked_cases_df.empty:
-                linked_summary_df = linked_cases_df[['Ticket Number', 'Type','Status', 'Case Count']].drop_duplicates().sort_values(by='Case Count', ascending=False)
-                st.dataframe(linked_summary_df, hide_index=True)
-            else:
-                st.info(f"No Incidents/SRs found with at least {min_linked_cases} linked cases based on current filters.")
-        else:
-            st.warning("Required columns ('Case Count', 'Ticket Number') not available for linked cases summary.")
+        # Sorted Case Id index for the Note Details viewer, cached per displayed table
+        @st.cache_data(show_spinner=False, max_entries=8)
+        def get_case_id_index(_df_display, table_token):
+            return build_case_id_index(_df_display['Case Id'])
 
-        # Note viewer
-        st.subheader("📝 Note Details")
+        @st.fragment
+        def render_note_viewer(df_display):
+            section_started_at = time.perf_counter()
+            # Note viewer
+            st.subheader("📝 Note Details")
         
-        selected_case = st.selectbox(
-            "Select a case to view notes:",
-            df_display['Case Id'].tolist()
-        )
-        
-        if selected_case:
-            case_row = df_display[df_display['Case Id'] == selected_case].iloc[0]
+            # Type-ahead: the prefix narrows the options through the sorted Case Id index
+            case_index = get_case_id_index(df_display, (enrichment_key, compute_index_fingerprint(df_display)))
+            case_query = st.text_input("Search Case Id", key="note_viewer_case_query", placeholder="Type the start of a Case Id")
+            matching_case_ids, total_case_matches = search_case_id_prefix(case_index, case_query, limit=CASE_SEARCH_LIMIT)
+            if total_case_matches > len(matching_case_ids):
+                st.caption(f"Showing the first {len(matching_case_ids):,} of {total_case_matches:,} matching cases. Keep typing to narrow the list.")
+
+            selected_case = st.selectbox(
+                "Select a case to view notes:",
+                matching_case_ids
+            )
+            selected_case_position = lookup_case_position(case_index, selected_case) if selected_case is not None else None
+
+            if selected_case_position is not None:
+                case_row = df_display.iloc[selected_case_position]
             
-            # Display case details in a table
-            case_details = {
-                "Field": ["Case ID", "Owner", "Start Date", "Age", "Ticket Number", "Type"],
-                "Value": [
-                    str(case_row['Case Id']),
-                    str(case_row['Current User Id']),
-                    str(case_row['Case Start Date'].strftime('%Y-%m-%d')),
-                    f"{case_row['Age (Days)']} days",
-                    str(int(case_row['Ticket Number'])) if not pd.isna(case_row['Ticket Number']) else 'N/A',
-                    str(case_row['Type']) if not pd.isna(case_row['Type']) else 'N/A'
-                ]
-            }
+                # Display case details in a table
+                case_details = {
+                    "Field": ["Case ID", "Owner", "Start Date", "Age", "Ticket Number", "Type"],
+                    "Value": [
+                        str(case_row['Case Id']),
+                        str(case_row['Current User Id']),
+                        case_row['Case Start Date'].strftime('%Y-%m-%d') if not pd.isna(case_row['Case Start Date']) else 'N/A',
+                        f"{case_row['Age (Days)']} days",
+                        str(int(case_row['Ticket Number'])) if not pd.isna(case_row['Ticket Number']) else 'N/A',
+                        str(case_row['Type']) if not pd.isna(case_row['Type']) else 'N/A'
+                    ]
+                }
 
-            # Add Status if available
-            if 'Status' in case_row and not pd.isna(case_row['Status']):
-                case_details["Field"].append("Status")
-                case_details["Value"].append(str(case_row['Status']))
+                # Add Status if available
+                if 'Status' in case_row and not pd.isna(case_row['Status']):
+                    case_details["Field"].append("Status")
+                    case_details["Value"].append(str(case_row['Status']))
 
-                if 'Last Update' in case_row and not pd.isna(case_row['Last Update']):
-                    case_details["Field"].append("Last Update")
-                    case_details["Value"].append(str(case_row['Last Update']))
+                    if 'Last Update' in case_row and not pd.isna(case_row['Last Update']):
+                        case_details["Field"].append("Last Update")
+                        case_details["Value"].append(str(case_row['Last Update']))
 
-                if 'Breach Passed' in case_row:
-                    case_details["Field"].append("SLA Breach")
-                    case_details["Value"].append("Yes ⚠️" if case_row['Breach Passed'] else "No")
-            
-            # Display as a table
-            st.table(pd.DataFrame(case_details))
+                    if 'Breach Passed' in case_row:
+                        case_details["Field"].append("SLA Breach")
+                        case_details["Value"].append("Yes ⚠️" if case_row['Breach Passed'] else "No")
             
-            # Display the full note
-            st.markdown("### Last Note")
-            if 'Last Note' in case_row and not pd.isna(case_row['Last Note']):
-                st.text_area("Note Content", case_row['Last Note'], height=200)
-            else:
-                st.info("No notes available for this case")
+                # Display as a table
+                st.table(pd.DataFrame(case_details))
             
-            # Download button for case details
-            excel_data = generate_excel_download(df_display[df_display['Case Id'] == selected_case])
-            st.download_button(
-                label="📥 Download Case Details",
-                data=excel_data,
-                file_name=f"case_{selected_case}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+                # Display the full note
+                st.markdown("### Last Note")
+                if 'Last Note' in case_row and not pd.isna(case_row['Last Note']):
+                    st.text_area("Note Content", case_row['Last Note'], height=200)
+                else:
+                    st.info("No notes available for this case")
             
+                # Download button for case details
+                excel_data = generate_excel_download(df_display.iloc[[selected_case_position]])
+                st.download_button(
+                    label="📥 Download Case Details",
+                    data=excel_data,
+                    file_name=f"case_{selected_case}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+            report_section_latency("Note Details", section_started_at)
+
+        render_note_viewer(df_display)
+
     #
     # SLA BREACH TAB
     #
@@ -1300,64 +1898,70 @@ else:
                         st.markdown('<p class="metric-label">SR Breaches</p>', unsafe_allow_html=True)
                     st.markdown('</div>', unsafe_allow_html=True)
                 
-                # Breach details by type and status
-                if not breach_df.empty:
-                    st.subheader("📋 SLA Breach Details")
-                    
-                    # Filter options for breach analysis
-                    breach_col1, breach_col2 = st.columns(2)
+                @st.fragment
+                def render_sla_breach_details(breach_df):
+                    section_started_at = time.perf_counter()
+                    # Breach details by type and status
+                    if not breach_df.empty:
+                        st.subheader("📋 SLA Breach Details")
                     
-                    with breach_col1:
-                        breach_type_filter = st.selectbox(
-                            "Filter by Type (Breach)",
-                            ["All", "SR", "Incident"],
-                            key="breach_type"
-                        )
+                        # Filter options for breach analysis
+                        breach_col1, breach_col2 = st.columns(2)
                     
-                    with breach_col2:
-                        if 'Status' in breach_df.columns:
-                            breach_status_options = ["All"] + breach_df['Status'].dropna().unique().tolist()
-                            breach_status_filter = st.selectbox(
-                                "Filter by Status (Breach)",
-                                breach_status_options,
-                                key="breach_status"
+                        with breach_col1:
+                            breach_type_filter = st.selectbox(
+                                "Filter by Type (Breach)",
+                                ["All", "SR", "Incident"],
+                                key="breach_type"
                             )
-                        else:
-                            breach_status_filter = "All"
                     
-                    # Apply breach filters
-                    breach_display = breach_df.copy()
+                        with breach_col2:
+                            if 'Status' in breach_df.columns:
+                                breach_status_options = ["All"] + breach_df['Status'].dropna().unique().tolist()
+                                breach_status_filter = st.selectbox(
+                                    "Filter by Status (Breach)",
+                                    breach_status_options,
+                                    key="breach_status"
+                                )
+                            else:
+                                breach_status_filter = "All"
+                    
+                        # Apply breach filters
+                        breach_display = breach_df.copy()
                     
-                    if breach_type_filter != "All":
-                        breach_display = breach_display[breach_display["Type"] == breach_type_filter]
+                        if breach_type_filter != "All":
+                            breach_display = breach_display[breach_display["Type"] == breach_type_filter]
                     
-                    if breach_status_filter != "All":
-                        breach_display = breach_display[breach_display["Status"] == breach_status_filter]
+                        if breach_status_filter != "All":
+                            breach_display = breach_display[breach_display["Status"] == breach_status_filter]
                     
-                    # Display breach results
-                    st.markdown(f"**Total Breached Records:** {breach_display.shape[0]}")
+                        # Display breach results
+                        st.markdown(f"**Total Breached Records:** {breach_display.shape[0]}")
                     
-                    # Download button for breach data
-                    if not breach_display.empty:
-                        excel_breach_data = generate_excel_download(breach_display)
-                        st.download_button(
-                            label="📥 Download Breach Analysis",
-                            data=excel_breach_data,
-                            file_name=f"sla_breach_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
+                        # Download button for breach data
+                        if not breach_display.empty:
+                            excel_breach_data = generate_excel_download(breach_display)
+                            st.download_button(
+                                label="📥 Download Breach Analysis",
+                                data=excel_breach_data,
+                                file_name=f"sla_breach_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                            )
                     
-                    # Breach data table
-                    breach_cols = ['Case Id', 'Current User Id', 'Case Start Date', 'Type', 'Ticket Number', 'Status', 'Last Update', 'Age (Days)']
-                    breach_display_cols = [col for col in breach_cols if col in breach_display.columns]
+                        # Breach data table
+                        breach_cols = ['Case Id', 'Current User Id', 'Case Start Date', 'Type', 'Ticket Number', 'Status', 'Last Update', 'Age (Days)']
+                        breach_display_cols = [col for col in breach_cols if col in breach_display.columns]
                     
-                    if not breach_display.empty:
-                        st.dataframe(breach_display[breach_display_cols], hide_index=True)
-                    else:
-                        st.info("No breached cases match the selected filters.")
+                        if not breach_display.empty:
+                            render_paged_table(breach_display, breach_display_cols, "sla_breach_table", enrichment_key)
+                        else:
+                            st.info("No breached cases match the selected filters.")
                         
-                else:
-                    st.info("No SLA breaches found in the current dataset.")
+                    else:
+                        st.info("No SLA breaches found in the current dataset.")
+                    report_section_latency("SLA Breach Details", section_started_at)
+
+                render_sla_breach_details(breach_df)
             else:
                 st.info("SLA breach information not available. Please ensure your SR/Incident status files contain 'Breach Passed' column.")
     
@@ -1367,18 +1971,19 @@ else:
     elif selected == "Today's SR/Incidents":
         st.title("📅 Today's New SR/Incidents")
         
-        # Get today's cases
-        today = datetime.now().date()
+        # Get the chosen day's cases (today by default) through the per-day slice index
+        today = st.date_input("Day", value=datetime.now().date(), max_value=datetime.now().date(), key="today_tab_day")
+        if today != datetime.now().date():
+            st.caption(f"Showing new SR/Incidents for {today.strftime('%d %b %Y')} instead of today.")
         
-        # Filter for cases with notes created today
-        if 'Created Today' in df_enriched.columns:
-            today_cases = df_enriched[df_enriched['Created Today'] == True].copy()
+        if 'Last Note Date' in df_enriched.columns:
+            last_note_day_index = get_last_note_day_index(df_enriched, enrichment_key)
+            today_cases = df_enriched.iloc[get_day_positions(last_note_day_index, today)]
         else:
-            # Fallback: filter by Last Note Date
-            today_cases = df_enriched[df_enriched['Last Note Date'].dt.date == today].copy() if 'Last Note Date' in df_enriched.columns else pd.DataFrame()
+            today_cases = pd.DataFrame(columns=['Triage Status'])
         
         # Further filter for SR/Incident cases only
-        today_sr_incidents = today_cases[today_cases['Triage Status'] == 'Pending SR/Incident'].copy()
+        today_sr_incidents = today_cases[today_cases['Triage Status'] == 'Pending SR/Incident']
         
         # Display summary
         st.subheader("📊 Today's Summary")
@@ -1418,27 +2023,8 @@ else:
         if not today_sr_incidents.empty:
             st.subheader("👥 Breakdown by User")
             
-            user_breakdown = today_sr_incidents.groupby('Current User Id').agg({
-                'Case Id': 'count',
-                'Type': lambda x: (x == 'SR').sum(),
-                'Ticket Number': lambda x: (today_sr_incidents.loc[x.index, 'Type'] == 'Incident').sum()
-            }).rename(columns={
-                'Case Id': 'Total',
-                'Type': 'SRs',
-                'Ticket Number': 'Incidents'
-            })
-            
-            user_breakdown = user_breakdown.reset_index()
-            
-            # Add total row
-            total_row = pd.DataFrame({
-                'Current User Id': ['TOTAL'],
-                'Total': [user_breakdown['Total'].sum()],
-                'SRs': [user_breakdown['SRs'].sum()],
-                'Incidents': [user_breakdown['Incidents'].sum()]
-            })
-            
-            user_breakdown_display = pd.concat([user_breakdown, total_row], ignore_index=True)
+            # Single user x type crosstab, with the TOTAL row
+            user_breakdown_display = calculate_user_type_breakdown(today_sr_incidents)
             
             st.dataframe(
                 user_breakdown_display.style.apply(
@@ -1501,7 +2087,7 @@ else:
             today_display_cols = [col for col in today_cols if col in today_display.columns]
             
             if not today_display.empty:
-                st.dataframe(today_display[today_display_cols], hide_index=True)
+                render_table(today_display[today_display_cols], "today_filtered_table", hide_index=True)
             else:
                 st.info("No records match the selected filters for today.")
                 
@@ -1516,7 +2102,7 @@ else:
                 all_today_cols = ['Case Id', 'Current User Id', 'Last Note Date', 'Triage Status']
                 all_today_display_cols = [col for col in all_today_cols if col in today_cases.columns]
                 
-                st.dataframe(today_cases[all_today_display_cols], hide_index=True)
+                render_table(today_cases[all_today_display_cols], "today_all_cases_table", hide_index=True)
                 
                 # Download button for all today's cases
                 excel_all_today_data = generate_excel_download(today_cases)
@@ -1529,6 +2115,45 @@ else:
             else:
                 st.info("No cases found with notes created today.")
 
+        @st.fragment
+        def render_triage_trend(df_enriched, end_day):
+            section_started_at = time.perf_counter()
+            # Multi-day trend of the same triaged-note counts, from one bincount
+            st.subheader("📈 New SR/Incidents Trend")
+            trend_days = st.radio("Window", [30, 90], format_func=lambda n: f"Last {n} days", horizontal=True, key="today_trend_days")
+            daily_counts = get_daily_triage_counts(df_enriched, enrichment_key, end_day, trend_days)
+
+            if daily_counts['counts'].sum() == 0:
+                st.info(f"No new SR/Incidents in the last {trend_days} days.")
+                report_section_latency("New SR/Incidents Trend", section_started_at)
+                return
+
+            day_labels = pd.to_datetime(daily_counts['days'])
+            trend_df = pd.DataFrame(daily_counts['counts'].sum(axis=1), index=day_labels, columns=daily_counts['types'])
+            trend_long = trend_df.rename_axis('Day').reset_index().melt(id_vars='Day', var_name='Type', value_name='Count')
+            fig_trend = px.line(trend_long, x='Day', y='Count', color='Type', markers=True, title=f"New SR/Incidents per Day (Last {trend_days} Days)")
+            st.plotly_chart(fig_trend, use_container_width=True, key="today_trend_chart")
+
+            trend_type = st.selectbox("Heatmap Type", ["All"] + daily_counts['types'], key="today_trend_type")
+            if trend_type == "All":
+                user_day_counts = daily_counts['counts'].sum(axis=2)
+            else:
+                user_day_counts = daily_counts['counts'][:, :, daily_counts['types'].index(trend_type)]
+            fig_heatmap = px.imshow(
+                user_day_counts.T,
+                x=day_labels,
+                y=daily_counts['users'],
+                labels=dict(x="Day", y="User", color="Count"),
+                color_continuous_scale="Blues",
+                aspect="auto",
+                title="New SR/Incidents per User and Day"
+            )
+            st.plotly_chart(fig_heatmap, use_container_width=True, key="today_trend_heatmap")
+            report_section_latency("New SR/Incidents Trend", section_started_at)
+
+        if 'Last Note Date' in df_enriched.columns:
+            render_triage_trend(df_enriched, today)
+
     elif selected == "Incident Overview":
         st.title("📋 Incident Overview")
 
@@ -1544,254 +2169,278 @@ else:
             overview_df = st.session_state.incident_overview_df.copy() # Work with a copy
 
             st.subheader("Filter Incidents")
-            # Create 4 columns for filters to include Status
-            col1, col2, col3, col4 = st.columns(4)
+            # Filters are batched in a form: selections only apply (in one compute) when submitted
+            with st.form("incident_overview_filter_form"):
+                # Create 4 columns for filters to include Status
+                col1, col2, col3, col4 = st.columns(4)
 
-            with col1:
-                # Ensure 'Creator' column exists before trying to access it
-                if 'Creator' in overview_df.columns:
-                    unique_creators = sorted(overview_df['Creator'].dropna().unique())
-                else:
-                    unique_creators = [] # Default to empty list if column is missing
-
-                SELECT_ALL_CREATORS_OPTION = SELECT_ALL_BASE_STRING % "Creators"
+                with col1:
+                    # Ensure 'Creator' column exists before trying to access it
+                    if 'Creator' in overview_df.columns:
+                        unique_creators = get_catalog_options('incident_overview', 'Creator')
+                    else:
+                        unique_creators = [] # Default to empty list if column is missing
 
-                if 'incident_creator_widget_selection_controlled' not in st.session_state:
-                    st.session_state.selected_creators = list(unique_creators) # Default to all selected for filtering
-                    if unique_creators: # If there are actual creators
-                        st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
-                    else: # No creators
-                        st.session_state.incident_creator_widget_selection_controlled = []
+                    SELECT_ALL_CREATORS_OPTION = SELECT_ALL_BASE_STRING % "Creators"
 
-                options_for_creator_widget = [SELECT_ALL_CREATORS_OPTION] + unique_creators
-                raw_creator_widget_selection = st.multiselect(
-                    "Filter by Creator",
-                    options=options_for_creator_widget,
-                    default=st.session_state.incident_creator_widget_selection_controlled,
-                    key="multi_select_incident_creator"
-                )
+                    if 'incident_creator_widget_selection_controlled' not in st.session_state:
+                        st.session_state.selected_creators = list(unique_creators) # Default to all selected for filtering
+                        if unique_creators: # If there are actual creators
+                            st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
+                        else: # No creators
+                            st.session_state.incident_creator_widget_selection_controlled = []
+
+                    options_for_creator_widget = [SELECT_ALL_CREATORS_OPTION] + unique_creators
+                    raw_creator_widget_selection = st.multiselect(
+                        "Filter by Creator",
+                        options=options_for_creator_widget,
+                        default=st.session_state.incident_creator_widget_selection_controlled,
+                        key="multi_select_incident_creator"
+                    )
 
-                prev_widget_display_state = list(st.session_state.incident_creator_widget_selection_controlled)
-                current_select_all_option_selected = SELECT_ALL_CREATORS_OPTION in raw_creator_widget_selection
-                currently_selected_actual_items = [c for c in raw_creator_widget_selection if c != SELECT_ALL_CREATORS_OPTION]
+                    prev_widget_display_state = list(st.session_state.incident_creator_widget_selection_controlled)
+                    current_select_all_option_selected = SELECT_ALL_CREATORS_OPTION in raw_creator_widget_selection
+                    currently_selected_actual_items = [c for c in raw_creator_widget_selection if c != SELECT_ALL_CREATORS_OPTION]
 
-                user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_CREATORS_OPTION not in prev_widget_display_state)
-                user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_CREATORS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
+                    user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_CREATORS_OPTION not in prev_widget_display_state)
+                    user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_CREATORS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
 
-                if user_clicked_select_all:
-                    st.session_state.selected_creators = list(unique_creators)
-                    st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
-                elif user_clicked_unselect_all:
-                    st.session_state.selected_creators = []
-                    st.session_state.incident_creator_widget_selection_controlled = []
-                else:
-                    if current_select_all_option_selected:
-                        if len(currently_selected_actual_items) < len(unique_creators):
-                            st.session_state.selected_creators = list(currently_selected_actual_items)
-                            st.session_state.incident_creator_widget_selection_controlled = list(currently_selected_actual_items)
-                        else:
-                            st.session_state.selected_creators = list(unique_creators)
-                            st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
+                    if user_clicked_select_all:
+                        st.session_state.selected_creators = list(unique_creators)
+                        st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
+                    elif user_clicked_unselect_all:
+                        st.session_state.selected_creators = []
+                        st.session_state.incident_creator_widget_selection_controlled = []
                     else:
-                        st.session_state.selected_creators = list(currently_selected_actual_items)
-                        if unique_creators and set(currently_selected_actual_items) == set(unique_creators):
-                            st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
+                        if current_select_all_option_selected:
+                            if len(currently_selected_actual_items) < len(unique_creators):
+                                st.session_state.selected_creators = list(currently_selected_actual_items)
+                                st.session_state.incident_creator_widget_selection_controlled = list(currently_selected_actual_items)
+                            else:
+                                st.session_state.selected_creators = list(unique_creators)
+                                st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
                         else:
-                            st.session_state.incident_creator_widget_selection_controlled = list(currently_selected_actual_items)
+                            st.session_state.selected_creators = list(currently_selected_actual_items)
+                            if unique_creators and set(currently_selected_actual_items) == set(unique_creators):
+                                st.session_state.incident_creator_widget_selection_controlled = [SELECT_ALL_CREATORS_OPTION]
+                            else:
+                                st.session_state.incident_creator_widget_selection_controlled = list(currently_selected_actual_items)
 
-            with col2:
-                if 'Team' in overview_df.columns:
-                    unique_teams = sorted(overview_df['Team'].dropna().unique())
-                else:
-                    unique_teams = []
+                with col2:
+                    if 'Team' in overview_df.columns:
+                        unique_teams = get_catalog_options('incident_overview', 'Team')
+                    else:
+                        unique_teams = []
 
-                SELECT_ALL_TEAMS_OPTION = SELECT_ALL_BASE_STRING % "Teams"
+                    SELECT_ALL_TEAMS_OPTION = SELECT_ALL_BASE_STRING % "Teams"
 
-                # Define the desired default teams
-                default_teams_to_select = ["GPSSA App Team L1", "GPSSA App Team L3", "GPSSA PS Team L3"]
+                    # Define the desired default teams
+                    default_teams_to_select = ["GPSSA App Team L1", "GPSSA App Team L3", "GPSSA PS Team L3"]
 
-                if 'incident_team_widget_selection_controlled' not in st.session_state:
-                    # Filter desired default teams to only those present in unique_teams
-                    actual_default_teams = [team for team in default_teams_to_select if team in unique_teams]
+                    if 'incident_team_widget_selection_controlled' not in st.session_state:
+                        # Filter desired default teams to only those present in unique_teams
+                        actual_default_teams = [team for team in default_teams_to_select if team in unique_teams]
 
-                    if actual_default_teams:
-                        st.session_state.selected_teams = list(actual_default_teams)
-                        # Check if all unique_teams are selected by the new default
-                        if unique_teams and set(actual_default_teams) == set(unique_teams):
+                        if actual_default_teams:
+                            st.session_state.selected_teams = list(actual_default_teams)
+                            # Check if all unique_teams are selected by the new default
+                            if unique_teams and set(actual_default_teams) == set(unique_teams):
+                                st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
+                            else:
+                                st.session_state.incident_team_widget_selection_controlled = list(actual_default_teams)
+                        elif unique_teams: # If desired defaults are not present, but other teams are, select all (original fallback)
+                            st.session_state.selected_teams = list(unique_teams)
                             st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
-                        else:
-                            st.session_state.incident_team_widget_selection_controlled = list(actual_default_teams)
-                    elif unique_teams: # If desired defaults are not present, but other teams are, select all (original fallback)
+                        else: # No teams in data, or desired defaults not present and no other teams
+                            st.session_state.selected_teams = []
+                            st.session_state.incident_team_widget_selection_controlled = []
+
+                    options_for_team_widget = [SELECT_ALL_TEAMS_OPTION] + unique_teams
+                    # The default for the multiselect widget is now correctly initialized in session state
+                    raw_team_widget_selection = st.multiselect(
+                        "Filter by Team",
+                        options=options_for_team_widget,
+                        default=st.session_state.incident_team_widget_selection_controlled, # This uses the initialized value
+                        key="multi_select_incident_team"
+                    )
+
+                    prev_widget_display_state = list(st.session_state.incident_team_widget_selection_controlled) # Used for "Select All" logic
+                    current_select_all_option_selected = SELECT_ALL_TEAMS_OPTION in raw_team_widget_selection
+                    currently_selected_actual_items = [t for t in raw_team_widget_selection if t != SELECT_ALL_TEAMS_OPTION]
+
+                    user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_TEAMS_OPTION not in prev_widget_display_state)
+                    user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_TEAMS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
+
+                    if user_clicked_select_all:
                         st.session_state.selected_teams = list(unique_teams)
                         st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
-                    else: # No teams in data, or desired defaults not present and no other teams
+                    elif user_clicked_unselect_all:
                         st.session_state.selected_teams = []
                         st.session_state.incident_team_widget_selection_controlled = []
+                    else:
+                        if current_select_all_option_selected:
+                            if len(currently_selected_actual_items) < len(unique_teams):
+                                st.session_state.selected_teams = list(currently_selected_actual_items)
+                                st.session_state.incident_team_widget_selection_controlled = list(currently_selected_actual_items)
+                            else:
+                                st.session_state.selected_teams = list(unique_teams)
+                                st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
+                        else:
+                            st.session_state.selected_teams = list(currently_selected_actual_items)
+                            if unique_teams and set(currently_selected_actual_items) == set(unique_teams):
+                                st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
+                            else:
+                                st.session_state.incident_team_widget_selection_controlled = list(currently_selected_actual_items)
 
-                options_for_team_widget = [SELECT_ALL_TEAMS_OPTION] + unique_teams
-                # The default for the multiselect widget is now correctly initialized in session state
-                raw_team_widget_selection = st.multiselect(
-                    "Filter by Team",
-                    options=options_for_team_widget,
-                    default=st.session_state.incident_team_widget_selection_controlled, # This uses the initialized value
-                    key="multi_select_incident_team"
-                )
-
-                prev_widget_display_state = list(st.session_state.incident_team_widget_selection_controlled) # Used for "Select All" logic
-                current_select_all_option_selected = SELECT_ALL_TEAMS_OPTION in raw_team_widget_selection
-                currently_selected_actual_items = [t for t in raw_team_widget_selection if t != SELECT_ALL_TEAMS_OPTION]
+                with col3:
+                    if 'Priority' in overview_df.columns:
+                        unique_priorities = get_catalog_options('incident_overview', 'Priority')
+                    else:
+                        unique_priorities = []
 
-                user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_TEAMS_OPTION not in prev_widget_display_state)
-                user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_TEAMS_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
+                    SELECT_ALL_PRIORITIES_OPTION = SELECT_ALL_BASE_STRING % "Priorities"
 
-                if user_clicked_select_all:
-                    st.session_state.selected_teams = list(unique_teams)
-                    st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
-                elif user_clicked_unselect_all:
-                    st.session_state.selected_teams = []
-                    st.session_state.incident_team_widget_selection_controlled = []
-                else:
-                    if current_select_all_option_selected:
-                        if len(currently_selected_actual_items) < len(unique_teams):
-                            st.session_state.selected_teams = list(currently_selected_actual_items)
-                            st.session_state.incident_team_widget_selection_controlled = list(currently_selected_actual_items)
-                        else:
-                            st.session_state.selected_teams = list(unique_teams)
-                            st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
-                    else:
-                        st.session_state.selected_teams = list(currently_selected_actual_items)
-                        if unique_teams and set(currently_selected_actual_items) == set(unique_teams):
-                            st.session_state.incident_team_widget_selection_controlled = [SELECT_ALL_TEAMS_OPTION]
-                        else:
-                            st.session_state.incident_team_widget_selection_controlled = list(currently_selected_actual_items)
+                    if 'incident_priority_widget_selection_controlled' not in st.session_state:
+                        st.session_state.selected_priorities = list(unique_priorities) # Default to all selected for filtering
+                        if unique_priorities: # If there are actual priorities
+                            st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
+                        else: # No priorities
+                            st.session_state.incident_priority_widget_selection_controlled = []
+
+                    options_for_priority_widget = [SELECT_ALL_PRIORITIES_OPTION] + unique_priorities
+                    raw_priority_widget_selection = st.multiselect(
+                        "Filter by Priority",
+                        options=options_for_priority_widget,
+                        default=st.session_state.incident_priority_widget_selection_controlled,
+                        key="multi_select_incident_priority"
+                    )
 
-            with col3:
-                if 'Priority' in overview_df.columns:
-                    unique_priorities = sorted(overview_df['Priority'].dropna().unique())
-                else:
-                    unique_priorities = []
+                    prev_widget_display_state = list(st.session_state.incident_priority_widget_selection_controlled)
+                    current_select_all_option_selected = SELECT_ALL_PRIORITIES_OPTION in raw_priority_widget_selection
+                    currently_selected_actual_items = [p for p in raw_priority_widget_selection if p != SELECT_ALL_PRIORITIES_OPTION]
 
-                SELECT_ALL_PRIORITIES_OPTION = SELECT_ALL_BASE_STRING % "Priorities"
+                    user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_PRIORITIES_OPTION not in prev_widget_display_state)
+                    user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_PRIORITIES_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
 
-                if 'incident_priority_widget_selection_controlled' not in st.session_state:
-                    st.session_state.selected_priorities = list(unique_priorities) # Default to all selected for filtering
-                    if unique_priorities: # If there are actual priorities
+                    if user_clicked_select_all:
+                        st.session_state.selected_priorities = list(unique_priorities)
                         st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
-                    else: # No priorities
+                    elif user_clicked_unselect_all:
+                        st.session_state.selected_priorities = []
                         st.session_state.incident_priority_widget_selection_controlled = []
+                    else:
+                        if current_select_all_option_selected:
+                            if len(currently_selected_actual_items) < len(unique_priorities):
+                                st.session_state.selected_priorities = list(currently_selected_actual_items)
+                                st.session_state.incident_priority_widget_selection_controlled = list(currently_selected_actual_items)
+                            else:
+                                st.session_state.selected_priorities = list(unique_priorities)
+                                st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
+                        else:
+                            st.session_state.selected_priorities = list(currently_selected_actual_items)
+                            if unique_priorities and set(currently_selected_actual_items) == set(unique_priorities):
+                                st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
+                            else:
+                                st.session_state.incident_priority_widget_selection_controlled = list(currently_selected_actual_items)
+
+                with col4: # New column for Status filter
+                    if 'Status' in overview_df.columns:
+                        unique_statuses = get_catalog_options('incident_overview', 'Status')
+                        # Exclude 'Closed', 'Resolved', 'Cancelled' by default
+                        closed_like_statuses = {'Closed', 'Cancelled'}
+                        default_selected_statuses = [s for s in unique_statuses if s not in closed_like_statuses]
+                    else:
+                        unique_statuses = []
+                        default_selected_statuses = []
 
-                options_for_priority_widget = [SELECT_ALL_PRIORITIES_OPTION] + unique_priorities
-                raw_priority_widget_selection = st.multiselect(
-                    "Filter by Priority",
-                    options=options_for_priority_widget,
-                    default=st.session_state.incident_priority_widget_selection_controlled,
-                    key="multi_select_incident_priority"
-                )
-
-                prev_widget_display_state = list(st.session_state.incident_priority_widget_selection_controlled)
-                current_select_all_option_selected = SELECT_ALL_PRIORITIES_OPTION in raw_priority_widget_selection
-                currently_selected_actual_items = [p for p in raw_priority_widget_selection if p != SELECT_ALL_PRIORITIES_OPTION]
+                    SELECT_ALL_STATUSES_OPTION = SELECT_ALL_BASE_STRING % "Statuses"
 
-                user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_PRIORITIES_OPTION not in prev_widget_display_state)
-                user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_PRIORITIES_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
+                    if 'incident_status_widget_selection_controlled' not in st.session_state:
+                        st.session_state.selected_statuses = list(default_selected_statuses) # Actual statuses for filtering
 
-                if user_clicked_select_all:
-                    st.session_state.selected_priorities = list(unique_priorities)
-                    st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
-                elif user_clicked_unselect_all:
-                    st.session_state.selected_priorities = []
-                    st.session_state.incident_priority_widget_selection_controlled = []
-                else:
-                    if current_select_all_option_selected:
-                        if len(currently_selected_actual_items) < len(unique_priorities):
-                            st.session_state.selected_priorities = list(currently_selected_actual_items)
-                            st.session_state.incident_priority_widget_selection_controlled = list(currently_selected_actual_items)
-                        else:
-                            st.session_state.selected_priorities = list(unique_priorities)
-                            st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
-                    else:
-                        st.session_state.selected_priorities = list(currently_selected_actual_items)
-                        if unique_priorities and set(currently_selected_actual_items) == set(unique_priorities):
-                            st.session_state.incident_priority_widget_selection_controlled = [SELECT_ALL_PRIORITIES_OPTION]
-                        else:
-                            st.session_state.incident_priority_widget_selection_controlled = list(currently_selected_actual_items)
-
-            with col4: # New column for Status filter
-                if 'Status' in overview_df.columns:
-                    unique_statuses = sorted(overview_df['Status'].dropna().unique())
-                    # Exclude 'Closed', 'Resolved', 'Cancelled' by default
-                    closed_like_statuses = {'Closed', 'Cancelled'}
-                    default_selected_statuses = [s for s in unique_statuses if s not in closed_like_statuses]
-                else:
-                    unique_statuses = []
-                    default_selected_statuses = []
+                        if not default_selected_statuses and unique_statuses: # If default_selected_statuses is empty and there are statuses, select all
+                            st.session_state.selected_statuses = list(unique_statuses)
+                            st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
+                        elif unique_statuses and set(default_selected_statuses) == set(unique_statuses): # If default_selected_statuses happens to be all unique_statuses
+                            st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
+                        elif not unique_statuses: # If there are no statuses at all
+                            st.session_state.selected_statuses = []
+                            st.session_state.incident_status_widget_selection_controlled = []
+                        else: # Default statuses are a specific subset
+                            st.session_state.incident_status_widget_selection_controlled = list(default_selected_statuses)
+
+                    options_for_status_widget = [SELECT_ALL_STATUSES_OPTION] + unique_statuses
+                    raw_status_widget_selection = st.multiselect(
+                        "Filter by Status",
+                        options=options_for_status_widget,
+                        default=st.session_state.incident_status_widget_selection_controlled,
+                        key="multi_select_incident_status"
+                    )
 
-                SELECT_ALL_STATUSES_OPTION = SELECT_ALL_BASE_STRING % "Statuses"
+                    prev_widget_display_state = list(st.session_state.incident_status_widget_selection_controlled)
+                    current_select_all_option_selected = SELECT_ALL_STATUSES_OPTION in raw_status_widget_selection
+                    currently_selected_actual_items = [s for s in raw_status_widget_selection if s != SELECT_ALL_STATUSES_OPTION]
 
-                if 'incident_status_widget_selection_controlled' not in st.session_state:
-                    st.session_state.selected_statuses = list(default_selected_statuses) # Actual statuses for filtering
+                    user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_STATUSES_OPTION not in prev_widget_display_state)
+                    user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_STATUSES_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
 
-                    if not default_selected_statuses and unique_statuses: # If default_selected_statuses is empty and there are statuses, select all
+                    if user_clicked_select_all:
                         st.session_state.selected_statuses = list(unique_statuses)
                         st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
-                    elif unique_statuses and set(default_selected_statuses) == set(unique_statuses): # If default_selected_statuses happens to be all unique_statuses
-                        st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
-                    elif not unique_statuses: # If there are no statuses at all
+                    elif user_clicked_unselect_all:
                         st.session_state.selected_statuses = []
                         st.session_state.incident_status_widget_selection_controlled = []
-                    else: # Default statuses are a specific subset
-                        st.session_state.incident_status_widget_selection_controlled = list(default_selected_statuses)
-
-                options_for_status_widget = [SELECT_ALL_STATUSES_OPTION] + unique_statuses
-                raw_status_widget_selection = st.multiselect(
-                    "Filter by Status",
-                    options=options_for_status_widget,
-                    default=st.session_state.incident_status_widget_selection_controlled,
-                    key="multi_select_incident_status"
-                )
-
-                prev_widget_display_state = list(st.session_state.incident_status_widget_selection_controlled)
-                current_select_all_option_selected = SELECT_ALL_STATUSES_OPTION in raw_status_widget_selection
-                currently_selected_actual_items = [s for s in raw_status_widget_selection if s != SELECT_ALL_STATUSES_OPTION]
-
-                user_clicked_select_all = current_select_all_option_selected and (SELECT_ALL_STATUSES_OPTION not in prev_widget_display_state)
-                user_clicked_unselect_all = (not current_select_all_option_selected) and (SELECT_ALL_STATUSES_OPTION in prev_widget_display_state and len(prev_widget_display_state) == 1)
-
-                if user_clicked_select_all:
-                    st.session_state.selected_statuses = list(unique_statuses)
-                    st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
-                elif user_clicked_unselect_all:
-                    st.session_state.selected_statuses = []
-                    st.session_state.incident_status_widget_selection_controlled = []
-                else:
-                    if current_select_all_option_selected:
-                        if len(currently_selected_actual_items) < len(unique_statuses):
-                            st.session_state.selected_statuses = list(currently_selected_actual_items)
-                            st.session_state.incident_status_widget_selection_controlled = list(currently_selected_actual_items)
-                        else:
-                            st.session_state.selected_statuses = list(unique_statuses)
-                            st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
                     else:
-                        st.session_state.selected_statuses = list(currently_selected_actual_items)
-                        if unique_statuses and set(currently_selected_actual_items) == set(unique_statuses):
-                            st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
+                        if current_select_all_option_selected:
+                            if len(currently_selected_actual_items) < len(unique_statuses):
+                                st.session_state.selected_statuses = list(currently_selected_actual_items)
+                                st.session_state.incident_status_widget_selection_controlled = list(currently_selected_actual_items)
+                            else:
+                                st.session_state.selected_statuses = list(unique_statuses)
+                                st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
                         else:
-                            st.session_state.incident_status_widget_selection_controlled = list(currently_selected_actual_items)
-
-            # Apply filters
-            filtered_overview_df = overview_df
+                            st.session_state.selected_statuses = list(currently_selected_actual_items)
+                            if unique_statuses and set(currently_selected_actual_items) == set(unique_statuses):
+                                st.session_state.incident_status_widget_selection_controlled = [SELECT_ALL_STATUSES_OPTION]
+                            else:
+                                st.session_state.incident_status_widget_selection_controlled = list(currently_selected_actual_items)
+                st.form_submit_button("Apply Filters")
+
+            # Apply filters: AND of np.isin over the cached option codes, then a single indexing operation
+            incident_option_masks = get_incident_option_masks(overview_df, st.session_state.incident_df_version)
+            current_overview_selections = get_incident_overview_selections()
+            overview_filter_mask = apply_categorical_option_masks(
+                incident_option_masks,
+                current_overview_selections,
+                len(overview_df)
+            )
 
-            if st.session_state.get('selected_creators') and 'Creator' in filtered_overview_df.columns:
-                filtered_overview_df = filtered_overview_df[filtered_overview_df['Creator'].isin(st.session_state.selected_creators)]
-            if st.session_state.get('selected_teams') and 'Team' in filtered_overview_df.columns:
-                filtered_overview_df = filtered_overview_df[filtered_overview_df['Team'].isin(st.session_state.selected_teams)]
-            if st.session_state.get('selected_priorities') and 'Priority' in filtered_overview_df.columns:
-                filtered_overview_df = filtered_overview_df[filtered_overview_df['Priority'].isin(st.session_state.selected_priorities)]
-            if st.session_state.get('selected_statuses') and 'Status' in filtered_overview_df.columns: # Add status filter
-                filtered_overview_df = filtered_overview_df[filtered_overview_df['Status'].isin(st.session_state.selected_statuses)]
+            # Facet counts: how many incidents each option would yield under the other active filters
+            facet_counts = get_incident_facet_counts(
+                incident_option_masks,
+                st.session_state.incident_df_version,
+                tuple((col, tuple(values or [])) for col, values in current_overview_selections.items()),
+                len(overview_df)
+            )
+            with st.expander("Filter option counts", expanded=False):
+                facet_cols = st.columns(len(facet_counts) or 1)
+                for facet_col, (column_name, option_counts) in zip(facet_cols, facet_counts.items()):
+                    with facet_col:
+                        st.markdown(f"**{column_name}**")
+                        st.dataframe(
+                            build_facet_count_table(option_counts, column_name),
+                            hide_index=True,
+                            use_container_width=True,
+                            height=min(35 * (len(option_counts) + 1) + 3, 300)
+                        )
+            filtered_overview_df = overview_df[overview_filter_mask]
 
-            # Calculate team and status totals
-            team_status_summary_df = calculate_team_status_summary(filtered_overview_df)
+            # Calculate team and status totals from the rollup cube
+            incident_cube = get_incident_rollup_cube(overview_df, st.session_state.incident_df_version)
+            if 'Team' in overview_df.columns and 'Status' in overview_df.columns:
+                team_status_summary_df = rollup_cube_counts(incident_cube, ['Team', 'Status'], current_overview_selections).reset_index(name='Total Incidents')
+            else:
+                team_status_summary_df = pd.DataFrame(columns=['Team', 'Status', 'Total Incidents'])
 
         # --- Charts Display: Percentage of Closed Incidents and Team Assignment Distribution ---
         # Use columns to display charts side-by-side
@@ -1800,8 +2449,8 @@ else:
         with chart_col1:
             st.subheader("Percentage of Closed Incidents")
             if 'Status' in overview_df.columns: # Ensure 'Status' column exists in the original overview_df for this chart
-                closed_count = overview_df[overview_df['Status'] == 'Closed'].shape[0]
-                total_incidents = overview_df.shape[0]
+                closed_count = int(rollup_cube_counts(incident_cube, 'Status').get('Closed', 0))
+                total_incidents = incident_cube['n_rows']
                 other_count = total_incidents - closed_count
 
                 if total_incidents > 0: # Avoid division by zero if no incidents
@@ -1821,7 +2470,7 @@ else:
             st.subheader("Team Assignment Distribution")
             if not filtered_overview_df.empty:
                 if 'Team' in filtered_overview_df.columns:
-                    team_distribution_data = filtered_overview_df['Team'].value_counts()
+                    team_distribution_data = rollup_cube_counts(incident_cube, 'Team', current_overview_selections).sort_values(ascending=False, kind='stable')
 
                     if not team_distribution_data.empty:
                         fig_team_dist = px.pie(
@@ -1841,6 +2490,12 @@ else:
 
         st.markdown("---") # Visual separator
 
+        # --- Open Incident Backlog (closure day: 'LastModDateTime' when uploaded, else 'Last Checked at') ---
+        if st.session_state.incident_overview_df is not None and 'Created On' in overview_df.columns:
+            incident_closed_col = next((col for col in ['LastModDateTime', 'Last Checked at'] if col in overview_df.columns), 'LastModDateTime')
+            render_open_backlog(overview_df, st.session_state.incident_df_version, "Incidents", incident_closed_col, INCIDENT_CLOSED_STATUSES, ['Team', 'Status'], "incident")
+            st.markdown("---")
+
         # --- Incidents Breached Per Week Graph ---
         st.subheader("Incidents Breached Per Week")
         if 'incident_overview_df' in st.session_state and st.session_state.incident_overview_df is not None and not st.session_state.incident_overview_df.empty:
@@ -1850,7 +2505,7 @@ else:
             if 'Breach Date' in inc_breach_df_source.columns:
                 # Ensure 'Breach Date' is present before calling the utility function
                 # The utility function itself handles parsing and errors for 'Breach Date'
-                weekly_breached_incidents_df = calculate_incidents_breached_per_week(inc_breach_df_source, breach_date_col='Breach Date')
+                weekly_breached_incidents_df = calculate_incidents_breached_per_week(inc_breach_df_source, breach_date_col='Breach Date', fill_gaps=True)
 
                 if not weekly_breached_incidents_df.empty:
                     fig_incidents_breached = px.bar(
@@ -1873,229 +2528,237 @@ else:
 
         st.markdown("---") # Visual separator
 
-        # --- Detailed Breached Incidents Table with Column Selection ---
-        st.subheader("Detailed Breached Incidents")
-        if 'incident_overview_df' in st.session_state and \
-           st.session_state.incident_overview_df is not None and \
-           not st.session_state.incident_overview_df.empty:
-
-            detailed_breach_source_df = st.session_state.incident_overview_df.copy()
+        @st.fragment
+        def render_detailed_breached_incidents(weekly_breached_incidents_df):
+            section_started_at = time.perf_counter()
+            # --- Detailed Breached Incidents Table with Column Selection ---
+            st.subheader("Detailed Breached Incidents")
+            if 'incident_overview_df' in st.session_state and \
+               st.session_state.incident_overview_df is not None and \
+               not st.session_state.incident_overview_df.empty:
 
-            if 'Breach Date' in detailed_breach_source_df.columns:
-                col_name_detail = 'Breach Date'
-                parsed_col_name_detail = 'Breach Date Parsed'
-                original_series_detail = detailed_breach_source_df[col_name_detail].copy().astype(str)
-                detailed_breach_source_df[parsed_col_name_detail] = pd.NaT
+                detailed_breach_source_df = st.session_state.incident_overview_df.copy()
 
-                # Step 1: Try specific known formats (day-first)
-                formats_to_try = ['%d/%m/%Y %H:%M:%S', '%d/%m/%y %H:%M', '%d/%m/%Y']
-                for fmt in formats_to_try:
-                    mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
-                    if not mask_detail.any(): break
-                    parsed_subset_detail = pd.to_datetime(original_series_detail[mask_detail], format=fmt, errors='coerce')
-                    detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(parsed_subset_detail)
-
-                # Step 2: Try standard parsing (handles ISO, etc.) for remaining nulls
-                mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
-                if mask_detail.any():
-                    iso_parsed_detail = pd.to_datetime(original_series_detail[mask_detail], errors='coerce')
-                    detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(iso_parsed_detail)
-
-                # Step 3: Try general dayfirst=True parsing for remaining nulls
-                mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
-                if mask_detail.any():
-                    dayfirst_gen_parsed_detail = pd.to_datetime(original_series_detail[mask_detail], errors='coerce', dayfirst=True)
-                    detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(dayfirst_gen_parsed_detail)
-
-                # Filter for incidents that have a valid (parsed) breach date
-                all_breached_incidents_df = detailed_breach_source_df.dropna(subset=['Breach Date Parsed'])
-
-                # We can drop the temporary parsed column if we show the original 'Breach Date'
-                # However, it might be useful to keep the parsed one for sorting or display consistency.
-                # For now, let's assume we want to display columns from the original df structure.
-                # So, we use 'all_breached_incidents_df' to identify rows, but select columns from 'detailed_breach_source_df' (before dropping 'Breach Date Parsed') or even better, from original `overview_df` by index.
-
-                # Let's use the indices from `all_breached_incidents_df` to filter the original `st.session_state.incident_overview_df`
-                # to ensure we are showing original data and all its columns.
-
-                displayable_breached_incidents_df = st.session_state.incident_overview_df.loc[all_breached_incidents_df.index].copy() # Use .copy() to avoid SettingWithCopyWarning
-
-                # Ensure 'Breach Date' is datetime for further operations (like deriving Year-Week or day filtering)
-                # This should already be the case due to earlier parsing, but explicitly ensuring it here if it's re-read or copied.
-                if 'Breach Date' in displayable_breached_incidents_df.columns:
-                    displayable_breached_incidents_df['Breach Date'] = pd.to_datetime(displayable_breached_incidents_df['Breach Date'], errors='coerce')
-                    # Add 'Year-Week' column for filtering, if 'Breach Date' is valid datetime
-                    if pd.api.types.is_datetime64_any_dtype(displayable_breached_incidents_df['Breach Date']):
-                        displayable_breached_incidents_df['Year-Week'] = displayable_breached_incidents_df['Breach Date'].dt.strftime('%G-W%V')
-                    else:
-                        # Fallback if 'Breach Date' is not datetime (should not happen if parsing worked)
-                        displayable_breached_incidents_df['Year-Week'] = None
-                else:
-                     displayable_breached_incidents_df['Year-Week'] = None # Ensure column exists even if 'Breach Date' is missing
+                if 'Breach Date' in detailed_breach_source_df.columns:
+                    col_name_detail = 'Breach Date'
+                    parsed_col_name_detail = 'Breach Date Parsed'
+                    original_series_detail = detailed_breach_source_df[col_name_detail].copy().astype(str)
+                    detailed_breach_source_df[parsed_col_name_detail] = pd.NaT
 
+                    # Step 1: Try specific known formats (day-first)
+                    formats_to_try = ['%d/%m/%Y %H:%M:%S', '%d/%m/%y %H:%M', '%d/%m/%Y']
+                    for fmt in formats_to_try:
+                        mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
+                        if not mask_detail.any(): break
+                        parsed_subset_detail = pd.to_datetime(original_series_detail[mask_detail], format=fmt, errors='coerce')
+                        detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(parsed_subset_detail)
 
-                if not displayable_breached_incidents_df.empty:
-                    st.markdown(f"Found **{len(displayable_breached_incidents_df)}** incidents with a valid breach date (before applying week/day filters).")
+                    # Step 2: Try standard parsing (handles ISO, etc.) for remaining nulls
+                    mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
+                    if mask_detail.any():
+                        iso_parsed_detail = pd.to_datetime(original_series_detail[mask_detail], errors='coerce')
+                        detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(iso_parsed_detail)
 
-                    # --- Week and Day Filters for Detailed Table (Category filter removed) ---
-                    filter_col1, filter_col2 = st.columns(2) # Reverted to 2 columns
-                    selected_week_displays_breach = []
-                    selected_day_breach = None
-                    # selected_categories_breach variable is no longer needed here
+                    # Step 3: Try general dayfirst=True parsing for remaining nulls
+                    mask_detail = detailed_breach_source_df[parsed_col_name_detail].isnull() & original_series_detail.notnull()
+                    if mask_detail.any():
+                        dayfirst_gen_parsed_detail = pd.to_datetime(original_series_detail[mask_detail], errors='coerce', dayfirst=True)
+                        detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail] = detailed_breach_source_df.loc[mask_detail, parsed_col_name_detail].fillna(dayfirst_gen_parsed_detail)
+
+                    # Filter for incidents that have a valid (parsed) breach date
+                    all_breached_incidents_df = detailed_breach_source_df.dropna(subset=['Breach Date Parsed'])
+
+                    # We can drop the temporary parsed column if we show the original 'Breach Date'
+                    # However, it might be useful to keep the parsed one for sorting or display consistency.
+                    # For now, let's assume we want to display columns from the original df structure.
+                    # So, we use 'all_breached_incidents_df' to identify rows, but select columns from 'detailed_breach_source_df' (before dropping 'Breach Date Parsed') or even better, from original `overview_df` by index.
+
+                    # Let's use the indices from `all_breached_incidents_df` to filter the original `st.session_state.incident_overview_df`
+                    # to ensure we are showing original data and all its columns.
+
+                    displayable_breached_incidents_df = st.session_state.incident_overview_df.loc[all_breached_incidents_df.index].copy() # Use .copy() to avoid SettingWithCopyWarning
+
+                    # Ensure 'Breach Date' is datetime for further operations (like deriving Year-Week or day filtering)
+                    # This should already be the case due to earlier parsing, but explicitly ensuring it here if it's re-read or copied.
+                    if 'Breach Date' in displayable_breached_incidents_df.columns:
+                        displayable_breached_incidents_df['Breach Date'] = pd.to_datetime(displayable_breached_incidents_df['Breach Date'], errors='coerce')
+                        # Add 'Year-Week' column for filtering, if 'Breach Date' is valid datetime
+                        if pd.api.types.is_datetime64_any_dtype(displayable_breached_incidents_df['Breach Date']):
+                            breach_week_codes = compute_iso_week_codes(displayable_breached_incidents_df['Breach Date'])
+                            displayable_breached_incidents_df['Year-Week'] = get_iso_week_labels(breach_week_codes)['Year-Week'].to_numpy()
+                        else:
+                            # Fallback if 'Breach Date' is not datetime (should not happen if parsing worked)
+                            displayable_breached_incidents_df['Year-Week'] = None
+                    else:
+                         displayable_breached_incidents_df['Year-Week'] = None # Ensure column exists even if 'Breach Date' is missing
+
+
+                    if not displayable_breached_incidents_df.empty:
+                        st.markdown(f"Found **{len(displayable_breached_incidents_df)}** incidents with a valid breach date (before applying week/day filters).")
+
+                        # --- Week and Day Filters for Detailed Table (Category filter removed) ---
+                        filter_col1, filter_col2 = st.columns(2) # Reverted to 2 columns
+                        selected_week_displays_breach = []
+                        selected_day_breach = None
+                        # selected_categories_breach variable is no longer needed here
+
+                        with filter_col1:
+                            if 'weekly_breached_incidents_df' in locals() and not weekly_breached_incidents_df.empty and 'WeekDisplay' in weekly_breached_incidents_df.columns:
+                                # Zero weeks are only there to keep the chart continuous
+                                week_options_breach = ["All Weeks"] + weekly_breached_incidents_df.loc[weekly_breached_incidents_df['Count'] > 0, 'WeekDisplay'].tolist()
+                                if 'breach_week_filter_selection' not in st.session_state:
+                                    st.session_state.breach_week_filter_selection = ["All Weeks"]
+
+                                selected_week_displays_breach = st.multiselect(
+                                    "Filter by Week Period (Breach Date):",
+                                    options=week_options_breach,
+                                    default=st.session_state.breach_week_filter_selection,
+                                    key="multiselect_breach_week_period"
+                                )
+                                st.session_state.breach_week_filter_selection = selected_week_displays_breach
+                            else:
+                                st.caption("Week filter not available (no weekly breach data).")
+
+                        with filter_col2:
+                            if 'Breach Date' in displayable_breached_incidents_df.columns and not displayable_breached_incidents_df['Breach Date'].dropna().empty:
+                                min_breach_date = displayable_breached_incidents_df['Breach Date'].dropna().min().date()
+                                max_breach_date = displayable_breached_incidents_df['Breach Date'].dropna().max().date()
+                                selected_day_breach = st.date_input(
+                                    "Filter by Specific Day (Breach Date):",
+                                    value=None,
+                                    min_value=min_breach_date,
+                                    max_value=max_breach_date,
+                                    key="date_input_breach_specific_day"
+                                )
+                            else:
+                                st.caption("Day filter not available (no valid breach dates).")
 
-                    with filter_col1:
-                        if 'weekly_breached_incidents_df' in locals() and not weekly_breached_incidents_df.empty and 'WeekDisplay' in weekly_breached_incidents_df.columns:
-                            week_options_breach = ["All Weeks"] + weekly_breached_incidents_df['WeekDisplay'].unique().tolist()
-                            if 'breach_week_filter_selection' not in st.session_state:
-                                st.session_state.breach_week_filter_selection = ["All Weeks"]
+                        # Prepare for filtering - this df will be further filtered
+                        filtered_detailed_breached_incidents_df = displayable_breached_incidents_df.copy()
 
-                            selected_week_displays_breach = st.multiselect(
-                                "Filter by Week Period (Breach Date):",
-                                options=week_options_breach,
-                                default=st.session_state.breach_week_filter_selection,
-                                key="multiselect_breach_week_period"
-                            )
-                            st.session_state.breach_week_filter_selection = selected_week_displays_breach
-                        else:
-                            st.caption("Week filter not available (no weekly breach data).")
-
-                    with filter_col2:
-                        if 'Breach Date' in displayable_breached_incidents_df.columns and not displayable_breached_incidents_df['Breach Date'].dropna().empty:
-                            min_breach_date = displayable_breached_incidents_df['Breach Date'].dropna().min().date()
-                            max_breach_date = displayable_breached_incidents_df['Breach Date'].dropna().max().date()
-                            selected_day_breach = st.date_input(
-                                "Filter by Specific Day (Breach Date):",
-                                value=None,
-                                min_value=min_breach_date,
-                                max_value=max_breach_date,
-                                key="date_input_breach_specific_day"
-                            )
-                        else:
-                            st.caption("Day filter not available (no valid breach dates).")
-
-                    # Prepare for filtering - this df will be further filtered
-                    filtered_detailed_breached_incidents_df = displayable_breached_incidents_df.copy()
-
-                    # Apply Day Filter (takes precedence)
-                    if selected_day_breach:
-                        if 'Breach Date' in filtered_detailed_breached_incidents_df.columns and \
-                           pd.api.types.is_datetime64_any_dtype(filtered_detailed_breached_incidents_df['Breach Date']):
-                            filtered_detailed_breached_incidents_df = filtered_detailed_breached_incidents_df[
-                                filtered_detailed_breached_incidents_df['Breach Date'].dt.date == selected_day_breach
-                            ]
-                            st.session_state.breach_week_filter_selection = ["All Weeks"]
-
-                    # Apply Week Filter (if no day filter is active and a specific week is chosen)
-                    elif selected_week_displays_breach and "All Weeks" not in selected_week_displays_breach:
-                        if 'weekly_breached_incidents_df' in locals() and not weekly_breached_incidents_df.empty and \
-                           'Year-Week' in weekly_breached_incidents_df.columns and \
-                           'Year-Week' in filtered_detailed_breached_incidents_df.columns:
-
-                            week_map_breach = pd.Series(
-                                weekly_breached_incidents_df['Year-Week'].values,
-                                index=weekly_breached_incidents_df['WeekDisplay']
-                            ).to_dict()
-
-                            selected_year_weeks_breach = [
-                                week_map_breach[wd] for wd in selected_week_displays_breach if wd in week_map_breach
-                            ]
-
-                            if selected_year_weeks_breach:
+                        # Apply Day Filter (takes precedence)
+                        if selected_day_breach:
+                            if 'Breach Date' in filtered_detailed_breached_incidents_df.columns and \
+                               pd.api.types.is_datetime64_any_dtype(filtered_detailed_breached_incidents_df['Breach Date']):
                                 filtered_detailed_breached_incidents_df = filtered_detailed_breached_incidents_df[
-                                    filtered_detailed_breached_incidents_df['Year-Week'].isin(selected_year_weeks_breach)
+                                    filtered_detailed_breached_incidents_df['Breach Date'].dt.date == selected_day_breach
                                 ]
-                    # Category filter logic removed here
+                                st.session_state.breach_week_filter_selection = ["All Weeks"]
 
-                    # Update the count message after all filters
-                    st.markdown(f"Displaying **{len(filtered_detailed_breached_incidents_df)}** breached incidents based on current filters.")
+                        # Apply Week Filter (if no day filter is active and a specific week is chosen)
+                        elif selected_week_displays_breach and "All Weeks" not in selected_week_displays_breach:
+                            if 'weekly_breached_incidents_df' in locals() and not weekly_breached_incidents_df.empty and \
+                               'Year-Week' in weekly_breached_incidents_df.columns and \
+                               'Year-Week' in filtered_detailed_breached_incidents_df.columns:
 
+                                week_map_breach = pd.Series(
+                                    weekly_breached_incidents_df['Year-Week'].values,
+                                    index=weekly_breached_incidents_df['WeekDisplay']
+                                ).to_dict()
 
-                    all_breached_incident_columns = filtered_detailed_breached_incidents_df.columns.tolist() # This will include 'Year-Week' if present
-                    SELECT_ALL_COLS_BREACH_DETAIL_OPTION = "[Select All Columns for Breached Incidents]"
+                                selected_year_weeks_breach = [
+                                    week_map_breach[wd] for wd in selected_week_displays_breach if wd in week_map_breach
+                                ]
 
-                    # Add 'Year-Week' to default columns if it exists in the source
-                    default_breach_detail_cols = ["Incident", "Creator", "Team", "Priority", "Status", "Breach Date"]
-                    if 'Year-Week' in all_breached_incident_columns:
-                        default_breach_detail_cols.append('Year-Week')
+                                if selected_year_weeks_breach:
+                                    filtered_detailed_breached_incidents_df = filtered_detailed_breached_incidents_df[
+                                        filtered_detailed_breached_incidents_df['Year-Week'].isin(selected_year_weeks_breach)
+                                    ]
+                        # Category filter logic removed here
 
-                    actual_default_breach_detail_cols = [col for col in default_breach_detail_cols if col in all_breached_incident_columns]
+                        # Update the count message after all filters
+                        st.markdown(f"Displaying **{len(filtered_detailed_breached_incidents_df)}** breached incidents based on current filters.")
 
-                    if 'breached_incident_detail_cols_controlled' not in st.session_state:
-                        st.session_state.selected_breach_detail_display_cols = list(actual_default_breach_detail_cols)
-                        if not actual_default_breach_detail_cols and all_breached_incident_columns:
-                            st.session_state.selected_breach_detail_display_cols = list(all_breached_incident_columns)
-                            st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
-                        elif all_breached_incident_columns and set(actual_default_breach_detail_cols) == set(all_breached_incident_columns):
-                            st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
-                        elif not all_breached_incident_columns:
-                            st.session_state.selected_breach_detail_display_cols = []
-                            st.session_state.breached_incident_detail_cols_controlled = []
-                        else:
-                             st.session_state.breached_incident_detail_cols_controlled = list(actual_default_breach_detail_cols)
-
-                    options_for_breach_detail_cols_widget = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION] + all_breached_incident_columns
-                    raw_breach_detail_cols_selection = st.multiselect(
-                        "Select columns for Detailed Breached Incidents table:",
-                        options=options_for_breach_detail_cols_widget,
-                        default=st.session_state.breached_incident_detail_cols_controlled,
-                        key="multi_select_breached_incident_detail_columns"
-                    )
 
-                    # Logic for "Select All" option for breached incident detail columns
-                    prev_widget_state_breach_detail = list(st.session_state.breached_incident_detail_cols_controlled)
-                    current_select_all_breach_detail = SELECT_ALL_COLS_BREACH_DETAIL_OPTION in raw_breach_detail_cols_selection
-                    selected_actual_items_breach_detail = [c for c in raw_breach_detail_cols_selection if c != SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
+                        all_breached_incident_columns = filtered_detailed_breached_incidents_df.columns.tolist() # This will include 'Year-Week' if present
+                        SELECT_ALL_COLS_BREACH_DETAIL_OPTION = "[Select All Columns for Breached Incidents]"
 
-                    user_clicked_select_all_breach_detail = current_select_all_breach_detail and (SELECT_ALL_COLS_BREACH_DETAIL_OPTION not in prev_widget_state_breach_detail)
-                    user_clicked_unselect_all_breach_detail = (not current_select_all_breach_detail) and (SELECT_ALL_COLS_BREACH_DETAIL_OPTION in prev_widget_state_breach_detail and len(prev_widget_state_breach_detail) == 1)
+                        # Add 'Year-Week' to default columns if it exists in the source
+                        default_breach_detail_cols = ["Incident", "Creator", "Team", "Priority", "Status", "Breach Date"]
+                        if 'Year-Week' in all_breached_incident_columns:
+                            default_breach_detail_cols.append('Year-Week')
 
-                    if user_clicked_select_all_breach_detail:
-                        st.session_state.selected_breach_detail_display_cols = list(all_breached_incident_columns)
-                        st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
-                    elif user_clicked_unselect_all_breach_detail:
-                        st.session_state.selected_breach_detail_display_cols = []
-                        st.session_state.breached_incident_detail_cols_controlled = []
-                    else:
-                        if current_select_all_breach_detail:
-                            if len(selected_actual_items_breach_detail) < len(all_breached_incident_columns):
-                                st.session_state.selected_breach_detail_display_cols = list(selected_actual_items_breach_detail)
-                                st.session_state.breached_incident_detail_cols_controlled = list(selected_actual_items_breach_detail)
-                            else:
+                        actual_default_breach_detail_cols = [col for col in default_breach_detail_cols if col in all_breached_incident_columns]
+
+                        if 'breached_incident_detail_cols_controlled' not in st.session_state:
+                            st.session_state.selected_breach_detail_display_cols = list(actual_default_breach_detail_cols)
+                            if not actual_default_breach_detail_cols and all_breached_incident_columns:
                                 st.session_state.selected_breach_detail_display_cols = list(all_breached_incident_columns)
                                 st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
-                        else:
-                            st.session_state.selected_breach_detail_display_cols = list(selected_actual_items_breach_detail)
-                            if all_breached_incident_columns and set(selected_actual_items_breach_detail) == set(all_breached_incident_columns):
+                            elif all_breached_incident_columns and set(actual_default_breach_detail_cols) == set(all_breached_incident_columns):
                                 st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
+                            elif not all_breached_incident_columns:
+                                st.session_state.selected_breach_detail_display_cols = []
+                                st.session_state.breached_incident_detail_cols_controlled = []
                             else:
-                                st.session_state.breached_incident_detail_cols_controlled = list(selected_actual_items_breach_detail)
+                                 st.session_state.breached_incident_detail_cols_controlled = list(actual_default_breach_detail_cols)
+
+                        options_for_breach_detail_cols_widget = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION] + all_breached_incident_columns
+                        raw_breach_detail_cols_selection = st.multiselect(
+                            "Select columns for Detailed Breached Incidents table:",
+                            options=options_for_breach_detail_cols_widget,
+                            default=st.session_state.breached_incident_detail_cols_controlled,
+                            key="multi_select_breached_incident_detail_columns"
+                        )
 
-                    columns_to_show_breach_detail = st.session_state.get('selected_breach_detail_display_cols', [])
+                        # Logic for "Select All" option for breached incident detail columns
+                        prev_widget_state_breach_detail = list(st.session_state.breached_incident_detail_cols_controlled)
+                        current_select_all_breach_detail = SELECT_ALL_COLS_BREACH_DETAIL_OPTION in raw_breach_detail_cols_selection
+                        selected_actual_items_breach_detail = [c for c in raw_breach_detail_cols_selection if c != SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
 
-                    if not columns_to_show_breach_detail: # If list is empty (e.g. user unselected all)
-                        if actual_default_breach_detail_cols: # Try to show defaults
-                            columns_to_show_breach_detail = actual_default_breach_detail_cols
-                        elif all_breached_incident_columns: # Else show all available
-                            columns_to_show_breach_detail = all_breached_incident_columns
-                        # If still empty, the next 'if' handles it
+                        user_clicked_select_all_breach_detail = current_select_all_breach_detail and (SELECT_ALL_COLS_BREACH_DETAIL_OPTION not in prev_widget_state_breach_detail)
+                        user_clicked_unselect_all_breach_detail = (not current_select_all_breach_detail) and (SELECT_ALL_COLS_BREACH_DETAIL_OPTION in prev_widget_state_breach_detail and len(prev_widget_state_breach_detail) == 1)
 
-                    if columns_to_show_breach_detail:
-                        st.dataframe(filtered_detailed_breached_incidents_df[columns_to_show_breach_detail], hide_index=True, use_container_width=True)
-                    else: # This covers cases where filtered_detailed_breached_incidents_df is empty OR no columns ended up in columns_to_show_breach_detail
-                        st.info("No data or columns available to display for detailed breached incidents based on current filters and selections.")
+                        if user_clicked_select_all_breach_detail:
+                            st.session_state.selected_breach_detail_display_cols = list(all_breached_incident_columns)
+                            st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
+                        elif user_clicked_unselect_all_breach_detail:
+                            st.session_state.selected_breach_detail_display_cols = []
+                            st.session_state.breached_incident_detail_cols_controlled = []
+                        else:
+                            if current_select_all_breach_detail:
+                                if len(selected_actual_items_breach_detail) < len(all_breached_incident_columns):
+                                    st.session_state.selected_breach_detail_display_cols = list(selected_actual_items_breach_detail)
+                                    st.session_state.breached_incident_detail_cols_controlled = list(selected_actual_items_breach_detail)
+                                else:
+                                    st.session_state.selected_breach_detail_display_cols = list(all_breached_incident_columns)
+                                    st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
+                            else:
+                                st.session_state.selected_breach_detail_display_cols = list(selected_actual_items_breach_detail)
+                                if all_breached_incident_columns and set(selected_actual_items_breach_detail) == set(all_breached_incident_columns):
+                                    st.session_state.breached_incident_detail_cols_controlled = [SELECT_ALL_COLS_BREACH_DETAIL_OPTION]
+                                else:
+                                    st.session_state.breached_incident_detail_cols_controlled = list(selected_actual_items_breach_detail)
+
+                        columns_to_show_breach_detail = st.session_state.get('selected_breach_detail_display_cols', [])
+
+                        if not columns_to_show_breach_detail: # If list is empty (e.g. user unselected all)
+                            if actual_default_breach_detail_cols: # Try to show defaults
+                                columns_to_show_breach_detail = actual_default_breach_detail_cols
+                            elif all_breached_incident_columns: # Else show all available
+                                columns_to_show_breach_detail = all_breached_incident_columns
+                            # If still empty, the next 'if' handles it
+
+                        if columns_to_show_breach_detail:
+                            render_table(filtered_detailed_breached_incidents_df[columns_to_show_breach_detail], "detailed_breached_incidents_table", hide_index=True, use_container_width=True)
+                        else: # This covers cases where filtered_detailed_breached_incidents_df is empty OR no columns ended up in columns_to_show_breach_detail
+                            st.info("No data or columns available to display for detailed breached incidents based on current filters and selections.")
+
+                    # This 'else' correctly corresponds to 'if not displayable_breached_incidents_df.empty:'
+                    else:
+                        st.info("No incidents with a valid breach date found to display details (after week/day filters or initially).")
 
-                # This 'else' correctly corresponds to 'if not displayable_breached_incidents_df.empty:'
+                # This 'else' correctly corresponds to 'if 'Breach Date' in detailed_breach_source_df.columns:'
                 else:
-                    st.info("No incidents with a valid breach date found to display details (after week/day filters or initially).")
+                    st.warning("The 'Breach Date' column is missing in the incident data. Cannot display detailed breached incidents.")
 
-            # This 'else' correctly corresponds to 'if 'Breach Date' in detailed_breach_source_df.columns:'
-            else:
-                st.warning("The 'Breach Date' column is missing in the incident data. Cannot display detailed breached incidents.")
+            else: # incident data is missing or empty
+                # Check original source only if incident data is missing or empty
+                if 'incident_overview_df' not in st.session_state or st.session_state.incident_overview_df is None or st.session_state.incident_overview_df.empty:
+                    st.info("Incident data not loaded or empty. Please upload incident data to see detailed breached incidents.")
+            report_section_latency("Detailed Breached Incidents", section_started_at)
 
-        else: # incident data is missing or empty
-            # Check original source only if incident data is missing or empty
-            if 'incident_overview_df' not in st.session_state or st.session_state.incident_overview_df is None or st.session_state.incident_overview_df.empty:
-                st.info("Incident data not loaded or empty. Please upload incident data to see detailed breached incidents.")
+        render_detailed_breached_incidents(weekly_breached_incidents_df if 'weekly_breached_incidents_df' in locals() else pd.DataFrame())
 
 
         st.markdown("---") # Visual separator
@@ -2190,10 +2853,12 @@ else:
                         st.caption(f"Warning: Source data is missing essential columns for full detail: {', '.join(missing_essential_source_cols)}.")
 
                     st.write(f"Displaying {len(filtered_overview_df)} records in table with selected columns.") # This len is of the df, not cols
-                    st.dataframe(
-                        filtered_overview_df[current_cols_to_display_incident_tab],
-                        use_container_width=True,
-                        hide_index=True
+                    render_paged_table(
+                        filtered_overview_df,
+                        current_cols_to_display_incident_tab,
+                        "filtered_incident_details_table",
+                        st.session_state.incident_df_version,
+                        use_container_width=True
                     )
             else: # This else corresponds to 'if not filtered_overview_df.empty:' for the multiselect definition
                 # If filtered_overview_df is empty, no column selector or table is shown.
@@ -2225,10 +2890,11 @@ else:
                 ]
                 
                 if not high_priority_incidents_df.empty:
-                    st.dataframe(
+                    render_table(
                         high_priority_incidents_df[[col for col in high_priority_table_cols if col in high_priority_incidents_df.columns]], # Display only available columns
+                        "high_priority_incidents_table",
                         use_container_width=True,
-                        hide_index=True 
+                        hide_index=True
                     )
                 else:
                     st.info("No high-priority incidents (P1 or P2) found based on current filters.")
@@ -2263,7 +2929,7 @@ else:
                 st.error(f"The SR data must contain the following columns to generate the weekly overview: {', '.join(missing_cols)}.")
             else:
                 # Use the new function
-                srs_weekly_combined_df = calculate_srs_created_and_closed_per_week(sr_overview_df)
+                srs_weekly_combined_df = calculate_srs_created_and_closed_per_week(sr_overview_df, fill_gaps=True)
 
                 if srs_weekly_combined_df.empty:
                     st.info("No valid data found to generate the weekly SRs created/closed chart.")
@@ -2310,218 +2976,224 @@ else:
                         st.info("No data available for 'SRs Closed Per Week' chart.")
 
                 st.markdown("---")
-                st.subheader("Filterable SR Data")
-
-                # Prepare data for table display and its filters
-                table_display_df = sr_overview_df.copy() # This is the raw SR data for the table
-                week_map_for_filter = {}
-                week_options_for_multiselect = []
-
-                # Populate week filter options from the combined data used for the chart
-                if 'srs_weekly_combined_df' in locals() and not srs_weekly_combined_df.empty:
-                    if 'WeekDisplay' in srs_weekly_combined_df.columns and 'Year-Week' in srs_weekly_combined_df.columns:
-                        unique_week_options_df = srs_weekly_combined_df[['Year-Week', 'WeekDisplay']].drop_duplicates().sort_values(by='Year-Week')
-                        week_options_for_multiselect = unique_week_options_df['WeekDisplay'].tolist()
-                        for _, row in unique_week_options_df.iterrows():
-                            week_map_for_filter[row['WeekDisplay']] = row['Year-Week']
+                render_open_backlog(sr_overview_df, st.session_state.sr_df_version, "SRs", 'LastModDateTime', SR_CLOSED_STATUSES, ['Status'], "sr")
+
+                st.markdown("---")
+                @st.fragment
+                def render_filterable_sr_data(sr_overview_df, srs_weekly_combined_df):
+                    section_started_at = time.perf_counter()
+                    st.subheader("Filterable SR Data")
+
+                    # Prepare data for table display and its filters
+                    table_display_df = sr_overview_df.copy() # This is the raw SR data for the table
+                    week_map_for_filter = {}
+                    week_options_for_multiselect = []
+
+                    # Populate week filter options from the combined data used for the chart
+                    if 'srs_weekly_combined_df' in locals() and not srs_weekly_combined_df.empty:
+                        if 'WeekDisplay' in srs_weekly_combined_df.columns and 'Year-Week' in srs_weekly_combined_df.columns:
+                            weeks_with_srs_df = srs_weekly_combined_df[srs_weekly_combined_df['Count'] > 0]
+                            unique_week_options_df = weeks_with_srs_df[['Year-Week', 'WeekDisplay']].drop_duplicates().sort_values(by='Year-Week')
+                            week_options_for_multiselect = unique_week_options_df['WeekDisplay'].tolist()
+                            week_map_for_filter = dict(zip(unique_week_options_df['WeekDisplay'], unique_week_options_df['Year-Week']))
                 
-                # The table_display_df needs 'Created On' and 'Year-Week' for filtering logic below
-                if 'Created On' in table_display_df.columns:
-                    table_display_df['Created On'] = pd.to_datetime(table_display_df['Created On'], errors='coerce')
-                    # Keep rows with valid 'Created On' for the table, as filtering is based on this
-                    table_display_df.dropna(subset=['Created On'], inplace=True) 
-                    if not table_display_df.empty:
-                         table_display_df['Year-Week'] = table_display_df['Created On'].dt.strftime('%G-W%V')
-                else:
-                    # If 'Created On' is not in table_display_df, week filtering on it won't work.
-                    # Ensure 'Year-Week' column doesn't cause issues if it was expected.
-                    if 'Year-Week' in table_display_df.columns: # Should not exist if 'Created On' didn't
-                        pass # Or handle appropriately, e.g. disable week filter. For now, it will just be empty.
-
-                col_filter1, col_filter2 = st.columns(2)
-
-                with col_filter1:
-                    selected_week_displays = st.multiselect(
-                        "Filter by Week Period:",
-                        options=week_options_for_multiselect,
-                        default=[]
-                    )
+                    # The table_display_df needs 'Created On' and 'Year-Week' for filtering logic below
+                    if 'Created On' in table_display_df.columns:
+                        table_display_df['Created On'] = pd.to_datetime(table_display_df['Created On'], errors='coerce')
+                        # Keep rows with valid 'Created On' for the table, as filtering is based on this
+                        table_display_df.dropna(subset=['Created On'], inplace=True) 
+                        if not table_display_df.empty:
+                             table_display_df['Year-Week'] = get_iso_week_labels(compute_iso_week_codes(table_display_df['Created On']))['Year-Week'].to_numpy()
+                    else:
+                        # If 'Created On' is not in table_display_df, week filtering on it won't work.
+                        # Ensure 'Year-Week' column doesn't cause issues if it was expected.
+                        if 'Year-Week' in table_display_df.columns: # Should not exist if 'Created On' didn't
+                            pass # Or handle appropriately, e.g. disable week filter. For now, it will just be empty.
+
+                    col_filter1, col_filter2 = st.columns(2)
+
+                    with col_filter1:
+                        selected_week_displays = st.multiselect(
+                            "Filter by Week Period:",
+                            options=week_options_for_multiselect,
+                            default=[]
+                        )
 
-                with col_filter2:
-                    # Corrected min_value and max_value for date_input
-                    min_date_val = table_display_df['Created On'].min().date() if not table_display_df.empty and 'Created On' in table_display_df.columns and not table_display_df['Created On'].dropna().empty else None
-                    max_date_val = table_display_df['Created On'].max().date() if not table_display_df.empty and 'Created On' in table_display_df.columns and not table_display_df['Created On'].dropna().empty else None
-                    selected_day = st.date_input("Filter by Specific Day (Created On):", value=None, min_value=min_date_val, max_value=max_date_val)
-
-                # Apply filters to table_display_df
-                if selected_day:
-                    table_display_df = table_display_df[table_display_df['Created On'].dt.date == selected_day]
-                elif selected_week_displays:
-                    selected_year_weeks_short = [week_map_for_filter[wd] for wd in selected_week_displays if wd in week_map_for_filter]
-                    if selected_year_weeks_short:
-                         table_display_df = table_display_df[table_display_df['Year-Week'].isin(selected_year_weeks_short)]
-
-                # Display total row count using table_display_df
-                st.markdown(f"**Total Displayed SRs:** {len(table_display_df)}")
-
-                # Column selector using table_display_df
-                if not table_display_df.empty:
-                    all_columns = table_display_df.columns.tolist()
-                    # Remove 'Year-Week' from selectable columns if it was added for filtering only
-                    if 'Year-Week' in all_columns:
-                        all_columns.remove('Year-Week')
-
-                    default_cols = ['Service Request', 'Status', 'Created On']
-                    sanitized_default_cols = [col for col in default_cols if col in all_columns]
-
-                    if 'filterable_sr_data_cols_multiselect' not in st.session_state:
-                        st.session_state.filterable_sr_data_cols_multiselect = sanitized_default_cols
-
-                    selected_columns = st.multiselect(
-                        "Select columns to display for Filterable SR Data:",
-                        options=all_columns, # Offer all columns from the filtered DF
-                        default=st.session_state.filterable_sr_data_cols_multiselect,
-                        key="multiselect_filterable_sr_data"
-                    )
-                    st.session_state.filterable_sr_data_cols_multiselect = selected_columns
+                    with col_filter2:
+                        # Corrected min_value and max_value for date_input
+                        min_date_val = table_display_df['Created On'].min().date() if not table_display_df.empty and 'Created On' in table_display_df.columns and not table_display_df['Created On'].dropna().empty else None
+                        max_date_val = table_display_df['Created On'].max().date() if not table_display_df.empty and 'Created On' in table_display_df.columns and not table_display_df['Created On'].dropna().empty else None
+                        selected_day = st.date_input("Filter by Specific Day (Created On):", value=None, min_value=min_date_val, max_value=max_date_val)
+
+                    # Apply filters to table_display_df
+                    if selected_day:
+                        table_display_df = table_display_df[table_display_df['Created On'].dt.date == selected_day]
+                    elif selected_week_displays:
+                        selected_year_weeks_short = [week_map_for_filter[wd] for wd in selected_week_displays if wd in week_map_for_filter]
+                        if selected_year_weeks_short:
+                             table_display_df = table_display_df[table_display_df['Year-Week'].isin(selected_year_weeks_short)]
+
+                    # Display total row count using table_display_df
+                    st.markdown(f"**Total Displayed SRs:** {len(table_display_df)}")
+
+                    # Column selector using table_display_df
+                    if not table_display_df.empty:
+                        all_columns = table_display_df.columns.tolist()
+                        # Remove 'Year-Week' from selectable columns if it was added for filtering only
+                        if 'Year-Week' in all_columns:
+                            all_columns.remove('Year-Week')
+
+                        default_cols = ['Service Request', 'Status', 'Created On']
+                        sanitized_default_cols = [col for col in default_cols if col in all_columns]
+
+                        if 'filterable_sr_data_cols_multiselect' not in st.session_state:
+                            st.session_state.filterable_sr_data_cols_multiselect = sanitized_default_cols
+
+                        selected_columns = st.multiselect(
+                            "Select columns to display for Filterable SR Data:",
+                            options=all_columns, # Offer all columns from the filtered DF
+                            default=st.session_state.filterable_sr_data_cols_multiselect,
+                            key="multiselect_filterable_sr_data"
+                        )
+                        st.session_state.filterable_sr_data_cols_multiselect = selected_columns
 
 
-                    if selected_columns:
-                        st.dataframe(table_display_df[selected_columns], hide_index=True)
+                        if selected_columns:
+                            render_paged_table(table_display_df, selected_columns, "filterable_sr_data_table", st.session_state.sr_df_version)
+                        else:
+                            # Show all (minus internal Year-Week) if no columns are selected but data exists
+                            render_paged_table(table_display_df, [col for col in all_columns if col != 'Year-Week'] if 'Year-Week' in all_columns else table_display_df.columns.tolist(), "filterable_sr_data_table", st.session_state.sr_df_version)
                     else:
-                        # Show all (minus internal Year-Week) if no columns are selected but data exists
-                        st.dataframe(table_display_df[[col for col in all_columns if col != 'Year-Week']] if 'Year-Week' in all_columns else table_display_df, hide_index=True)
-                else:
-                    st.info("No SR data to display based on current filters for Filterable SR Data.")
+                        st.info("No SR data to display based on current filters for Filterable SR Data.")
+                    report_section_latency("Filterable SR Data", section_started_at)
+
+                render_filterable_sr_data(sr_overview_df, srs_weekly_combined_df)
 
                 st.markdown("---") # Separator before the new Closed SRs table
 
-                # --- Closed SRs Table ---
-                st.subheader("Closed Service Requests")
+                @st.fragment
+                def render_closed_srs_table(sr_overview_df):
+                    section_started_at = time.perf_counter()
+                    # --- Closed SRs Table ---
+                    st.subheader("Closed Service Requests")
 
-                # Essential columns for this section
-                essential_cols_closed_sr = ['Status', 'LastModDateTime']
-                missing_essential_cols = [col for col in essential_cols_closed_sr if col not in sr_overview_df.columns]
+                    # Essential columns for this section
+                    essential_cols_closed_sr = ['Status', 'LastModDateTime']
+                    missing_essential_cols = [col for col in essential_cols_closed_sr if col not in sr_overview_df.columns]
 
-                if missing_essential_cols:
-                    st.warning(f"The uploaded SR data is missing the following essential column(s) for the Closed SRs table: {', '.join(missing_essential_cols)}. This table cannot be displayed.")
-                else:
-                    closed_sr_statuses = ["closed", "completed", "cancelled", "approval rejected", "rejected by ps"]
-                    # Filter SRs that have one of the closed statuses
-                    closed_srs_df = sr_overview_df[
-                        sr_overview_df['Status'].astype(str).str.lower().str.strip().isin(closed_sr_statuses)
-                    ].copy()
-
-                    # Convert LastModDateTime to datetime and generate 'Closure-Year-Week'
-                    closed_srs_df['LastModDateTime'] = pd.to_datetime(closed_srs_df['LastModDateTime'], errors='coerce', dayfirst=True)
-                    closed_srs_df.dropna(subset=['LastModDateTime'], inplace=True) # Remove rows where LastModDateTime couldn't be parsed
-
-                    if not closed_srs_df.empty:
-                        closed_srs_df['Closure-Year-Week'] = closed_srs_df['LastModDateTime'].dt.strftime('%G-W%V')
+                    if missing_essential_cols:
+                        st.warning(f"The uploaded SR data is missing the following essential column(s) for the Closed SRs table: {', '.join(missing_essential_cols)}. This table cannot be displayed.")
                     else:
-                        # Ensure the column exists even if empty, for consistency in later steps
-                        closed_srs_df['Closure-Year-Week'] = pd.Series(dtype='str')
-
-
-                    # Prepare week filter options based on LastModDateTime of closed SRs
-                    # This is different from the main week_options_for_multiselect which is based on Created On of all SRs
-                    closed_sr_week_map_for_filter = {}
-                    closed_sr_week_options_for_multiselect = []
-                    if not closed_srs_df.empty and 'Closure-Year-Week' in closed_srs_df.columns:
-                        unique_closed_week_options_df = closed_srs_df[['Closure-Year-Week']].copy()
-                        unique_closed_week_options_df.dropna(subset=['Closure-Year-Week'], inplace=True)
-                        # Apply the _get_week_display_str helper to the 'Closure-Year-Week'
-                        # Ensure _get_week_display_str is available or define it if it's moved/not imported
-                        # For now, assuming _get_week_display_str is accessible
-                        unique_closed_week_options_df['WeekDisplay'] = unique_closed_week_options_df['Closure-Year-Week'].apply(_get_week_display_str)
-                        unique_closed_week_options_df = unique_closed_week_options_df[['Closure-Year-Week', 'WeekDisplay']].drop_duplicates().sort_values(by='Closure-Year-Week')
-
-                        closed_sr_week_options_for_multiselect = unique_closed_week_options_df['WeekDisplay'].tolist()
-                        for _, row in unique_closed_week_options_df.iterrows():
-                            closed_sr_week_map_for_filter[row['WeekDisplay']] = row['Closure-Year-Week']
-
-
-                    col_filter_closed_sr1, col_filter_closed_sr2 = st.columns(2)
-
-                    with col_filter_closed_sr1:
-                        selected_week_displays_closed = st.multiselect(
-                            "Filter Closed SRs by Closure Week Period:",
-                            options=closed_sr_week_options_for_multiselect,
-                            default=[],
-                            key="closed_sr_closure_week_filter"
-                        )
+                        closed_sr_statuses = ["closed", "completed", "cancelled", "approval rejected", "rejected by ps"]
+                        # Filter SRs that have one of the closed statuses
+                        closed_srs_df = sr_overview_df[
+                            sr_overview_df['Status'].astype(str).str.lower().str.strip().isin(closed_sr_statuses)
+                        ].copy()
 
-                    with col_filter_closed_sr2:
-                        min_date_val_closed = closed_srs_df['LastModDateTime'].min().date() if not closed_srs_df.empty and not closed_srs_df['LastModDateTime'].dropna().empty else None
-                        max_date_val_closed = closed_srs_df['LastModDateTime'].max().date() if not closed_srs_df.empty and not closed_srs_df['LastModDateTime'].dropna().empty else None
-                        selected_day_closed = st.date_input(
-                            "Filter Closed SRs by Specific Closure Day:",
-                            value=None,
-                            min_value=min_date_val_closed,
-                            max_value=max_date_val_closed,
-                            key="closed_sr_closure_day_filter"
-                        )
+                        # Convert LastModDateTime to datetime and generate 'Closure-Year-Week'
+                        closed_srs_df['LastModDateTime'] = pd.to_datetime(closed_srs_df['LastModDateTime'], errors='coerce', dayfirst=True)
+                        closed_srs_df.dropna(subset=['LastModDateTime'], inplace=True) # Remove rows where LastModDateTime couldn't be parsed
 
-                    # Apply filters to closed_srs_df
-                    filtered_closed_srs_df = closed_srs_df.copy()
-
-                    if selected_day_closed:
-                        # Ensure LastModDateTime is date part for comparison
-                        filtered_closed_srs_df = filtered_closed_srs_df[filtered_closed_srs_df['LastModDateTime'].dt.date == selected_day_closed]
-                    elif selected_week_displays_closed:
-                        if 'Closure-Year-Week' in filtered_closed_srs_df.columns and closed_sr_week_map_for_filter:
-                            selected_closure_year_weeks_short = [closed_sr_week_map_for_filter[wd] for wd in selected_week_displays_closed if wd in closed_sr_week_map_for_filter]
-                            if selected_closure_year_weeks_short:
-                                filtered_closed_srs_df = filtered_closed_srs_df[filtered_closed_srs_df['Closure-Year-Week'].isin(selected_closure_year_weeks_short)]
-
-                    st.markdown(f"**Total Displayed Closed SRs (filtered by closure date):** {len(filtered_closed_srs_df)}")
-
-                    if not filtered_closed_srs_df.empty: # This is line 2108 approx.
-                        all_closed_columns = filtered_closed_srs_df.columns.tolist() # Line 2109 - Start of block to indent
-                        # Remove internal helper columns from user selection options
-                        # 'Closure-Year-Week' is the one specifically created for this table's filtering.
-                        # 'Year-Week' might exist if it was in the original sr_overview_df from created_on processing.
-                        internal_cols_to_remove = ['Closure-Year-Week', 'Year-Week']
-                        for col_to_remove in internal_cols_to_remove:
-                            if col_to_remove in all_closed_columns:
-                                all_closed_columns.remove(col_to_remove)
-
-                        default_closed_cols = ['Service Request', 'Status', 'Created On', 'LastModDateTime', 'Resolution'] # Example, adjust as needed
-                        sanitized_default_closed_cols = [col for col in default_closed_cols if col in all_closed_columns]
-
-                        if 'closed_sr_data_cols_multiselect' not in st.session_state:
-                            st.session_state.closed_sr_data_cols_multiselect = sanitized_default_closed_cols
-
-                        selected_closed_columns = st.multiselect(
-                            "Select columns to display for Closed SRs:",
-                            options=all_columns,
-                            default=st.session_state.closed_sr_data_cols_multiselect,
-                            key="multiselect_closed_sr_data"
-                        )
-                        st.session_state.closed_sr_data_cols_multiselect = selected_closed_columns
+                        closure_week_codes = compute_iso_week_codes(closed_srs_df['LastModDateTime'])
+                        closed_srs_df['Closure-Year-Week'] = get_iso_week_labels(closure_week_codes)['Year-Week'].to_numpy()
+
+
+                        # Prepare week filter options based on LastModDateTime of closed SRs
+                        # This is different from the main week_options_for_multiselect which is based on Created On of all SRs
+                        closed_sr_week_map_for_filter = {}
+                        closed_sr_week_options_for_multiselect = []
+                        if not closed_srs_df.empty and 'Closure-Year-Week' in closed_srs_df.columns:
+                            # Labels of the distinct closure weeks come from the cached week calendar
+                            unique_closed_week_options_df = get_iso_week_labels(np.unique(closure_week_codes[closure_week_codes >= 0]))
+
+                            closed_sr_week_options_for_multiselect = unique_closed_week_options_df['WeekDisplay'].tolist()
+                            closed_sr_week_map_for_filter = dict(zip(unique_closed_week_options_df['WeekDisplay'], unique_closed_week_options_df['Year-Week']))
 
 
-                        if selected_closed_columns:
-                            st.dataframe(filtered_closed_srs_df[selected_closed_columns], hide_index=True)
+                        col_filter_closed_sr1, col_filter_closed_sr2 = st.columns(2)
+
+                        with col_filter_closed_sr1:
+                            selected_week_displays_closed = st.multiselect(
+                                "Filter Closed SRs by Closure Week Period:",
+                                options=closed_sr_week_options_for_multiselect,
+                                default=[],
+                                key="closed_sr_closure_week_filter"
+                            )
+
+                        with col_filter_closed_sr2:
+                            min_date_val_closed = closed_srs_df['LastModDateTime'].min().date() if not closed_srs_df.empty and not closed_srs_df['LastModDateTime'].dropna().empty else None
+                            max_date_val_closed = closed_srs_df['LastModDateTime'].max().date() if not closed_srs_df.empty and not closed_srs_df['LastModDateTime'].dropna().empty else None
+                            selected_day_closed = st.date_input(
+                                "Filter Closed SRs by Specific Closure Day:",
+                                value=None,
+                                min_value=min_date_val_closed,
+                                max_value=max_date_val_closed,
+                                key="closed_sr_closure_day_filter"
+                            )
+
+                        # Apply filters to closed_srs_df
+                        filtered_closed_srs_df = closed_srs_df.copy()
+
+                        if selected_day_closed:
+                            # Ensure LastModDateTime is date part for comparison
+                            filtered_closed_srs_df = filtered_closed_srs_df[filtered_closed_srs_df['LastModDateTime'].dt.date == selected_day_closed]
+                        elif selected_week_displays_closed:
+                            if 'Closure-Year-Week' in filtered_closed_srs_df.columns and closed_sr_week_map_for_filter:
+                                selected_closure_year_weeks_short = [closed_sr_week_map_for_filter[wd] for wd in selected_week_displays_closed if wd in closed_sr_week_map_for_filter]
+                                if selected_closure_year_weeks_short:
+                                    filtered_closed_srs_df = filtered_closed_srs_df[filtered_closed_srs_df['Closure-Year-Week'].isin(selected_closure_year_weeks_short)]
+
+                        st.markdown(f"**Total Displayed Closed SRs (filtered by closure date):** {len(filtered_closed_srs_df)}")
+
+                        if not filtered_closed_srs_df.empty: # This is line 2108 approx.
+                            all_closed_columns = filtered_closed_srs_df.columns.tolist() # Line 2109 - Start of block to indent
+                            # Remove internal helper columns from user selection options
+                            # 'Closure-Year-Week' is the one specifically created for this table's filtering.
+                            # 'Year-Week' might exist if it was in the original sr_overview_df from created_on processing.
+                            internal_cols_to_remove = ['Closure-Year-Week', 'Year-Week']
+                            for col_to_remove in internal_cols_to_remove:
+                                if col_to_remove in all_closed_columns:
+                                    all_closed_columns.remove(col_to_remove)
+
+                            default_closed_cols = ['Service Request', 'Status', 'Created On', 'LastModDateTime', 'Resolution'] # Example, adjust as needed
+                            sanitized_default_closed_cols = [col for col in default_closed_cols if col in all_closed_columns]
+
+                            if 'closed_sr_data_cols_multiselect' not in st.session_state:
+                                st.session_state.closed_sr_data_cols_multiselect = sanitized_default_closed_cols
+
+                            selected_closed_columns = st.multiselect(
+                                "Select columns to display for Closed SRs:",
+                                options=all_closed_columns,
+                                default=st.session_state.closed_sr_data_cols_multiselect,
+                                key="multiselect_closed_sr_data"
+                            )
+                            st.session_state.closed_sr_data_cols_multiselect = selected_closed_columns
+
+
+                            if selected_closed_columns:
+                                render_paged_table(filtered_closed_srs_df, selected_closed_columns, "closed_srs_table", st.session_state.sr_df_version)
+                            else:
+                                # Show all available (minus internal Year-Week) if no columns are selected but data exists
+                                # Ensure we use the correct list of all_closed_columns (which has helpers removed)
+                                render_paged_table(filtered_closed_srs_df, all_closed_columns if all_closed_columns else filtered_closed_srs_df.columns.tolist(), "closed_srs_table", st.session_state.sr_df_version)
+
+                            # Download button for Closed SRs
+                            # Ensure download uses the correct set of columns (selected or all available for display)
+                            cols_for_download = selected_closed_columns if selected_closed_columns else all_closed_columns
+                            excel_closed_sr_data = generate_excel_download(filtered_closed_srs_df[cols_for_download] if cols_for_download else filtered_closed_srs_df)
+                            st.download_button(
+                                label="📥 Download Closed SRs Data",
+                                data=excel_closed_sr_data,
+                                file_name=f"closed_srs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                key="download_closed_srs"
+                            )
+                        # This else corresponds to 'if not filtered_closed_srs_df.empty:'
                         else:
-                            # Show all available (minus internal Year-Week) if no columns are selected but data exists
-                            # Ensure we use the correct list of all_closed_columns (which has helpers removed)
-                            st.dataframe(filtered_closed_srs_df[all_closed_columns] if all_closed_columns else filtered_closed_srs_df, hide_index=True)
-
-                        # Download button for Closed SRs
-                        # Ensure download uses the correct set of columns (selected or all available for display)
-                        cols_for_download = selected_closed_columns if selected_closed_columns else all_closed_columns
-                        excel_closed_sr_data = generate_excel_download(filtered_closed_srs_df[cols_for_download] if cols_for_download else filtered_closed_srs_df)
-                        st.download_button(
-                            label="📥 Download Closed SRs Data",
-                            data=excel_closed_sr_data,
-                            file_name=f"closed_srs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            key="download_closed_srs"
-                        )
-                    # This else corresponds to 'if not filtered_closed_srs_df.empty:'
-                    else:
-                        st.info("No Closed SR data to display based on current filters.")
+                            st.info("No Closed SR data to display based on current filters.")
+                    report_section_latency("Closed Service Requests", section_started_at)
+
+                render_closed_srs_table(sr_overview_df)
 
     elif selected == "Daily Meeting Report":
         st.title("📅 Daily Meeting Report")
@@ -2529,11 +3201,16 @@ else:
         if 'incident_df' not in st.session_state or st.session_state.incident_df is None:
             st.warning("Please upload the Incident Report Excel file to view this report.")
         else:
-            incident_df = st.session_state.incident_df.copy()
+            # One source for the whole tab: the summary tables are slices of the rollup cube built from the
+            # same frame the row tables filter, so their totals agree (same cube as the Incident Overview tab)
+            daily_source_df = st.session_state.incident_overview_df if st.session_state.incident_overview_df is not None else st.session_state.incident_df
+            incident_df = daily_source_df.copy()
+            incident_cube = get_incident_rollup_cube(daily_source_df, st.session_state.incident_df_version)
+            selected_teams = []
 
             # Team filter for this tab
             if 'Team' in incident_df.columns:
-                all_teams = sorted(incident_df['Team'].dropna().unique())
+                all_teams = get_catalog_options('incident', 'Team')
                 default_teams = ["GPSSA App Team L1", "GPSSA PS Team L3"]
 
                 selected_teams = st.multiselect(
@@ -2544,14 +3221,37 @@ else:
 
                 if selected_teams:
                     incident_df = incident_df[incident_df['Team'].isin(selected_teams)]
+            team_cube_filter = {'Team': selected_teams}
 
             col1, col2 = st.columns(2)
 
             with col1:
                 st.header("📈 Ivanti Daily Backlog Growth")
-                selected_date = st.date_input("Select a date", datetime.now().date())
-                if selected_date:
-                    backlog_growth_df = calculate_daily_backlog_growth(incident_df, selected_date)
+                # Every view is a slice of the created-day x team x Source matrix
+                backlog_matrix = get_backlog_growth_matrix(incident_cube, st.session_state.incident_df_version)
+                backlog_view = st.radio("View", ["Day", "Date range", "Weekly", "Monthly"], horizontal=True, key="backlog_growth_view")
+                selected_date = None
+                range_end_date = None
+                if backlog_view == "Day":
+                    selected_date = st.date_input("Select a date", datetime.now().date())
+                    range_end_date = selected_date
+                elif backlog_view == "Date range":
+                    selected_range = st.date_input(
+                        "Select a date range",
+                        (datetime.now().date() - timedelta(days=6), datetime.now().date()),
+                        key="backlog_growth_range"
+                    )
+                    if selected_range:
+                        selected_date, range_end_date = selected_range[0], selected_range[-1]
+
+                if backlog_view in ("Weekly", "Monthly"):
+                    backlog_rollup_df = rollup_backlog_growth(backlog_matrix, 'W' if backlog_view == "Weekly" else 'M', selected_teams)
+                    if not backlog_rollup_df.empty:
+                        st.dataframe(backlog_rollup_df, hide_index=True)
+                    else:
+                        st.info("No incidents with a valid 'Created On' date and Source.")
+                elif selected_date:
+                    backlog_growth_df = calculate_backlog_growth_from_matrix(backlog_matrix, selected_date, range_end_date, selected_teams)
                     if not backlog_growth_df.empty:
                         st.dataframe(
                             backlog_growth_df.style.apply(
@@ -2559,26 +3259,32 @@ else:
                                 axis=1
                             )
                         )
+                    elif range_end_date != selected_date:
+                        st.info(f"No incidents created between {selected_date.strftime('%Y-%m-%d')} and {range_end_date.strftime('%Y-%m-%d')}.")
                     else:
                         st.info(f"No incidents created on {selected_date.strftime('%Y-%m-%d')}.")
 
             with col2:
                 st.header("📋 Detailed Incidents")
                 if selected_date:
-                    detailed_incidents_df = incident_df[pd.to_datetime(incident_df['Created On'], errors='coerce').dt.date == selected_date]
+                    created_days = pd.to_datetime(incident_df['Created On'], errors='coerce').dt.normalize()
+                    detailed_incidents_df = incident_df[created_days.between(pd.Timestamp(selected_date), pd.Timestamp(range_end_date))]
                     if not detailed_incidents_df.empty:
                         all_columns = detailed_incidents_df.columns.tolist()
                         selected_columns = st.multiselect("Select columns to display", all_columns, default=("Incident","Source","Team","Status","Priority"))
-                        st.dataframe(detailed_incidents_df[selected_columns])
+                        render_table(detailed_incidents_df[selected_columns], "daily_detailed_incidents_table")
                     else:
                         st.info("No detailed incidents to display.")
+                elif backlog_view in ("Weekly", "Monthly"):
+                    st.info("Choose the Day or Date range view to list the incidents behind the counts.")
 
             st.markdown("---")
             col3, col4 = st.columns(2)
 
             with col3:
                 st.header("🔥 Breached Incidents")
-                breached_by_month_df = calculate_breached_incidents_by_month(incident_df)
+                open_breached_filter = {**team_cube_filter, 'Is Breached': [True], 'Status': OPEN_INCIDENT_STATUSES}
+                breached_by_month_df = rollup_counts_with_total(incident_cube, 'Breach Month', 'Month', open_breached_filter)
                 if not breached_by_month_df.empty:
                     st.dataframe(
                         breached_by_month_df.style.apply(
@@ -2588,10 +3294,14 @@ else:
                     )
                 else:
                     st.info("No open breached incidents found.")
+                # Breached incidents without a usable 'Breach Date' have no month but are listed in the details
+                undated_breached = int(rollup_cube_counts(incident_cube, 'Is Breached', open_breached_filter).sum()) - int(breached_by_month_df['Count'].iloc[-1] if not breached_by_month_df.empty else 0)
+                if undated_breached:
+                    st.caption(f"{undated_breached:,} open breached incidents have no Breach Date and are not counted by month.")
 
             with col4:
                 st.header("📋 Detailed Breached Incidents")
-                open_statuses = ['Open', 'In Progress', 'Pending', 'New','Waiting for Information - DIT','Waiting for Verification','Ready for deployment','Waiting for Deployment','Waiting for Verification – DIT','Waiting for Information - Business','Resolved']
+                open_statuses = OPEN_INCIDENT_STATUSES
                 if 'Breach Passed' in incident_df.columns and 'Status' in incident_df.columns:
                     def map_breach_status(status):
                         if isinstance(status, str):
@@ -2603,38 +3313,35 @@ else:
                     if not detailed_breached_df.empty:
                         all_columns = detailed_breached_df.columns.tolist()
                         selected_columns = st.multiselect("Select columns to display", all_columns, default=("Breach Date","Incident","Source","Team","Status","Priority"))
-                        st.dataframe(detailed_breached_df[selected_columns])
+                        render_table(detailed_breached_df[selected_columns], "daily_detailed_breached_table")
                     else:
                         st.info("No detailed breached incidents to display.")
 
             st.header("📊 Incidents Status")
-            active_incidents = incident_df[~incident_df['Status'].isin(['Closed', 'Cancelled'])]
-            if 'Team' in active_incidents.columns:
-                teams = sorted(active_incidents['Team'].dropna().unique())
-
-                if teams:
-                    cols = st.columns(len(teams))
-                    for i, team in enumerate(teams):
-                        with cols[i]:
-                            st.subheader(f"Status for {team}")
-                            team_df = active_incidents[active_incidents['Team'] == team]
-
-                            if not team_df.empty:
-                                status_summary = team_df['Status'].value_counts().reset_index()
-                                status_summary.columns = ['Status', 'Count']
-
-                                # Add a 'Total' row
-                                total_row = pd.DataFrame([{'Status': 'Total', 'Count': status_summary['Count'].sum()}])
-                                status_summary_with_total = pd.concat([status_summary, total_row], ignore_index=True)
-
-                                st.dataframe(
-                                    status_summary_with_total.style.apply(
-                                        lambda x: ['background-color: #bbdefb; font-weight: bold' if x.name == len(status_summary_with_total)-1 else '' for _ in x],
-                                        axis=1
-                                    )
-                                )
-                            else:
-                                st.info(f"No active incidents to display for {team}.")
+            if 'Team' in incident_df.columns:
+                # One (team, status) slice of the cube over the active statuses
+                active_statuses = [status for status in incident_cube['labels']['Status'] if status not in ('Closed', 'Cancelled')]
+                if active_statuses:
+                    team_status_counts = rollup_cube_counts(incident_cube, ['Team', 'Status'], {**team_cube_filter, 'Status': active_statuses})
+                else:
+                    team_status_counts = pd.Series(dtype='int64', index=pd.MultiIndex.from_arrays([[], []], names=['Team', 'Status']), name='Count')
+                # A single status x team grid with totals instead of one table per team
+                status_team_grid = build_status_team_grid(team_status_counts)
+                if not status_team_grid.empty:
+                    # The totals row and column are last; their label changes if a status or team is called 'Total'
+                    total_row_label, total_col_label = status_team_grid.index[-1], status_team_grid.columns[-1]
+                    st.dataframe(
+                        status_team_grid.style.apply(
+                            lambda x: ['background-color: #bbdefb; font-weight: bold' if x.name == total_row_label else '' for _ in x],
+                            axis=1
+                        ).apply(
+                            lambda x: ['font-weight: bold' for _ in x],
+                            subset=[total_col_label]
+                        ),
+                        width="stretch"
+                    )
+                else:
+                    st.info("No active incidents to display for the selected teams.")
             else:
                 # Fallback for if 'Team' column doesn't exist
                 status_pivot_df = calculate_incident_status_summary_with_totals(incident_df)
@@ -2664,77 +3371,126 @@ else:
                 )
 
                 if selected_display_cols:
-                    st.dataframe(active_incident_details_df[selected_display_cols], use_container_width=True, hide_index=True)
+                    render_table(active_incident_details_df[selected_display_cols], "active_incident_details_table", use_container_width=True, hide_index=True)
                 else:
                     st.info("Please select at least one column to display.")
             else:
                 st.info("No active incidents to display based on the current filters.")
 
             st.markdown("---")
-            st.header("Team Progress")
+            @st.fragment
+            def render_team_progress(incident_df, teams_key):
+                section_started_at = time.perf_counter()
+                st.header("Team Progress")
 
-            team_progress_col1, team_progress_col2 = st.columns(2)
+                team_progress_col1, team_progress_col2 = st.columns(2)
 
-            with team_progress_col1:
-                prog_start_date = st.date_input("Start date", datetime.now().date() - timedelta(days=7))
+                with team_progress_col1:
+                    prog_start_date = st.date_input("Start date", datetime.now().date() - timedelta(days=7))
 
-            with team_progress_col2:
-                prog_end_date = st.date_input("End date", datetime.now().date())
+                with team_progress_col2:
+                    prog_end_date = st.date_input("End date", datetime.now().date())
 
-            if 'Last Check By' in incident_df.columns:
-                all_members = sorted(incident_df['Last Check By'].dropna().unique())
-                default_members = ["Anas Hasan  Alrefai", "Alharith Saad Alfki", "Ali Rahamtalla Ali Babiker", "Hadeel Salah Hmdnallah"]
+                if 'Last Check By' in incident_df.columns and 'Last Checked at' in incident_df.columns:
+                    all_members = get_catalog_options('incident', 'Last Check By')
+                    default_members = ["Anas Hasan  Alrefai", "Alharith Saad Alfki", "Ali Rahamtalla Ali Babiker", "Hadeel Salah Hmdnallah"]
 
-                selected_members = st.multiselect(
-                    "Select Members",
-                    options=all_members,
-                    default=[member for member in default_members if member in all_members]
-                )
+                    selected_members = st.multiselect(
+                        "Select Members",
+                        options=all_members,
+                        default=[member for member in default_members if member in all_members]
+                    )
 
-                if prog_start_date and prog_end_date:
-                    team_progress_df = calculate_team_progress(incident_df, prog_start_date, prog_end_date, selected_members)
-                    if not team_progress_df.empty:
-                        # Separate the total row from the data rows
-                        total_row = team_progress_df[team_progress_df['Last Check By'] == 'Total']
-                        data_rows = team_progress_df[team_progress_df['Last Check By'] != 'Total']
-
-                        # Add 'Intellipen Cases' column to data rows, initialized with 0
-                        data_rows['Intellipen Cases'] = 0
-
-                        # Display the editable dataframe for data rows
-                        st.write("Edit Intellipen Cases:")
-                        edited_df = st.data_editor(data_rows)
-
-                        if edited_df is not None:
-                            # Calculate the 'Total' column
-                            edited_df['Total'] = edited_df['Ivanti Incidents'] + edited_df['Intellipen Cases']
-
-                            # Recalculate the 'Total' row
-                            total_ivanti = edited_df['Ivanti Incidents'].sum()
-                            total_intellipen = edited_df['Intellipen Cases'].sum()
-                            total_total = edited_df['Total'].sum()
-
-                            new_total_row = pd.DataFrame([{
-                                'Last Check By': 'Total',
-                                'Ivanti Incidents': total_ivanti,
-                                'Intellipen Cases': total_intellipen,
-                                'Total': total_total
-                            }])
-
-                            # Combine edited data with the new total row
-                            final_df = pd.concat([edited_df, new_total_row], ignore_index=True)
-
-                            # Display the final dataframe with styling
-                            st.dataframe(
-                                final_df.style.apply(
-                                    lambda x: ['background-color: #bbdefb; font-weight: bold' if x.name == len(final_df)-1 else '' for _ in x],
-                                    axis=1
-                                )
+                    if prog_start_date and prog_end_date:
+                        # Range totals and daily sparklines are lookups into the cached prefix sums
+                        team_progress_index = get_team_progress_index(incident_df, st.session_state.incident_df_version, teams_key)
+                        team_progress_df = query_team_progress(team_progress_index, prog_start_date, prog_end_date, selected_members)
+                        if not team_progress_df.empty:
+                            # Separate the total row from the data rows
+                            total_row = team_progress_df[team_progress_df['Last Check By'] == 'Total']
+                            data_rows = team_progress_df[team_progress_df['Last Check By'] != 'Total'].copy()
+
+                            # Add 'Intellipen Cases' column to data rows, initialized with 0
+                            data_rows['Intellipen Cases'] = 0
+                            daily_checks = get_team_progress_sparklines(team_progress_index, prog_start_date, prog_end_date, selected_members)
+                            data_rows['Daily Checks'] = data_rows['Last Check By'].map(daily_checks)
+
+                            # Display the editable dataframe for data rows
+                            st.write("Edit Intellipen Cases:")
+                            edited_df = st.data_editor(
+                                data_rows,
+                                column_config={
+                                    'Daily Checks': st.column_config.LineChartColumn("Daily Checks", y_min=0)
+                                },
+                                disabled=['Last Check By', 'Ivanti Incidents', 'Daily Checks']
                             )
-                    else:
-                        st.info("No team progress data to display for the selected date range and members.")
+
+                            if edited_df is not None:
+                                edited_df = edited_df.drop(columns=['Daily Checks'])
+                                # Calculate the 'Total' column
+                                edited_df['Total'] = edited_df['Ivanti Incidents'] + edited_df['Intellipen Cases']
+
+                                # Recalculate the 'Total' row
+                                total_ivanti = edited_df['Ivanti Incidents'].sum()
+                                total_intellipen = edited_df['Intellipen Cases'].sum()
+                                total_total = edited_df['Total'].sum()
+
+                                new_total_row = pd.DataFrame([{
+                                    'Last Check By': 'Total',
+                                    'Ivanti Incidents': total_ivanti,
+                                    'Intellipen Cases': total_intellipen,
+                                    'Total': total_total
+                                }])
+
+                                # Combine edited data with the new total row
+                                final_df = pd.concat([edited_df, new_total_row], ignore_index=True)
+
+                                # Display the final dataframe with styling
+                                st.dataframe(
+                                    final_df.style.apply(
+                                        lambda x: ['background-color: #bbdefb; font-weight: bold' if x.name == len(final_df)-1 else '' for _ in x],
+                                        axis=1
+                                    )
+                                )
+                        else:
+                            st.info("No team progress data to display for the selected date range and members.")
+                report_section_latency("Team Progress", section_started_at)
+
+            render_team_progress(incident_df, tuple(selected_teams))
+
+# Ticket lookup and debug panel
+with st.sidebar:
+    render_ticket_lookup()
+
+    # Debug panel: filter memo statistics for this session
+    with st.expander("🛠️ Debug: Filter Memo", expanded=False):
+        memo_stats = st.session_state.filter_result_memo.stats()
+        memo_col1, memo_col2, memo_col3 = st.columns(3)
+        memo_col1.metric("Hits", memo_stats['hits'])
+        memo_col2.metric("Misses", memo_stats['misses'])
+        memo_col3.metric("Hit rate", f"{memo_stats['hit_rate']:.0%}")
+        st.caption(
+            f"{memo_stats['entries']} of {memo_stats['max_entries']} entries, "
+            f"{memo_stats['evictions']} evicted, {memo_stats['bytes'] / 1024:.1f} KB of row positions"
+        )
+        if st.button("Clear memo", key="btn_clear_filter_memo"):
+            st.session_state.filter_result_memo.clear()
+            st.rerun()
+
+    # Debug panel: recent section render times, filled in once the full rerun has been measured
+    with st.expander("🛠️ Debug: Render Latency", expanded=False):
+        st.toggle("Show render time under each section", key="show_section_latency")
+        latency_placeholder = st.empty()
 
 st.markdown("---")
+report_section_latency("Full rerun", script_started_at)
+st.session_state.full_rerun_in_progress = False
+# Newest first; fragment-only reruns appear here from the next full rerun on
+latency_placeholder.dataframe(
+    pd.DataFrame(list(reversed(st.session_state.rerun_latency)), columns=['At', 'Section', 'Rerun', 'Render (ms)']),
+    hide_index=True,
+    width="stretch"
+)
 st.markdown(
     """<div style="text-align:center; color:#888; font-size:0.8em;">
     Intellipen SmartQ Test V4.5 | Developed by Ali Babiker | © July 2025
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from utils import AGE_BUCKET_EDGES, get_age_bucket_labels, calculate_age_bucket_counts
+
+def test_get_age_bucket_labels():
+    """Tests for the get_age_bucket_labels function."""
+    print("Running test_get_age_bucket_labels...")
+    assert get_age_bucket_labels(AGE_BUCKET_EDGES) == ['0-2', '3-7', '8-14', '15-30', '31+']
+    assert get_age_bucket_labels([1, 2, 10]) == ['0', '1', '2-9', '10+']
+    assert get_age_bucket_labels([]) == ['0+']
+    print("  Test Case 1 (Default and custom edges) Passed.")
+
+def test_calculate_age_bucket_counts():
+    """Tests for the calculate_age_bucket_counts function."""
+    print("Running test_calculate_age_bucket_counts...")
+    df = pd.DataFrame({
+        'Age (Days)': [0, 2, 3, 7, 8, 14, 15, 30, 31, 400, None],
+        'Type': ['SR', None, 'Incident', 'SR', 'SR', None, 'Incident', 'SR', 'SR', None, 'SR'],
+        'Current User Id': ['bob', 'alice', 'bob', 'bob', 'alice', 'alice', 'bob', 'bob', 'alice', 'bob', 'bob']
+    })
+
+    # Bucket boundaries: 2|3, 7|8, 14|15, 30|31; rows without an age are skipped
+    by_type = calculate_age_bucket_counts(df, 'Type', missing_label='No Ticket')
+    expected = pd.DataFrame(
+        {'Incident': [0, 1, 0, 1, 0], 'No Ticket': [1, 0, 1, 0, 1], 'SR': [1, 1, 1, 1, 1]},
+        index=pd.Index(['0-2', '3-7', '8-14', '15-30', '31+'], name='Age Bucket')
+    )
+    pd.testing.assert_frame_equal(by_type, expected, check_dtype=False, check_column_type=False, check_names=False)
+    assert by_type.columns.name == 'Type'
+    print("  Test Case 1 (Bucket x type with a missing-type label) Passed.")
+
+    # Same counts as bucketing with pd.cut and counting per user
+    by_user = calculate_age_bucket_counts(df, 'Current User Id', edges=[5, 20])
+    bucketed = pd.cut(df['Age (Days)'], [-np.inf, 5, 20, np.inf], right=False, labels=['0-4', '5-19', '20+'])
+    reference = pd.crosstab(bucketed, df['Current User Id'])
+    np.testing.assert_array_equal(by_user.to_numpy(), reference.to_numpy())
+    assert list(by_user.index) == ['0-4', '5-19', '20+']
+    print("  Test Case 2 (Custom edges match pd.cut) Passed.")
+
+    # Rows without a group are skipped unless a missing label is given
+    assert calculate_age_bucket_counts(df, 'Type').to_numpy().sum() == 7
+    empty_counts = calculate_age_bucket_counts(df.iloc[:0], 'Type')
+    assert empty_counts.empty and list(empty_counts.index) == ['0-2', '3-7', '8-14', '15-30', '31+']
+    print("  Test Case 3 (Missing groups and empty input) Passed.")
+
+if __name__ == '__main__':
+    test_get_age_bucket_labels()
+    test_calculate_age_bucket_counts()
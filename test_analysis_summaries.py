@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from utils import compute_analysis_summaries, build_sr_status_breakdown
+
+def test_compute_analysis_summaries():
+    """Tests for the compute_analysis_summaries function."""
+    print("Running test_compute_analysis_summaries...")
+    data = {
+        'Triage Status': ['Pending SR/Incident', 'Pending SR/Incident', 'Not Triaged', 'Pending SR/Incident', 'Pending SR/Incident', 'Pending SR/Incident', 'Pending SR/Incident'],
+        'Type': ['SR', 'SR', None, 'Incident', 'SR', 'Incident', 'SR'],
+        'Status': ['Open', 'Open', None, 'Resolved', 'Closed', 'Resolved', None],
+        'Ticket Number': [14001.0, 14001.0, np.nan, 5001.0, 14002.0, 5002.0, 14003.0],
+    }
+    df = pd.DataFrame(data)
+    summaries = compute_analysis_summaries(df)
+
+    assert summaries['triage'].to_dict('list') == {'Triage Status': ['Pending SR/Incident', 'Not Triaged', 'Total'], 'Count': [6, 1, 7]}
+    assert summaries['type'].to_dict('list') == {'Type': ['SR', 'Incident', 'Total'], 'Count': [4, 2, 6]}
+    print("  Test Case 1 (Triage and type counts with totals) Passed.")
+
+    # Cases Count counts cases, SR Count counts unique tickets; SRs without a Status are left out
+    assert summaries['sr_status'].to_dict('list') == {'Status': ['Closed', 'Open', 'Total'], 'Cases Count': [1, 2, 3], 'SR Count': [1, 1, 2]}
+    assert summaries['incident_status'].to_dict('list') == {'Status': ['Resolved', 'Total'], 'Cases Count': [2, 2], 'Incident Count': [2, 2]}
+    print("  Test Case 2 (Status summaries) Passed.")
+
+    # Matches the per-table value_counts/merge computation
+    rng = np.random.default_rng(7)
+    big = pd.DataFrame({
+        'Triage Status': rng.choice(['A', 'B', None], 500),
+        'Type': rng.choice(['SR', 'Incident', None], 500),
+        'Status': rng.choice(['Open', 'Closed', None], 500),
+        'Ticket Number': rng.choice([1.0, 2.0, 3.0, np.nan], 500),
+    })
+    summaries = compute_analysis_summaries(big)
+    srs = big[big['Type'] == 'SR'].dropna(subset=['Status'])
+    expected_cases = srs['Status'].value_counts().sort_index()
+    expected_tickets = srs.dropna(subset=['Ticket Number'])[['Ticket Number', 'Status']].drop_duplicates()['Status'].value_counts().sort_index()
+    sr_status = summaries['sr_status'].iloc[:-1].set_index('Status')
+    assert sr_status['Cases Count'].to_dict() == expected_cases.to_dict()
+    assert sr_status['SR Count'].to_dict() == expected_tickets.to_dict()
+    assert summaries['triage'].set_index('Triage Status')['Count'].drop('Total').to_dict() == big['Triage Status'].value_counts().to_dict()
+    print("  Test Case 3 (Agreement with separate passes) Passed.")
+
+    empty_summaries = compute_analysis_summaries(df[df['Type'] == 'Incident'].drop(columns=['Status']))
+    assert empty_summaries['sr_status'].empty and empty_summaries['incident_status'].empty
+    print("  Test Case 4 (Missing Status column) Passed.")
+
+def test_build_sr_status_breakdown():
+    """Tests for the build_sr_status_breakdown function."""
+    print("Running test_build_sr_status_breakdown...")
+    df_srs = pd.DataFrame({
+        'Type': 'SR',
+        'Triage Status': 'Pending SR/Incident',
+        'Status': ['Open', 'Waiting for Approval', ' waiting for approval', 'Waiting for Approval', 'Waiting for Approval', None],
+        'Ticket Number': [14001.0, 14002.0, 14002.0, 14003.0, 14004.0, 14005.0],
+        'Pending With': [None, 'Sara Ali', 'Sara Ali', 'Omar Said', None, 'Omar Said'],
+    })
+    summary = compute_analysis_summaries(df_srs)['sr_status']
+    result = build_sr_status_breakdown(df_srs, summary)
+
+    assert result['Status'].tolist() == [
+        ' waiting for approval', '    ↳ Omar Said', '    ↳ Sara Ali',
+        'Open',
+        'Waiting for Approval', '    ↳ Omar Said', '    ↳ Sara Ali',
+        'Total',
+    ]
+    print("  Test Case 1 (Approver rows under every matching status variant) Passed.")
+
+    approver_rows = result[result['Status'] == '    ↳ Sara Ali']
+    assert approver_rows['Cases Count'].tolist() == [2, 2]
+    assert approver_rows['SR Count'].tolist() == [1, 1]
+    assert result.iloc[-1].tolist() == summary.iloc[-1].tolist()
+    print("  Test Case 2 (Case and unique SR counts, Total row kept) Passed.")
+
+    no_approvers = build_sr_status_breakdown(df_srs.drop(columns=['Pending With']), summary)
+    assert no_approvers['Status'].tolist() == summary['Status'].tolist()
+    print("  Test Case 3 (No 'Pending With' column) Passed.")
+
+if __name__ == '__main__':
+    test_compute_analysis_summaries()
+    test_build_sr_status_breakdown()
@@ -0,0 +1,85 @@
+import pandas as pd
+from datetime import datetime
+from utils import (build_incident_rollup_cube, build_backlog_growth_matrix, calculate_backlog_growth_from_matrix,
+                   rollup_backlog_growth, calculate_daily_backlog_growth)
+
+def test_build_backlog_growth_matrix():
+    """Tests for the build_backlog_growth_matrix function."""
+    print("Running test_build_backlog_growth_matrix...")
+    data = {
+        'Created On': [datetime(2023, 1, 1, 9), datetime(2023, 1, 1, 15), datetime(2023, 1, 2), datetime(2023, 1, 9),
+                       datetime(2023, 2, 1), None],
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team A', 'Team A'],
+        'Source': ['Email', 'Phone', 'Email', 'Portal', 'Phone', 'Email'],
+        'Status': ['Open'] * 6
+    }
+    df = pd.DataFrame(data)
+    matrix = build_backlog_growth_matrix(build_incident_rollup_cube(df))
+    assert list(matrix['days']) == [datetime(2023, 1, d).date() for d in (1, 2, 9)] + [datetime(2023, 2, 1).date()]
+    assert list(matrix['sources']) == ['Email', 'Phone', 'Portal']
+    assert matrix['counts'].shape == (4, 3, 3)
+    # Incidents without a creation date are not counted; incidents without a team use the last slot
+    assert matrix['counts'].sum() == 5
+    assert matrix['counts'][2, 2, 2] == 1
+    print("  Test Case 1 (Matrix shape and counts) Passed.")
+
+def test_calculate_backlog_growth_from_matrix():
+    """Tests for the calculate_backlog_growth_from_matrix function."""
+    print("Running test_calculate_backlog_growth_from_matrix...")
+    data = {
+        'Created On': [datetime(2023, 1, 1, 9), datetime(2023, 1, 1, 15), datetime(2023, 1, 2), datetime(2023, 1, 9),
+                       datetime(2023, 2, 1), None],
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team A', 'Team A'],
+        'Source': ['Email', 'Phone', 'Email', 'Portal', 'Phone', 'Email'],
+        'Status': ['Open'] * 6
+    }
+    df = pd.DataFrame(data)
+    matrix = build_backlog_growth_matrix(build_incident_rollup_cube(df))
+
+    # A single day matches the frame-based function
+    day = datetime(2023, 1, 1).date()
+    pd.testing.assert_frame_equal(calculate_backlog_growth_from_matrix(matrix, day), calculate_daily_backlog_growth(df, day))
+    pd.testing.assert_frame_equal(
+        calculate_backlog_growth_from_matrix(matrix, day, teams=['Team A']),
+        calculate_daily_backlog_growth(df[df['Team'] == 'Team A'], day)
+    )
+    print("  Test Case 1 (Single day, with and without a team filter) Passed.")
+
+    result = calculate_backlog_growth_from_matrix(matrix, datetime(2023, 1, 1).date(), datetime(2023, 1, 31).date())
+    expected = pd.DataFrame({'Source': ['Email', 'Phone', 'Portal', 'Total'], 'Count': [2, 1, 1, 4]})
+    pd.testing.assert_frame_equal(result, expected)
+    print("  Test Case 2 (Date range) Passed.")
+
+    result = calculate_backlog_growth_from_matrix(matrix, datetime(2023, 3, 1).date())
+    assert result.empty and list(result.columns) == ['Source', 'Count']
+    print("  Test Case 3 (Day without incidents) Passed.")
+
+def test_rollup_backlog_growth():
+    """Tests for the rollup_backlog_growth function."""
+    print("Running test_rollup_backlog_growth...")
+    data = {
+        'Created On': [datetime(2023, 1, 1, 9), datetime(2023, 1, 1, 15), datetime(2023, 1, 2), datetime(2023, 1, 9),
+                       datetime(2023, 2, 1), None],
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team A', 'Team A'],
+        'Source': ['Email', 'Phone', 'Email', 'Portal', 'Phone', 'Email'],
+        'Status': ['Open'] * 6
+    }
+    df = pd.DataFrame(data)
+    matrix = build_backlog_growth_matrix(build_incident_rollup_cube(df))
+
+    weekly = rollup_backlog_growth(matrix, 'W')
+    assert weekly['Period'].tolist() == [
+        '2022-W52 (Dec 26 - Jan 01, 2023)', '2023-W01 (Jan 02 - Jan 08, 2023)',
+        '2023-W02 (Jan 09 - Jan 15, 2023)', '2023-W05 (Jan 30 - Feb 05, 2023)'
+    ]
+    assert weekly['Total'].tolist() == [2, 1, 1, 1]
+    print("  Test Case 1 (Weekly rollup) Passed.")
+
+    monthly = rollup_backlog_growth(matrix, 'M', teams=['Team A'])
+    assert monthly.to_dict('list') == {'Period': ['2023-01', '2023-02'], 'Email': [2, 0], 'Phone': [0, 1], 'Portal': [0, 0], 'Total': [2, 1]}
+    print("  Test Case 2 (Monthly rollup for a team) Passed.")
+
+if __name__ == '__main__':
+    test_build_backlog_growth_matrix()
+    test_calculate_backlog_growth_from_matrix()
+    test_rollup_backlog_growth()
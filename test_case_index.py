@@ -0,0 +1,40 @@
+import pandas as pd
+from utils import build_case_id_index, search_case_id_prefix, lookup_case_position
+
+def test_search_case_id_prefix():
+    """Tests for build_case_id_index and search_case_id_prefix."""
+    print("Running test_search_case_id_prefix...")
+    case_ids = pd.Series(['CS-1203', 'CS-1200', 'CS-99', 'INC-12', 'CS-120'], index=[40, 41, 42, 43, 44])
+    case_index = build_case_id_index(case_ids)
+
+    matches, total = search_case_id_prefix(case_index, 'CS-120')
+    assert matches == ['CS-120', 'CS-1200', 'CS-1203'] and total == 3
+    print("  Test Case 1 (Prefix matches in sorted order) Passed.")
+
+    matches, total = search_case_id_prefix(case_index, 'CS-', limit=2)
+    assert matches == ['CS-120', 'CS-1200'] and total == 4
+    print("  Test Case 2 (Limit keeps the total) Passed.")
+
+    assert search_case_id_prefix(case_index, '') == (sorted(case_ids), 5)
+    assert search_case_id_prefix(case_index, 'XYZ') == ([], 0)
+    print("  Test Case 3 (Empty and unmatched prefixes) Passed.")
+
+    # Numeric ids are searched by their string form
+    numeric_index = build_case_id_index(pd.Series([1203, 1200, 99, 12]))
+    assert search_case_id_prefix(numeric_index, '120') == ([1200, 1203], 2)
+    print("  Test Case 4 (Numeric ids) Passed.")
+
+def test_lookup_case_position():
+    """Tests for the lookup_case_position function."""
+    print("Running test_lookup_case_position...")
+    df = pd.DataFrame({'Case Id': ['A1', None, 'B2', 'C3'], 'Owner': ['x', 'y', 'z', 'w']}, index=[7, 8, 9, 10])
+    case_index = build_case_id_index(df['Case Id'])
+
+    assert lookup_case_position(case_index, 'B2') == 2
+    assert df.iloc[lookup_case_position(case_index, 'C3')]['Owner'] == 'w'
+    assert lookup_case_position(case_index, 'Z9') is None
+    print("  Test Case 1 (Positions for iloc) Passed.")
+
+if __name__ == '__main__':
+    test_search_case_id_prefix()
+    test_lookup_case_position()
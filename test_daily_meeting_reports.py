@@ -28,6 +28,13 @@ def test_calculate_daily_backlog_growth():
     pd.testing.assert_frame_equal(result, expected, check_dtype=False)
     print("  Test Case 3 (Missing columns) Passed.")
 
+    # The caller's frame is not modified
+    df = pd.DataFrame({'Created On': ['2023-01-01 10:00:00', 'not a date'], 'Source': ['Email', 'Phone']})
+    original = df.copy()
+    calculate_daily_backlog_growth(df, datetime(2023, 1, 1).date())
+    pd.testing.assert_frame_equal(df, original)
+    print("  Test Case 4 (Input not mutated) Passed.")
+
 def test_calculate_breached_incidents_by_month():
     """Tests for the calculate_breached_incidents_by_month function."""
     print("Running test_calculate_breached_incidents_by_month...")
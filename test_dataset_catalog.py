@@ -0,0 +1,37 @@
+import pandas as pd
+from utils import build_dataset_catalog
+
+def test_build_dataset_catalog():
+    """Tests for the build_dataset_catalog function."""
+    print("Running test_build_dataset_catalog...")
+    df = pd.DataFrame({
+        'Team': ['Team B', 'Team A', None, 'Team B'],
+        'Priority': [3, 1, 2, None],
+        'Created': pd.to_datetime(['2024-01-05', None, '2024-01-01', '2024-01-03']),
+        'Mixed': ['x', 1, None, 'y']
+    })
+
+    catalog = build_dataset_catalog(df, ['Team', 'Priority', 'Created', 'Mixed', 'Missing Column'])
+    assert set(catalog.keys()) == {'Team', 'Priority', 'Created', 'Mixed'}
+    print("  Test Case 1 (Missing columns skipped) Passed.")
+
+    # Same options as sorted(df[col].dropna().unique())
+    assert catalog['Team']['unique'] == sorted(df['Team'].dropna().unique())
+    assert catalog['Team']['null_count'] == 1
+    assert (catalog['Team']['min'], catalog['Team']['max']) == ('Team A', 'Team B')
+    assert catalog['Priority']['unique'] == [1.0, 2.0, 3.0]
+    print("  Test Case 2 (Unique values and null counts) Passed.")
+
+    assert catalog['Created']['min'] == pd.Timestamp('2024-01-01')
+    assert catalog['Created']['max'] == pd.Timestamp('2024-01-05')
+    assert catalog['Created']['null_count'] == 1
+    print("  Test Case 3 (Date bounds) Passed.")
+
+    # Unorderable mixes fall back to string ordering
+    assert catalog['Mixed']['unique'] == [1, 'x', 'y']
+    empty_catalog = build_dataset_catalog(pd.DataFrame({'Team': [None, None]}), ['Team'])
+    assert empty_catalog['Team'] == {'unique': [], 'null_count': 2, 'min': None, 'max': None}
+    print("  Test Case 4 (Mixed types and all-null columns) Passed.")
+
+if __name__ == '__main__':
+    test_build_dataset_catalog()
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+from utils import build_categorical_option_masks, apply_categorical_option_masks, calculate_facet_counts
+
+def test_build_categorical_option_masks():
+    """Tests for the build_categorical_option_masks function."""
+    print("Running test_build_categorical_option_masks...")
+    data = {
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team C'],
+        'Status': ['Open', 'Closed', 'In Progress', 'Open', 'Open']
+    }
+    df = pd.DataFrame(data)
+
+    option_masks = build_categorical_option_masks(df, ['Team', 'Status', 'Missing Column'])
+    assert set(option_masks.keys()) == {'Team', 'Status'}
+    assert option_masks['Team']['options'] == ['Team A', 'Team B', 'Team C']
+    np.testing.assert_array_equal(option_masks['Team']['codes'], [0, 1, 0, -1, 2])
+    assert set(option_masks['Team'].keys()) == {'options', 'codes'}
+    print("  Test Case 1 (Options and codes) Passed.")
+
+def test_apply_categorical_option_masks():
+    """Tests for the apply_categorical_option_masks function."""
+    print("Running test_apply_categorical_option_masks...")
+    data = {
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team C'],
+        'Status': ['Open', 'Closed', 'In Progress', 'Open', 'Open'],
+        'Priority': [1, 2, 1, 3, 2]
+    }
+    df = pd.DataFrame(data)
+    option_masks = build_categorical_option_masks(df, ['Team', 'Status', 'Priority'])
+
+    # Same rows as the chained isin filters
+    selections = {'Team': ['Team A', 'Team C'], 'Status': ['Open'], 'Priority': []}
+    result = apply_categorical_option_masks(option_masks, selections, len(df))
+    expected = (df['Team'].isin(['Team A', 'Team C']) & df['Status'].isin(['Open'])).to_numpy()
+    np.testing.assert_array_equal(result, expected)
+    print("  Test Case 1 (OR within a column, AND across columns) Passed.")
+
+    # Empty or missing selections do not filter
+    result = apply_categorical_option_masks(option_masks, {'Team': [], 'Status': None}, len(df))
+    assert result.all()
+    print("  Test Case 2 (Empty selections) Passed.")
+
+    # Selecting only values absent from the data filters everything out
+    result = apply_categorical_option_masks(option_masks, {'Team': ['Team Z']}, len(df))
+    assert not result.any()
+    print("  Test Case 3 (Unknown values) Passed.")
+
+def test_calculate_facet_counts():
+    """Tests for the calculate_facet_counts function."""
+    print("Running test_calculate_facet_counts...")
+    data = {
+        'Team': ['Team A', 'Team B', 'Team A', None, 'Team C'],
+        'Status': ['Open', 'Closed', 'In Progress', 'Open', 'Open'],
+        'Priority': [1, 2, 1, 3, 2]
+    }
+    df = pd.DataFrame(data)
+    option_masks = build_categorical_option_masks(df, ['Team', 'Status', 'Priority'])
+
+    # No active filters: plain value counts
+    facets = calculate_facet_counts(option_masks, {}, len(df))
+    assert facets['Team'] == {'Team A': 2, 'Team B': 1, 'Team C': 1}
+    assert facets['Status'] == {'Closed': 1, 'In Progress': 1, 'Open': 3}
+    print("  Test Case 1 (No active filters) Passed.")
+
+    # Each facet ignores its own filter but honours the others
+    selections = {'Team': ['Team A'], 'Status': ['Open']}
+    facets = calculate_facet_counts(option_masks, selections, len(df))
+    for col in ['Team', 'Status', 'Priority']:
+        other_filters = {c: v for c, v in selections.items() if c != col}
+        other_mask = apply_categorical_option_masks(option_masks, other_filters, len(df))
+        expected = df.loc[other_mask, col].value_counts().to_dict()
+        assert {k: v for k, v in facets[col].items() if v} == expected, f"Facet mismatch for {col}"
+    assert facets['Team'] == {'Team A': 1, 'Team B': 0, 'Team C': 1}
+    print("  Test Case 2 (Counts under the other active filters) Passed.")
+
+if __name__ == '__main__':
+    test_build_categorical_option_masks()
+    test_apply_categorical_option_masks()
+    test_calculate_facet_counts()
@@ -0,0 +1,43 @@
+import numpy as np
+from utils import FilterResultMemo
+
+def test_filter_result_memo():
+    """Tests for the FilterResultMemo LRU."""
+    print("Running test_filter_result_memo...")
+    memo = FilterResultMemo(max_entries=2)
+    calls = []
+
+    def compute(positions):
+        def _compute():
+            calls.append(positions)
+            return positions
+        return _compute
+
+    np.testing.assert_array_equal(memo.get_or_compute(('v1', 'mine'), compute([0, 2])), [0, 2])
+    np.testing.assert_array_equal(memo.get_or_compute(('v1', 'mine'), compute([9])), [0, 2])
+    assert calls == [[0, 2]]
+    assert memo.stats()['hits'] == 1 and memo.stats()['misses'] == 1
+    print("  Test Case 1 (Second lookup is a hit) Passed.")
+
+    memo.get_or_compute(('v1', 'team'), compute([1]))
+    memo.get_or_compute(('v1', 'mine'), compute([9]))   # refreshes 'mine'
+    memo.get_or_compute(('v1', 'all'), compute([0, 1, 2]))  # evicts 'team', the least recently used
+    stats = memo.stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    memo.get_or_compute(('v1', 'team'), compute([1]))
+    assert calls == [[0, 2], [1], [0, 1, 2], [1]]
+    print("  Test Case 2 (LRU eviction) Passed.")
+
+    # A new dataset version is a different key
+    memo.get_or_compute(('v2', 'mine'), compute([3]))
+    assert memo.stats()['misses'] == 5
+    assert memo.stats()['hit_rate'] == 2 / 7
+    assert memo.stats()['bytes'] == 2 * 8
+    print("  Test Case 3 (Statistics) Passed.")
+
+    memo.clear()
+    assert memo.stats() == {'entries': 0, 'max_entries': 2, 'hits': 0, 'misses': 0, 'evictions': 0, 'hit_rate': 0.0, 'bytes': 0}
+    print("  Test Case 4 (Clear) Passed.")
+
+if __name__ == '__main__':
+    test_filter_result_memo()
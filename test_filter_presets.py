@@ -0,0 +1,95 @@
+import os
+import tempfile
+from datetime import date
+import numpy as np
+import pandas as pd
+from utils import compile_filter_mask, load_filter_presets, save_filter_presets, update_filter_preset
+
+def test_compile_filter_mask():
+    """Tests for the compile_filter_mask function."""
+    print("Running test_compile_filter_mask...")
+    data = {
+        'Current User Id': ['ali', 'anas', 'ali', 'omar', 'anas'],
+        'Case Start Date': pd.to_datetime(['2024-05-01 09:00', '2024-05-02 00:00', '2024-05-03 17:30', '2024-05-04 00:00', None]),
+        'Triage Status': ['Pending SR/Incident', 'Not Triaged', 'Pending SR/Incident', 'Not Triaged', 'Pending SR/Incident'],
+        'Type': ['SR', None, 'Incident', None, 'SR'],
+        'Status': ['Open', None, 'Closed', None, 'Open'],
+    }
+    df = pd.DataFrame(data)
+
+    assert compile_filter_mask(df, {}).all()
+    assert compile_filter_mask(df, {'users': [], 'triage_status': 'All', 'type': 'All', 'status': 'All'}).all()
+    print("  Test Case 1 (Empty spec keeps every row) Passed.")
+
+    spec = {'users': ['ali', 'anas'], 'date_range': ['2024-05-01', '2024-05-03'], 'type': 'SR'}
+    np.testing.assert_array_equal(compile_filter_mask(df, spec), [True, False, False, False, False])
+    # Same rows as the step-by-step filter chain
+    chained = df[df['Current User Id'].isin(['ali', 'anas'])]
+    chained = chained[(chained['Case Start Date'].dt.date >= date(2024, 5, 1)) & (chained['Case Start Date'].dt.date <= date(2024, 5, 3))]
+    chained = chained[chained['Type'] == 'SR']
+    assert df[compile_filter_mask(df, spec)].equals(chained)
+    print("  Test Case 2 (Users, date range and type combined) Passed.")
+
+    # Date objects work like ISO strings and the end day is inclusive
+    mask = compile_filter_mask(df, {'date_range': (date(2024, 5, 3), date(2024, 5, 3))})
+    np.testing.assert_array_equal(mask, [False, False, True, False, False])
+    print("  Test Case 3 (Inclusive date range) Passed.")
+
+    np.testing.assert_array_equal(compile_filter_mask(df, {'status': 'None'}), [False, True, False, True, False])
+    np.testing.assert_array_equal(compile_filter_mask(df, {'status': 'Open', 'triage_status': 'Pending SR/Incident'}), [True, False, False, False, True])
+    print("  Test Case 4 (Status 'None' and triage status) Passed.")
+
+def test_filter_presets_round_trip():
+    """Tests for load_filter_presets and save_filter_presets."""
+    print("Running test_filter_presets_round_trip...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'filter_presets.json')
+        assert load_filter_presets(path) == {}
+        print("  Test Case 1 (Missing file) Passed.")
+
+        presets = {'فريق التطبيقات': {'users': ['ali'], 'date_range': [date(2024, 5, 1), date(2024, 5, 3)], 'type': 'SR'}}
+        save_filter_presets(path, presets)
+        loaded = load_filter_presets(path)
+        assert loaded['فريق التطبيقات']['date_range'] == ['2024-05-01', '2024-05-03']
+        df = pd.DataFrame({
+            'Current User Id': ['ali', 'ali', 'anas'],
+            'Case Start Date': pd.to_datetime(['2024-05-01 09:00', '2024-05-03 17:30', '2024-05-02 00:00']),
+            'Type': ['SR', 'Incident', 'SR'],
+        })
+        assert compile_filter_mask(df, loaded['فريق التطبيقات']).tolist() == [True, False, False]
+        print("  Test Case 2 (Round trip with dates and Arabic names) Passed.")
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        assert load_filter_presets(path) == {}
+        print("  Test Case 3 (Unreadable file) Passed.")
+
+def test_update_filter_preset():
+    """Tests for the update_filter_preset function."""
+    print("Running test_update_filter_preset...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'filter_presets.json')
+        save_filter_presets(path, {'Team A': {'users': ['ali']}})
+
+        # Another session saved a preset meanwhile: updating keeps it
+        other_session_presets = load_filter_presets(path)
+        other_session_presets['Team B'] = {'users': ['anas']}
+        save_filter_presets(path, other_session_presets)
+        presets = update_filter_preset(path, 'Team C', {'type': 'SR'})
+        assert set(presets) == {'Team A', 'Team B', 'Team C'}
+        assert load_filter_presets(path) == presets
+        print("  Test Case 1 (Save against the latest file) Passed.")
+
+        presets = update_filter_preset(path, 'Team A')
+        assert set(load_filter_presets(path)) == {'Team B', 'Team C'}
+        update_filter_preset(path, 'Missing')
+        print("  Test Case 2 (Delete) Passed.")
+
+        # Writes go through a temporary file that is swapped in, none is left behind
+        assert os.listdir(tmp_dir) == ['filter_presets.json']
+        print("  Test Case 3 (Atomic replace) Passed.")
+
+if __name__ == '__main__':
+    test_compile_filter_mask()
+    test_filter_presets_round_trip()
+    test_update_filter_preset()
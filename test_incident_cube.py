@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from utils import (build_incident_rollup_cube, rollup_cube_counts, rollup_counts_with_total, OPEN_INCIDENT_STATUSES,
+                   calculate_team_status_summary, calculate_daily_backlog_growth, build_status_team_grid)
+
+def test_build_incident_rollup_cube():
+    """Tests for the build_incident_rollup_cube function."""
+    print("Running test_build_incident_rollup_cube...")
+    data = {
+        'Created On': [datetime(2023, 1, 1, 9), datetime(2023, 1, 1, 15), datetime(2023, 1, 2), None, datetime(2023, 1, 1)],
+        'Team': ['Team A', 'Team B', 'Team A', 'Team A', None],
+        'Status': ['Open', 'Closed', 'Open', 'In Progress', 'Open'],
+        'Priority': [1, 2, 1, 3, 2],
+        'Source': ['Email', 'Phone', 'Email', 'Email', 'Portal'],
+        'Breach Passed': [True, 'yes', 'no', 'Passed', False],
+        'Breach Date': [datetime(2023, 1, 15), datetime(2023, 1, 20), datetime(2023, 2, 10), datetime(2023, 2, 1), None]
+    }
+    df = pd.DataFrame(data)
+    cube = build_incident_rollup_cube(df)
+
+    assert cube['n_rows'] == 5
+    assert cube['counts'].sum() == 5
+    assert list(cube['labels']['Team']) == ['Team A', 'Team B']
+    assert list(cube['labels']['Breach Month']) == ['2023-01', '2023-02']
+    # Columns absent from the input are empty dimensions
+    assert len(cube['labels']['Creator']) == 0
+    assert (cube['codes']['Creator'] == -1).all()
+    print("  Test Case 1 (Labels and cell counts) Passed.")
+
+    # Duplicate combinations collapse into one cell
+    cube = build_incident_rollup_cube(pd.concat([df, df], ignore_index=True))
+    assert len(cube['counts']) == 5
+    assert cube['counts'].tolist() == [2] * 5
+    print("  Test Case 2 (Duplicate rows share a cell) Passed.")
+
+def test_rollup_cube_counts():
+    """Tests for the rollup_cube_counts function."""
+    print("Running test_rollup_cube_counts...")
+    data = {
+        'Team': ['Team A', 'Team B', 'Team A', 'Team A', None],
+        'Status': ['Open', 'Closed', 'Open', 'In Progress', 'Open'],
+        'Priority': [1, 2, 1, 3, 2]
+    }
+    df = pd.DataFrame(data)
+    cube = build_incident_rollup_cube(df)
+
+    # Same table as the groupby over the frame
+    result = rollup_cube_counts(cube, ['Team', 'Status']).reset_index(name='Total Incidents')
+    expected = calculate_team_status_summary(df)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    print("  Test Case 1 (Team x Status) Passed.")
+
+    # Filters restrict the cells; empty filters are ignored
+    result = rollup_cube_counts(cube, 'Team', {'Status': ['Open'], 'Priority': []})
+    assert result.to_dict() == {'Team A': 2}
+    result = rollup_cube_counts(cube, 'Status', {'Team': ['Team Z']})
+    assert result.empty
+    print("  Test Case 2 (Filters) Passed.")
+
+def test_rollup_counts_with_total():
+    """Tests for the rollup_counts_with_total function."""
+    print("Running test_rollup_counts_with_total...")
+    data = {
+        'Created On': [datetime(2023, 1, 1, 9), datetime(2023, 1, 1, 15), datetime(2023, 1, 2), None, datetime(2023, 1, 1)],
+        'Status': ['Open', 'Closed', 'Open', 'In Progress', 'Open'],
+        'Source': ['Email', 'Phone', 'Email', 'Email', 'Portal'],
+        'Breach Passed': [True, 'yes', 'no', 'Passed', False],
+        'Breach Date': [datetime(2023, 1, 15), datetime(2023, 1, 20), datetime(2023, 2, 10), datetime(2023, 2, 1), None]
+    }
+    df = pd.DataFrame(data)
+    cube = build_incident_rollup_cube(df)
+
+    # Daily backlog growth
+    day = datetime(2023, 1, 1).date()
+    result = rollup_counts_with_total(cube, 'Source', 'Source', {'Created Day': [day]})
+    pd.testing.assert_frame_equal(result, calculate_daily_backlog_growth(df.copy(), day))
+    print("  Test Case 1 (Daily backlog growth) Passed.")
+
+    # Open breached incidents per breach month
+    result = rollup_counts_with_total(cube, 'Breach Month', 'Month', {'Is Breached': [True], 'Status': OPEN_INCIDENT_STATUSES})
+    expected = pd.DataFrame({'Month': ['2023-01', '2023-02', 'Total'], 'Count': [1, 1, 2]})
+    pd.testing.assert_frame_equal(result, expected)
+    print("  Test Case 2 (Breached incidents by month) Passed.")
+
+    result = rollup_counts_with_total(cube, 'Source', 'Source', {'Created Day': [datetime(2023, 3, 1).date()]})
+    assert result.empty and list(result.columns) == ['Source', 'Count']
+    print("  Test Case 3 (No matching incidents) Passed.")
+
+def test_build_status_team_grid():
+    """Tests for the build_status_team_grid function."""
+    print("Running test_build_status_team_grid...")
+    df = pd.DataFrame({
+        'Team': ['Team A', 'Team A', 'Team B', 'Team B', 'Team B', 'Team A'],
+        'Status': ['Open', 'Pending', 'Open', 'Open', 'Pending', 'Open']
+    })
+    cube = build_incident_rollup_cube(df)
+    grid = build_status_team_grid(rollup_cube_counts(cube, ['Team', 'Status']))
+
+    assert list(grid.columns) == ['Team A', 'Team B', 'Total']
+    assert list(grid.index) == ['Open', 'Pending', 'Total']
+    assert grid.loc['Open'].tolist() == [2, 2, 4]
+    assert grid.loc['Pending'].tolist() == [1, 1, 2]
+    assert grid.loc['Total'].tolist() == [3, 3, 6]
+    # Same numbers as the pivot of the summary table
+    pivot = pd.crosstab(df['Status'], df['Team'], margins=True, margins_name='Total')
+    pd.testing.assert_frame_equal(grid.sort_index(), pivot.sort_index(), check_names=False, check_dtype=False)
+    print("  Test Case 1 (Status x team grid with totals) Passed.")
+
+    assert build_status_team_grid(rollup_cube_counts(cube, ['Team', 'Status'], {'Team': ['Team Z']})).empty
+    print("  Test Case 2 (No counts) Passed.")
+
+    # A status called 'Total' keeps its own row next to the totals row
+    df = pd.DataFrame({'Team': ['Team A', 'Team A', 'Team B'], 'Status': ['Total', 'Open', 'Total']})
+    grid = build_status_team_grid(rollup_cube_counts(build_incident_rollup_cube(df), ['Team', 'Status']))
+    assert list(grid.index) == ['Total', 'Open', 'Total (all)']
+    assert list(grid.columns) == ['Team A', 'Team B', 'Total (all)']
+    assert grid.loc['Total'].tolist() == [1, 1, 2]
+    assert grid.loc['Total (all)'].tolist() == [2, 1, 3]
+    print("  Test Case 3 (Status named 'Total') Passed.")
+
+def test_build_incident_rollup_cube_wide_keys():
+    """Tests build_incident_rollup_cube when the dimension sizes overflow an int64 cell key."""
+    print("Running test_build_incident_rollup_cube_wide_keys...")
+    rng = np.random.default_rng(0)
+    n_unique = 1500
+    df = pd.DataFrame({
+        'Created On': [datetime(2020, 1, 1) + timedelta(days=i) for i in range(n_unique)],
+        'Team': [f'Team {i}' for i in range(n_unique)],
+        'Status': [f'Status {i}' for i in range(n_unique)],
+        'Priority': list(range(n_unique)),
+        'Source': [f'Source {i}' for i in range(n_unique)],
+        'Creator': [f'Creator {i}' for i in range(n_unique)],
+    })
+    df = pd.concat([df, df.iloc[rng.integers(0, n_unique, 500)]], ignore_index=True)
+    cube = build_incident_rollup_cube(df)
+    assert np.prod([len(cube['labels'][d]) + 1 for d in cube['labels']], dtype=object) >= 2**63
+
+    # Counts agree with a plain groupby despite the key space exceeding int64
+    assert cube['counts'].sum() == len(df)
+    counts = rollup_cube_counts(cube, 'Team')
+    pd.testing.assert_series_equal(counts.sort_index(), df['Team'].value_counts().sort_index(), check_names=False, check_dtype=False)
+    assert rollup_cube_counts(cube, 'Creator', {'Team': ['Team 7']}).to_dict() == {'Creator 7': int((df['Team'] == 'Team 7').sum())}
+    print("  Test Case 1 (Code tuples grouped without an int64 key) Passed.")
+
+if __name__ == '__main__':
+    test_build_incident_rollup_cube()
+    test_build_incident_rollup_cube_wide_keys()
+    test_rollup_cube_counts()
+    test_rollup_counts_with_total()
+    test_build_status_team_grid()
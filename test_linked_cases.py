@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+from utils import build_ticket_case_adjacency, get_linked_tickets, get_ticket_case_positions
+
+def test_build_ticket_case_adjacency():
+    """Tests for the build_ticket_case_adjacency function."""
+    print("Running test_build_ticket_case_adjacency...")
+    data = {
+        'Case Id': ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8'],
+        'Ticket Number': ['INC001', 'SR002', 'INC003', 'SR002', 'INC001', None, 'SR005', 'INC001'],
+        'Type': ['Incident', 'SR', 'Incident', 'SR', 'Incident', 'SR', 'SR', 'Incident'],
+        'Status': ['Open', 'Closed', 'Open', 'Closed', 'Open', None, 'Open', 'Open']
+    }
+    df = pd.DataFrame(data)
+    adjacency = build_ticket_case_adjacency(df)
+
+    expected_tickets = pd.DataFrame({
+        'Ticket Number': ['INC001', 'SR002', 'INC003', 'SR005'],
+        'Type': ['Incident', 'SR', 'Incident', 'SR'],
+        'Status': ['Open', 'Closed', 'Open', 'Open'],
+        'Case Count': [3, 2, 1, 1]
+    })
+    pd.testing.assert_frame_equal(adjacency['tickets'], expected_tickets, check_dtype=False)
+    np.testing.assert_array_equal(adjacency['offsets'], [0, 3, 5, 6, 7])
+    print("  Test Case 1 (Tickets ranked by case count, CSR offsets) Passed.")
+
+    # Linked cases of each ticket, in row order
+    np.testing.assert_array_equal(df['Case Id'].to_numpy()[get_ticket_case_positions(adjacency, 0)], ['C1', 'C5', 'C8'])
+    np.testing.assert_array_equal(df['Case Id'].to_numpy()[get_ticket_case_positions(adjacency, 1)], ['C2', 'C4'])
+    print("  Test Case 2 (Cases of a ticket) Passed.")
+
+def test_get_linked_tickets():
+    """Tests for the get_linked_tickets function."""
+    print("Running test_get_linked_tickets...")
+    data = {
+        'Case Id': ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8'],
+        'Ticket Number': ['INC001', 'SR002', 'INC003', 'SR002', 'INC001', None, 'SR005', 'INC001'],
+        'Type': ['Incident', 'SR', 'Incident', 'SR', 'Incident', 'SR', 'SR', 'Incident'],
+        'Status': ['Open', 'Closed', 'Open', 'Closed', 'Open', None, 'Open', 'Open']
+    }
+    df = pd.DataFrame(data)
+    adjacency = build_ticket_case_adjacency(df)
+
+    assert get_linked_tickets(adjacency, 2)['Ticket Number'].tolist() == ['INC001', 'SR002']
+    assert get_linked_tickets(adjacency, 1)['Ticket Number'].tolist() == ['INC001', 'SR002', 'INC003', 'SR005']
+    assert get_linked_tickets(adjacency, 5).empty
+    print("  Test Case 1 (Threshold slice) Passed.")
+
+    # Same tickets as filtering the displayed rows by 'Case Count' and de-duplicating
+    valid = df['Ticket Number'].notna() & df['Type'].notna()
+    df.loc[valid, 'Case Count'] = df[valid].groupby(['Ticket Number', 'Type'])['Ticket Number'].transform('size')
+    df_display = df.iloc[[1, 2, 4, 5, 6]]
+    for min_cases in [1, 2, 3]:
+        legacy = df_display[(df_display['Case Count'] >= min_cases) & df_display['Ticket Number'].notna()][
+            ['Ticket Number', 'Type', 'Status', 'Case Count']].drop_duplicates()
+        result = get_linked_tickets(adjacency, min_cases, df_display)
+        assert sorted(map(tuple, result.values.tolist())) == sorted(map(tuple, legacy.values.tolist())), f"Mismatch for {min_cases}"
+    # Counts stay those of the whole dataset, not of the filtered view
+    assert get_linked_tickets(adjacency, 2, df_display)['Case Count'].tolist() == [3, 2]
+    print("  Test Case 2 (Restricted to a filtered view) Passed.")
+
+if __name__ == '__main__':
+    test_build_ticket_case_adjacency()
+    test_get_linked_tickets()
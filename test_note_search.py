@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from utils import normalize_note_text, tokenize_note_text, build_note_search_index, search_note_index
+
+def test_normalize_note_text():
+    """Tests for normalize_note_text and tokenize_note_text."""
+    print("Running test_normalize_note_text...")
+    # Alef variants, diacritics, tatweel and teh marbuta fold to one spelling
+    assert normalize_note_text('أحمد') == normalize_note_text('احمد')
+    assert normalize_note_text('مَرْجِعِي') == 'مرجعي'
+    assert normalize_note_text('مرجـــعي') == 'مرجعي'
+    assert normalize_note_text('رسالة') == normalize_note_text('رساله')
+    assert normalize_note_text('١٢٣') == '123'
+    assert normalize_note_text('SAP Down') == 'sap down'
+    assert normalize_note_text(None) == ''
+    print("  Test Case 1 (Arabic and Latin normalisation) Passed.")
+
+    assert tokenize_note_text('Error ORA-12154, see SR#5512') == ['error', 'ora', '12154', 'see', 'sr', '5512']
+    assert tokenize_note_text('الرقم المرجعي') == ['رقم', 'مرجعي']
+    print("  Test Case 2 (Tokens) Passed.")
+
+def test_search_note_index():
+    """Tests for build_note_search_index and search_note_index."""
+    print("Running test_search_note_index...")
+    notes = pd.Series([
+        'رقم مرجعي ١٢٣ للطلب',
+        'Error ORA-12154 in SAP',
+        None,
+        'الرقم المَرجعي',
+        'SAP down, sap restarted',
+    ], index=[10, 20, 30, 40, 50])
+    note_index = build_note_search_index(notes)
+
+    np.testing.assert_array_equal(search_note_index(note_index, 'sap'), [1, 4])
+    np.testing.assert_array_equal(search_note_index(note_index, 'مرجعي'), [0, 3])
+    np.testing.assert_array_equal(search_note_index(note_index, '123'), [0])
+    print("  Test Case 1 (Single terms across scripts) Passed.")
+
+    np.testing.assert_array_equal(search_note_index(note_index, 'ora-12154 SAP'), [1])
+    np.testing.assert_array_equal(search_note_index(note_index, 'sap missing'), [])
+    print("  Test Case 2 (AND queries) Passed.")
+
+    # Matches agree with a brute-force scan
+    for query in ['sap', 'رقم', 'down restarted']:
+        terms = tokenize_note_text(query)
+        expected = [i for i, note in enumerate(notes) if all(t in tokenize_note_text(note) for t in terms)]
+        np.testing.assert_array_equal(search_note_index(note_index, query), expected)
+    np.testing.assert_array_equal(search_note_index(note_index, '  '), np.arange(len(notes)))
+    print("  Test Case 3 (Brute-force agreement and empty query) Passed.")
+
+if __name__ == '__main__':
+    test_normalize_note_text()
+    test_search_note_index()
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from utils import compute_sort_permutation, get_page_bounds, compute_index_fingerprint
+
+def test_compute_sort_permutation():
+    """Tests for the compute_sort_permutation function."""
+    print("Running test_compute_sort_permutation...")
+    df = pd.DataFrame({'Age': [3, None, 1, 3, 2]}, index=[10, 11, 12, 13, 14])
+
+    # Positions match a stable sort_values, with missing values last in both directions
+    np.testing.assert_array_equal(compute_sort_permutation(df['Age']), [2, 4, 0, 3, 1])
+    np.testing.assert_array_equal(compute_sort_permutation(df['Age'], ascending=False), [0, 3, 4, 2, 1])
+    expected = df.sort_values('Age', kind='stable', na_position='last')
+    pd.testing.assert_frame_equal(df.iloc[compute_sort_permutation(df['Age'])], expected)
+    print("  Test Case 1 (Ascending and descending) Passed.")
+
+    # Mixed types fall back to string ordering instead of raising
+    mixed = pd.Series(['b', 1, None, 'a'])
+    np.testing.assert_array_equal(compute_sort_permutation(mixed), [1, 3, 0, 2])
+    print("  Test Case 2 (Mixed types) Passed.")
+
+def test_get_page_bounds():
+    """Tests for the get_page_bounds function."""
+    print("Running test_get_page_bounds...")
+    assert get_page_bounds(120, 50, 1) == (0, 50, 1, 3)
+    assert get_page_bounds(120, 50, 3) == (100, 120, 3, 3)
+    print("  Test Case 1 (First and last page) Passed.")
+
+    assert get_page_bounds(120, 50, 9) == (100, 120, 3, 3)
+    assert get_page_bounds(120, 50, 0) == (0, 50, 1, 3)
+    assert get_page_bounds(0, 50, 2) == (0, 0, 1, 1)
+    print("  Test Case 2 (Out-of-range pages and empty tables) Passed.")
+
+def test_compute_index_fingerprint():
+    """Tests for the compute_index_fingerprint function."""
+    print("Running test_compute_index_fingerprint...")
+    df = pd.DataFrame({'A': range(5), 'B': list('abcde')})
+    assert compute_index_fingerprint(df) == compute_index_fingerprint(df.copy())
+    assert compute_index_fingerprint(df) != compute_index_fingerprint(df.iloc[[0, 2, 4]])
+    assert compute_index_fingerprint(df) != compute_index_fingerprint(df.iloc[::-1])
+    assert compute_index_fingerprint(df) != compute_index_fingerprint(df[['A']])
+    print("  Test Case 1 (Row set, row order and columns) Passed.")
+
+if __name__ == '__main__':
+    test_compute_sort_permutation()
+    test_get_page_bounds()
+    test_compute_index_fingerprint()
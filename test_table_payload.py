@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from utils import trim_table_payload, fit_table_to_payload_budget, estimate_payload_bytes
+
+def test_trim_table_payload():
+    """Tests for the trim_table_payload function."""
+    print("Running test_trim_table_payload...")
+    data = {
+        'Case Id': [101, 102, 103, 104],
+        'Age (Days)': [1.0, 2.0, 3.0, 4.0],
+        'Score': [0.5, 1.0, None, 2.0],
+        'Last Note': ['x' * 500, 'short note', None, 'y' * 300],
+        'Team': ['Team A', 'Team A', 'Team B', 'Team A'],
+        'Breach Passed': [True, None, False, True],
+    }
+    df = pd.DataFrame(data)
+    original = df.copy()
+
+    display_df, truncated = trim_table_payload(df, max_text_chars=100)
+    assert truncated
+    assert display_df['Last Note'].iloc[0] == 'x' * 99 + '…'
+    assert display_df['Last Note'].iloc[1] == 'short note'
+    assert pd.isna(display_df['Last Note'].iloc[2])
+    pd.testing.assert_frame_equal(df, original)
+    print("  Test Case 1 (Long text previewed, input untouched) Passed.")
+
+    assert display_df['Case Id'].dtype.itemsize < df['Case Id'].dtype.itemsize
+    assert pd.api.types.is_integer_dtype(display_df['Age (Days)'])
+    assert display_df['Score'].dtype == df['Score'].dtype
+    assert isinstance(display_df['Team'].dtype, pd.CategoricalDtype)
+    assert display_df['Breach Passed'].tolist() == [True, None, False, True]
+    print("  Test Case 2 (Downcasting) Passed.")
+
+    full_df, truncated = trim_table_payload(df, max_text_chars=None)
+    assert not truncated
+    assert full_df['Last Note'].iloc[0] == 'x' * 500
+    print("  Test Case 3 (Full text) Passed.")
+
+def test_fit_table_to_payload_budget():
+    """Tests for the fit_table_to_payload_budget function."""
+    print("Running test_fit_table_to_payload_budget...")
+    df = pd.DataFrame({'Last Note': ['n' * 1000 + str(i) for i in range(20)]})
+
+    display_df, payload_bytes, truncated, truncated_rows = fit_table_to_payload_budget(df, max_bytes=10**9, max_text_chars=200)
+    assert truncated and display_df['Last Note'].str.len().max() == 200
+    assert truncated_rows == 0
+    assert payload_bytes == estimate_payload_bytes(display_df)
+    print("  Test Case 1 (Within budget keeps the initial preview) Passed.")
+
+    preview_bytes = estimate_payload_bytes(trim_table_payload(df, max_text_chars=40)[0])
+    display_df, payload_bytes, truncated, truncated_rows = fit_table_to_payload_budget(df, max_bytes=preview_bytes, max_text_chars=200, min_text_chars=40)
+    assert display_df['Last Note'].str.len().max() == 40
+    assert truncated_rows == 0 and payload_bytes <= preview_bytes
+    print("  Test Case 2 (Over budget shortens the preview down to the minimum) Passed.")
+
+    # Still over budget at the shortest preview: trailing rows are dropped until it fits
+    df = pd.DataFrame({'Score': np.arange(1000) + 0.5, 'Last Note': ['n' * 100] * 1000})
+    display_df, payload_bytes, truncated, truncated_rows = fit_table_to_payload_budget(df, max_bytes=4000, max_text_chars=200, min_text_chars=40)
+    assert payload_bytes <= 4000 and payload_bytes == estimate_payload_bytes(display_df)
+    assert 0 < len(display_df) < len(df) and truncated_rows == len(df) - len(display_df)
+    assert display_df['Score'].tolist() == df['Score'].iloc[:len(display_df)].tolist()
+    print("  Test Case 3 (Rows dropped down to the budget) Passed.")
+
+    # Full text is never shortened, so only rows are dropped
+    display_df, payload_bytes, truncated, truncated_rows = fit_table_to_payload_budget(df, max_bytes=4000, max_text_chars=None)
+    assert payload_bytes <= 4000 and truncated_rows > 0
+    assert display_df['Last Note'].str.len().min() == 100
+    print("  Test Case 4 (Full text over budget) Passed.")
+
+if __name__ == '__main__':
+    test_trim_table_payload()
+    test_fit_table_to_payload_budget()
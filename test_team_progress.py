@@ -0,0 +1,72 @@
+import pandas as pd
+from datetime import datetime
+from utils import calculate_team_progress, build_team_progress_index, query_team_progress, get_team_progress_sparklines
+
+def test_build_team_progress_index():
+    """Tests for the build_team_progress_index function."""
+    print("Running test_build_team_progress_index...")
+    data = {
+        'Last Checked at': ['2023-01-01 09:00:00', '2023-01-01 17:00:00', '2023-01-03 10:00:00',
+                            '2023-01-04 11:00:00', None, '2023-01-02 08:00:00'],
+        'Last Check By': ['Member A', 'Member B', 'Member A', 'Member A', 'Member B', None]
+    }
+    df = pd.DataFrame(data)
+    original = df.copy()
+    progress_index = build_team_progress_index(df)
+
+    assert list(progress_index['members']) == ['Member A', 'Member B']
+    assert progress_index['daily_counts'].tolist() == [[1, 0, 1, 1], [1, 0, 0, 0]]
+    assert progress_index['cumulative'].tolist() == [[0, 1, 1, 2, 3], [0, 1, 1, 1, 1]]
+    pd.testing.assert_frame_equal(df, original)
+    print("  Test Case 1 (Daily counts, prefix sums, input untouched) Passed.")
+
+def test_query_team_progress():
+    """Tests for the query_team_progress and calculate_team_progress functions."""
+    print("Running test_query_team_progress...")
+    data = {
+        'Last Checked at': ['2023-01-01 09:00:00', '2023-01-01 17:00:00', '2023-01-03 10:00:00',
+                            '2023-01-04 11:00:00', None, '2023-01-02 08:00:00'],
+        'Last Check By': ['Member A', 'Member B', 'Member A', 'Member A', 'Member B', None]
+    }
+    df = pd.DataFrame(data)
+    progress_index = build_team_progress_index(df)
+
+    result = query_team_progress(progress_index, datetime(2023, 1, 1).date(), datetime(2023, 1, 3).date(), [])
+    expected = pd.DataFrame({'Last Check By': ['Member A', 'Member B', 'Total'], 'Ivanti Incidents': [2, 1, 3]})
+    pd.testing.assert_frame_equal(result, expected)
+    print("  Test Case 1 (All members) Passed.")
+
+    result = query_team_progress(progress_index, datetime(2022, 12, 1).date(), datetime(2023, 2, 1).date(), ['Member A'])
+    assert result['Ivanti Incidents'].tolist() == [3, 3]
+    print("  Test Case 2 (Range wider than the data, one member) Passed.")
+
+    result = query_team_progress(progress_index, datetime(2023, 1, 2).date(), datetime(2023, 1, 2).date(), ['Member A', 'Member B'])
+    assert result.empty and list(result.columns) == ['Last Check By', 'Ivanti Incidents']
+    print("  Test Case 3 (No checks in range) Passed.")
+
+    result = calculate_team_progress(df, datetime(2023, 1, 3).date(), datetime(2023, 1, 4).date(), ['Member A'])
+    expected = pd.DataFrame({'Last Check By': ['Member A', 'Total'], 'Ivanti Incidents': [2, 2]})
+    pd.testing.assert_frame_equal(result, expected)
+    print("  Test Case 4 (calculate_team_progress) Passed.")
+
+def test_get_team_progress_sparklines():
+    """Tests for the get_team_progress_sparklines function."""
+    print("Running test_get_team_progress_sparklines...")
+    data = {
+        'Last Checked at': ['2023-01-01 09:00:00', '2023-01-01 17:00:00', '2023-01-03 10:00:00',
+                            '2023-01-04 11:00:00', None, '2023-01-02 08:00:00'],
+        'Last Check By': ['Member A', 'Member B', 'Member A', 'Member A', 'Member B', None]
+    }
+    df = pd.DataFrame(data)
+    progress_index = build_team_progress_index(df)
+
+    sparklines = get_team_progress_sparklines(progress_index, datetime(2022, 12, 31).date(), datetime(2023, 1, 5).date(), ['Member A'])
+    assert sparklines == {'Member A': [0, 1, 0, 1, 1, 0]}
+    sparklines = get_team_progress_sparklines(progress_index, datetime(2023, 1, 2).date(), datetime(2023, 1, 3).date(), [])
+    assert sparklines == {'Member A': [0, 1], 'Member B': [0, 0]}
+    print("  Test Case 1 (Daily counts padded to the range) Passed.")
+
+if __name__ == '__main__':
+    test_build_team_progress_index()
+    test_query_team_progress()
+    test_get_team_progress_sparklines()
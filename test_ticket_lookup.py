@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from utils import normalize_ticket_ids, build_ticket_positions, lookup_ticket, anti_join_ticket_positions, build_open_orphan_tickets
+
+def test_normalize_ticket_ids():
+    """Tests for the normalize_ticket_ids function."""
+    print("Running test_normalize_ticket_ids...")
+    raw_ids = pd.Series(['SR-12345', 12345, 12345.0, 'INC 0099999', 'N/A', None, 123])
+    result = normalize_ticket_ids(raw_ids)
+    expected = pd.Series([12345.0, 12345.0, 12345.0, 99999.0, np.nan, np.nan, np.nan])
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+    print("  Test Case 1 (Strings, numbers and missing ids) Passed.")
+
+def test_build_ticket_positions_and_lookup():
+    """Tests for the build_ticket_positions and lookup_ticket functions."""
+    print("Running test_build_ticket_positions_and_lookup...")
+    case_tickets = pd.Series([20001, None, 15000, 20001, 15000, 20001])
+    sr_ids = pd.Series(['SR-15000', 'SR-15001'])
+    incident_ids = pd.Series(['20001', '20002', None])
+
+    case_positions = build_ticket_positions(case_tickets)
+    assert set(case_positions) == {20001, 15000}
+    np.testing.assert_array_equal(case_positions[20001], [0, 3, 5])
+    print("  Test Case 1 (Row positions per ticket) Passed.")
+
+    ticket_positions = {
+        'Cases': case_positions,
+        'SR': build_ticket_positions(sr_ids),
+        'Incident': build_ticket_positions(incident_ids),
+    }
+    matches = lookup_ticket(ticket_positions, 'SR 15000')
+    np.testing.assert_array_equal(matches['Cases'], [2, 4])
+    np.testing.assert_array_equal(matches['SR'], [0])
+    assert len(matches['Incident']) == 0
+    print("  Test Case 2 (One ticket across the three files) Passed.")
+
+    assert lookup_ticket(ticket_positions, 'not a ticket') == {}
+    assert all(len(positions) == 0 for positions in lookup_ticket(ticket_positions, 99999).values())
+    print("  Test Case 3 (Invalid and unknown tickets) Passed.")
+
+def test_ticket_orphans():
+    """Tests for the anti_join_ticket_positions and build_open_orphan_tickets functions."""
+    print("Running test_ticket_orphans...")
+    case_tickets = pd.Series([15000, 15002, None, 15000, 15009])
+    sr_df = pd.DataFrame({
+        'Service Request': ['SR-15000', 'SR-15001', 'SR-15003', 'SR-15004'],
+        'Status': ['Open', 'In Progress', 'Closed', ' completed '],
+        'Created On': ['01/05/2025', '02/05/2025', '03/05/2025', '04/05/2025']
+    })
+    case_positions = build_ticket_positions(case_tickets)
+    sr_positions = build_ticket_positions(sr_df['Service Request'])
+
+    # SR rows no case references, and case rows whose SR is missing from the status file
+    np.testing.assert_array_equal(anti_join_ticket_positions(sr_positions, case_positions), [1, 2, 3])
+    np.testing.assert_array_equal(anti_join_ticket_positions(case_positions, sr_positions), [1, 4])
+    assert len(anti_join_ticket_positions(case_positions, case_positions)) == 0
+    print("  Test Case 1 (Anti-joins in both directions) Passed.")
+
+    orphans = build_open_orphan_tickets(sr_df, np.array([1, 2, 3]), 'Service Request', 'SR', ['closed', 'completed'])
+    expected = pd.DataFrame({
+        'Ticket Number': [15001],
+        'Type': ['SR'],
+        'Status': ['In Progress'],
+        'Created On': ['02/05/2025']
+    })
+    pd.testing.assert_frame_equal(orphans, expected, check_dtype=False)
+    print("  Test Case 2 (Only open tickets are kept) Passed.")
+
+if __name__ == '__main__':
+    test_normalize_ticket_ids()
+    test_build_ticket_positions_and_lookup()
+    test_ticket_orphans()
@@ -0,0 +1,87 @@
+import datetime
+import numpy as np
+import pandas as pd
+from utils import build_day_slice_index, get_day_positions, calculate_user_type_breakdown, calculate_daily_triage_counts
+
+def test_day_slice_index():
+    """Tests for the build_day_slice_index and get_day_positions functions."""
+    print("Running test_day_slice_index...")
+    dates = pd.Series(pd.to_datetime([
+        '2024-05-02 09:00:00', '2024-05-01 10:00:00', None,
+        '2024-05-02 17:30:00', '2024-05-03 08:15:00', '2024-05-01 23:59:00'
+    ]))
+    day_index = build_day_slice_index(dates)
+
+    # Same rows as comparing the date of every row
+    for day in [datetime.date(2024, 5, 1), datetime.date(2024, 5, 2), datetime.date(2024, 5, 3)]:
+        expected = np.flatnonzero((dates.dt.date == day).to_numpy())
+        np.testing.assert_array_equal(get_day_positions(day_index, day), expected)
+    print("  Test Case 1 (Positions per day) Passed.")
+
+    # Days without rows and NaT rows
+    assert len(get_day_positions(day_index, datetime.date(2024, 4, 30))) == 0
+    assert 2 not in day_index['order']
+    assert len(get_day_positions(day_index, pd.Timestamp('2024-05-02'))) == 2
+    print("  Test Case 2 (Missing days and NaT) Passed.")
+
+def test_calculate_user_type_breakdown():
+    """Tests for the calculate_user_type_breakdown function."""
+    print("Running test_calculate_user_type_breakdown...")
+    df = pd.DataFrame({
+        'Case Id': [1, 2, 3, 4, 5],
+        'Current User Id': ['u2', 'u1', 'u2', 'u1', 'u2'],
+        'Type': ['SR', 'Incident', 'Incident', 'SR', None]
+    })
+    breakdown = calculate_user_type_breakdown(df)
+
+    assert list(breakdown.columns) == ['Current User Id', 'Total', 'SRs', 'Incidents']
+    assert breakdown['Current User Id'].tolist() == ['u1', 'u2', 'TOTAL']
+    assert breakdown['Total'].tolist() == [2, 3, 5]
+    assert breakdown['SRs'].tolist() == [1, 1, 2]
+    assert breakdown['Incidents'].tolist() == [1, 1, 2]
+    print("  Test Case 1 (Counts per user with TOTAL row) Passed.")
+
+    # A single type still yields both count columns
+    breakdown = calculate_user_type_breakdown(df[df['Type'] == 'SR'])
+    assert breakdown['Incidents'].tolist() == [0, 0, 0]
+    assert breakdown['SRs'].tolist() == [1, 1, 2]
+    print("  Test Case 2 (Missing type column) Passed.")
+
+def test_calculate_daily_triage_counts():
+    """Tests for the calculate_daily_triage_counts function."""
+    print("Running test_calculate_daily_triage_counts...")
+    df = pd.DataFrame({
+        'Last Note Date': pd.to_datetime(['2024-05-01 10:00:00', '2024-05-03 08:00:00', '2024-05-03 12:00:00',
+                                          None, '2024-04-01 09:00:00', '2024-05-02 11:00:00']),
+        'Current User Id': ['u1', 'u2', 'u1', 'u1', 'u1', 'u2'],
+        'Triage Status': ['Pending SR/Incident'] * 5 + ['Other'],
+        'Type': ['SR', 'Incident', None, 'SR', 'SR', 'SR']
+    })
+    result = calculate_daily_triage_counts(df, datetime.date(2024, 5, 3), 3)
+
+    assert result['days'] == [datetime.date(2024, 5, 1), datetime.date(2024, 5, 2), datetime.date(2024, 5, 3)]
+    assert result['users'] == ['u1', 'u2']
+    assert result['types'] == ['Incident', 'Other', 'SR']
+    assert result['counts'].shape == (3, 2, 3)
+    assert result['counts'].sum() == 3
+    assert result['counts'][0, 0, 2] == 1
+    assert result['counts'][2, 0, 1] == 1
+    assert result['counts'][2, 1, 0] == 1
+    print("  Test Case 1 (Counts per day, user and type) Passed.")
+
+    # Each day matches the single-day breakdown
+    for offset, day in enumerate(result['days']):
+        day_rows = df[(df['Last Note Date'].dt.date == day) & (df['Triage Status'] == 'Pending SR/Incident')]
+        assert result['counts'][offset].sum() == len(day_rows)
+    print("  Test Case 2 (Consistent with per-day filtering) Passed.")
+
+    # Nothing in the window
+    result = calculate_daily_triage_counts(df, datetime.date(2023, 1, 1), 30)
+    assert len(result['days']) == 30
+    assert result['counts'].sum() == 0
+    print("  Test Case 3 (Empty window) Passed.")
+
+if __name__ == '__main__':
+    test_day_slice_index()
+    test_calculate_user_type_breakdown()
+    test_calculate_daily_triage_counts()
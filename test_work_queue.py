@@ -0,0 +1,63 @@
+import datetime
+import numpy as np
+import pandas as pd
+from utils import build_user_work_queue_index, query_user_work_queue
+
+def test_build_user_work_queue_index():
+    """Tests for the build_user_work_queue_index function."""
+    print("Running test_build_user_work_queue_index...")
+    data = {
+        'Case Id': ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7'],
+        'Current User Id': ['bob', 'alice', 'bob', 'alice', None, 'bob', 'alice'],
+        'Age (Days)': [10, 40, 25, 40, 99, None, 5],
+        'Last Note Date': pd.to_datetime(['2025-06-01', '2025-06-08', '2025-05-20', '2025-06-09', '2025-01-01', '2025-06-10', None])
+    }
+    df = pd.DataFrame(data)
+    queue_index = build_user_work_queue_index(df, today=datetime.date(2025, 6, 10))
+
+    assert list(queue_index['users']) == ['alice', 'bob']
+    np.testing.assert_array_equal(queue_index['offsets'], [0, 3, 6])
+    np.testing.assert_array_equal(queue_index['days_since_last_note'][[0, 2, 5]], [9, 21, 0])
+    assert np.isnan(queue_index['days_since_last_note'][6])
+    print("  Test Case 1 (Users, segments and days since the last note) Passed.")
+
+    # Oldest first; the 40-day tie goes to the staler case, missing ages last
+    np.testing.assert_array_equal(df['Case Id'].to_numpy()[queue_index['orders']['Age (Days)']][:6],
+                                  ['C2', 'C4', 'C7', 'C3', 'C1', 'C6'])
+    np.testing.assert_array_equal(df['Case Id'].to_numpy()[queue_index['orders']['Days Since Last Note']][:6],
+                                  ['C2', 'C4', 'C7', 'C3', 'C1', 'C6'])
+    print("  Test Case 2 (Per-user orderings) Passed.")
+
+def test_query_user_work_queue():
+    """Tests for the query_user_work_queue function."""
+    print("Running test_query_user_work_queue...")
+    data = {
+        'Case Id': ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7'],
+        'Current User Id': ['bob', 'alice', 'bob', 'alice', None, 'bob', 'alice'],
+        'Age (Days)': [10, 40, 25, 40, 99, None, 5],
+        'Last Note Date': pd.to_datetime(['2025-06-01', '2025-06-08', '2025-05-20', '2025-06-09', '2025-01-01', '2025-06-10', None])
+    }
+    df = pd.DataFrame(data)
+    queue_index = build_user_work_queue_index(df, today=datetime.date(2025, 6, 10))
+
+    positions = query_user_work_queue(queue_index, ['bob'], 2, 'Age (Days)')
+    assert df['Case Id'].iloc[positions].tolist() == ['C3', 'C1']
+    print("  Test Case 1 (Top K of one user) Passed.")
+
+    # Every user when none is selected; K larger than a segment returns the whole segment
+    positions = query_user_work_queue(queue_index, [], 10, 'Days Since Last Note')
+    assert df['Case Id'].iloc[positions].tolist() == ['C2', 'C4', 'C7', 'C3', 'C1', 'C6']
+    print("  Test Case 2 (All users, K beyond the segment) Passed.")
+
+    # Same result as sorting each user's cases
+    for user in ['alice', 'bob']:
+        user_cases = df[df['Current User Id'] == user]
+        expected = user_cases.sort_values('Age (Days)', ascending=False, na_position='last', kind='stable')['Age (Days)'].head(2)
+        result = df['Age (Days)'].iloc[query_user_work_queue(queue_index, [user], 2)]
+        assert result.tolist() == expected.tolist()
+    assert len(query_user_work_queue(queue_index, ['nobody'], 3)) == 0
+    print("  Test Case 3 (Matches a full sort, unknown users) Passed.")
+
+if __name__ == '__main__':
+    test_build_user_work_queue_index()
+    test_query_user_work_queue()
@@ -3,6 +3,13 @@ import io
 from datetime import datetime, timedelta # Added timedelta
 import numpy as np
 import re
+import hashlib
+import unicodedata
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 
 # Function to classify and extract ticket info
 def classify_and_extract(note, ticket_regex, sr_min_range, sr_max_range):
@@ -308,7 +315,148 @@ def _get_week_display_str(year_week_str: str) -> str:
         return year_week_str # Fallback if parsing fails (should not happen with correct Year-Week)
 
 
-def calculate_srs_created_per_week(df: pd.DataFrame) -> pd.DataFrame:
+# --- ISO week engine: integer week codes (iso_year * 100 + week) and a cached label calendar ---
+
+def compute_iso_week_codes(dates) -> np.ndarray:
+    """
+    Computes integer ISO week codes (iso_year * 100 + iso_week, e.g. 202301)
+    for a column of dates, vectorized, instead of formatting '%G-W%V' strings.
+
+    Args:
+        dates: A datetime-like Series or array. NaT gives code -1.
+
+    Returns:
+        An np.ndarray of int64 week codes.
+    """
+    days = np.asarray(pd.to_datetime(pd.Series(dates), errors='coerce').to_numpy(dtype='datetime64[D]'))
+    valid = ~np.isnat(days)
+    codes = np.full(len(days), -1, dtype=np.int64)
+    if not valid.any():
+        return codes
+    day_numbers = days[valid].astype(np.int64)
+    # The ISO year of a week is the year of its Thursday (1970-01-01 was a Thursday)
+    thursdays = day_numbers - (day_numbers + 3) % 7 + 3
+    thursday_dates = thursdays.astype('datetime64[D]')
+    iso_years = thursday_dates.astype('datetime64[Y]')
+    iso_weeks = (thursday_dates - iso_years.astype('datetime64[D]')).astype(np.int64) // 7 + 1
+    codes[valid] = (iso_years.astype(np.int64) + 1970) * 100 + iso_weeks
+    return codes
+
+
+def iso_week_start(week_codes) -> np.ndarray:
+    """
+    Returns the Monday (datetime64[D]) starting each ISO week code.
+
+    Args:
+        week_codes: Integer week codes from compute_iso_week_codes.
+
+    Returns:
+        An np.ndarray of datetime64[D] Mondays.
+    """
+    week_codes = np.asarray(week_codes, dtype=np.int64)
+    jan_fourth = (week_codes // 100 - 1970).astype('datetime64[Y]').astype('datetime64[D]') + 3
+    first_monday = jan_fourth - (jan_fourth.astype(np.int64) + 3) % 7
+    return first_monday + (week_codes % 100 - 1) * 7
+
+
+@lru_cache(maxsize=64)
+def get_iso_week_calendar(first_code: int, last_code: int) -> pd.DataFrame:
+    """
+    Builds (once per range) the calendar of every ISO week between two week
+    codes, with the 'Year-Week' and 'WeekDisplay' labels used by the weekly views.
+    The returned DataFrame is shared between callers and must not be modified.
+
+    Args:
+        first_code: The first week code (inclusive).
+        last_code: The last week code (inclusive).
+
+    Returns:
+        A DataFrame with columns ['Week Code', 'Year-Week', 'WeekDisplay'], one
+        row per week in order.
+    """
+    first_monday, last_monday = iso_week_start([first_code, last_code])
+    mondays = np.arange(first_monday, last_monday + 1, 7)
+    mondays_index = pd.DatetimeIndex(mondays)
+    sundays_index = mondays_index + pd.Timedelta(days=6)
+    codes = compute_iso_week_codes(mondays_index)
+    year_weeks = [f"{code // 100}-W{code % 100:02d}" for code in codes]
+    week_displays = [
+        f"{year_week} ({start} - {end})"
+        for year_week, start, end in zip(year_weeks, mondays_index.strftime('%b %d'), sundays_index.strftime('%b %d, %Y'))
+    ]
+    return pd.DataFrame({'Week Code': codes, 'Year-Week': year_weeks, 'WeekDisplay': week_displays})
+
+
+def get_iso_week_labels(week_codes) -> pd.DataFrame:
+    """
+    Looks up the 'Year-Week' and 'WeekDisplay' labels of week codes in the cached
+    calendar (one lookup per row, no date parsing).
+
+    Args:
+        week_codes: Integer week codes; -1 entries get missing labels.
+
+    Returns:
+        A DataFrame with columns ['Year-Week', 'WeekDisplay'] aligned with week_codes.
+    """
+    week_codes = np.asarray(week_codes, dtype=np.int64)
+    valid = week_codes >= 0
+    if not valid.any():
+        return pd.DataFrame({
+            'Year-Week': pd.Series([None] * len(week_codes), dtype='str'),
+            'WeekDisplay': pd.Series([None] * len(week_codes), dtype='str')
+        })
+    valid_codes = week_codes[valid]
+    first_code = int(valid_codes.min())
+    calendar = get_iso_week_calendar(first_code, int(valid_codes.max()))
+    week_offsets = (iso_week_start(valid_codes) - iso_week_start([first_code])[0]).astype(np.int64) // 7
+    year_weeks = np.full(len(week_codes), None, dtype=object)
+    week_displays = np.full(len(week_codes), None, dtype=object)
+    year_weeks[valid] = calendar['Year-Week'].to_numpy()[week_offsets]
+    week_displays[valid] = calendar['WeekDisplay'].to_numpy()[week_offsets]
+    return pd.DataFrame({'Year-Week': pd.Series(year_weeks, dtype='str'), 'WeekDisplay': pd.Series(week_displays, dtype='str')})
+
+
+def count_per_iso_week(week_codes, count_column: str, categories=None, category_column: str = None,
+                       fill_gaps: bool = False) -> pd.DataFrame:
+    """
+    Counts rows per ISO week (and optional category) from integer week codes.
+
+    Args:
+        week_codes: Integer week codes from compute_iso_week_codes; -1 rows are skipped.
+        count_column: Name of the count column in the result.
+        categories: Optional per-row category values, aligned with week_codes.
+        category_column: Name of the category column (required with categories).
+        fill_gaps: If True, weeks (and week/category pairs) with no rows between
+                   the first and last week are included with a count of 0.
+
+    Returns:
+        A DataFrame with columns ['Year-Week', 'WeekDisplay', category_column
+        (optional), count_column], sorted by week then category.
+    """
+    week_codes = np.asarray(week_codes, dtype=np.int64)
+    valid = week_codes >= 0
+    group_columns = ['Week Code'] + ([category_column] if categories is not None else [])
+    frame = pd.DataFrame({'Week Code': week_codes[valid]})
+    if categories is not None:
+        frame[category_column] = np.asarray(categories, dtype=object)[valid]
+
+    counts = frame.groupby(group_columns).size()
+    if fill_gaps and not counts.empty:
+        all_codes = get_iso_week_calendar(int(frame['Week Code'].min()), int(frame['Week Code'].max()))['Week Code']
+        if categories is not None:
+            full_index = pd.MultiIndex.from_product([all_codes, sorted(frame[category_column].unique())], names=group_columns)
+        else:
+            full_index = pd.Index(all_codes, name='Week Code')
+        counts = counts.reindex(full_index, fill_value=0)
+
+    result = counts.reset_index(name=count_column).sort_values(by=group_columns).reset_index(drop=True)
+    labels = get_iso_week_labels(result['Week Code'].to_numpy())
+    result.insert(0, 'Year-Week', labels['Year-Week'])
+    result.insert(1, 'WeekDisplay', labels['WeekDisplay'])
+    return result.drop(columns=['Week Code'])
+
+
+def calculate_srs_created_per_week(df: pd.DataFrame, fill_gaps: bool = False) -> pd.DataFrame:
     """
     Calculates the number of SRs created per week from a DataFrame.
     Now includes categorization by status and a week display string.
@@ -316,6 +464,8 @@ def calculate_srs_created_per_week(df: pd.DataFrame) -> pd.DataFrame:
     Args:
         df: DataFrame containing SR data with a 'Created On' column.
             May optionally contain a 'Status' column.
+        fill_gaps: If True, weeks without SRs between the first and last week
+                   are included with a count of 0 (for charts).
 
     Returns:
         A DataFrame with columns ['Year-Week', 'WeekDisplay', 'StatusCategory' (optional), 'Number of SRs']
@@ -339,53 +489,17 @@ def calculate_srs_created_per_week(df: pd.DataFrame) -> pd.DataFrame:
             cols.insert(2, 'StatusCategory')
         return pd.DataFrame(columns=cols)
 
-    processed_df['Year-Week'] = processed_df['Created On'].dt.strftime('%G-W%V')
+    week_codes = compute_iso_week_codes(processed_df['Created On'])
 
-    group_by_cols = ['Year-Week']
     if 'Status' in processed_df.columns:
-        processed_df['StatusCategory'] = np.select(
+        status_categories = np.select(
             [processed_df['Status'].fillna('').str.lower().isin(['closed', 'cancelled'])],
             ['Closed/Cancelled'],
             default='New/Pending'
         )
-        group_by_cols.append('StatusCategory')
-
-    srs_per_week = processed_df.groupby(group_by_cols).size().reset_index(name='Number of SRs')
-
-    # Add WeekDisplay column
-    if not srs_per_week.empty:
-        srs_per_week['WeekDisplay'] = srs_per_week['Year-Week'].apply(_get_week_display_str)
-    else: # Handle empty srs_per_week after grouping
-        srs_per_week['WeekDisplay'] = pd.Series(dtype='str')
-
-
-    # Sorting
-    sort_cols = ['Year-Week']
-    if 'StatusCategory' in srs_per_week.columns:
-        sort_cols.append('StatusCategory')
-    srs_per_week = srs_per_week.sort_values(by=sort_cols).reset_index(drop=True)
-
-    # Reorder columns to make WeekDisplay appear after Year-Week
-    if 'WeekDisplay' in srs_per_week.columns:
-        all_cols = srs_per_week.columns.tolist()
-        # Remove WeekDisplay and Year-Week to reinsert them at the beginning
-        if 'Year-Week' in all_cols: all_cols.remove('Year-Week')
-        if 'WeekDisplay' in all_cols: all_cols.remove('WeekDisplay')
-
-        final_cols_order = ['Year-Week', 'WeekDisplay'] + all_cols
-        # Ensure all original columns are present in final_cols_order to avoid KeyError
-        # This can happen if srs_per_week was empty and some columns were not created.
-        # A more robust way is to define the full expected order.
-
-        expected_final_cols = ['Year-Week', 'WeekDisplay']
-        if 'StatusCategory' in processed_df.columns: # Check original df for Status presence
-             expected_final_cols.append('StatusCategory')
-        expected_final_cols.append('Number of SRs')
-
-        # Filter final_cols_order to only include columns that actually exist in srs_per_week
-        srs_per_week = srs_per_week[[col for col in expected_final_cols if col in srs_per_week.columns]]
+        return count_per_iso_week(week_codes, 'Number of SRs', status_categories, 'StatusCategory', fill_gaps=fill_gaps)
 
-    return srs_per_week
+    return count_per_iso_week(week_codes, 'Number of SRs', fill_gaps=fill_gaps)
 
 def test_calculate_srs_created_per_week():
     """Tests for the calculate_srs_created_per_week function."""
@@ -520,12 +634,14 @@ def test_calculate_srs_created_per_week():
     print("  Test Case 8 (Year boundary ISO week, with Status) Passed.")
 
     print("All test_calculate_srs_created_per_week tests passed.")
-def calculate_srs_created_and_closed_per_week(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_srs_created_and_closed_per_week(df: pd.DataFrame, fill_gaps: bool = False) -> pd.DataFrame:
     """
     Calculates the number of SRs created and closed per week from a DataFrame.
 
     Args:
         df: DataFrame containing SR data with 'Created On', 'LastModDateTime', and 'Status' columns.
+        fill_gaps: If True, weeks without SRs between the first and last week
+                   are included with a count of 0 for each category (for charts).
 
     Returns:
         A DataFrame with columns ['Year-Week', 'WeekDisplay', 'Count', 'Category']
@@ -549,13 +665,7 @@ def calculate_srs_created_and_closed_per_week(df: pd.DataFrame) -> pd.DataFrame:
         print(f"Warning: Significant number of 'Created On' dates failed to parse ({initial_created_count - parsed_created_count} out of {initial_created_count}).")
 
 
-    if df_created.empty:
-        srs_created_weekly = pd.DataFrame(columns=['Year-Week', 'Count']).astype({'Year-Week': 'str', 'Count': pd.Int64Dtype()})
-    else:
-        df_created['Year-Week'] = df_created['Created On'].dt.strftime('%G-W%V')
-        srs_created_weekly = df_created.groupby('Year-Week').size().reset_index(name='Count') # Count is int here
-    
-    srs_created_weekly['Category'] = 'Created'
+    created_week_codes = compute_iso_week_codes(df_created['Created On'])
 
     # --- SRs Closed ---
     df_closed = df.copy()
@@ -575,41 +685,24 @@ def calculate_srs_created_and_closed_per_week(df: pd.DataFrame) -> pd.DataFrame:
     if initial_closed_count > 0 and parsed_closed_count < initial_closed_count * 0.8: # Example: if more than 20% failed
         print(f"Warning: Significant number of 'LastModDateTime' dates failed to parse for closed SRs ({initial_closed_count - parsed_closed_count} out of {initial_closed_count}).")
 
-    if df_closed.empty:
-        srs_closed_weekly = pd.DataFrame(columns=['Year-Week', 'Count']).astype({'Year-Week': 'str', 'Count': pd.Int64Dtype()})
-    else:
-        df_closed['Year-Week'] = df_closed['LastModDateTime'].dt.strftime('%G-W%V')
-        srs_closed_weekly = df_closed.groupby('Year-Week').size().reset_index(name='Count') # Count is int here
-        
-    srs_closed_weekly['Category'] = 'Closed'
-
-    # Clean up temporary normalized status column if it exists
-    if 'Status_normalized' in df_closed.columns:
-        df_closed = df_closed.drop(columns=['Status_normalized'])
+    closed_week_codes = compute_iso_week_codes(df_closed['LastModDateTime'])
 
-
-    # --- Combine and add WeekDisplay ---
-    combined_df = pd.concat([srs_created_weekly, srs_closed_weekly], ignore_index=True)
-
-    if combined_df.empty:
+    # --- Count both categories in one pass over the integer week codes ---
+    if len(created_week_codes) == 0 and len(closed_week_codes) == 0:
         return pd.DataFrame(columns=['Year-Week', 'WeekDisplay', 'Count', 'Category'])
 
-    # Add WeekDisplay column
-    # Ensure 'Year-Week' column exists before applying _get_week_display_str
-    if 'Year-Week' in combined_df.columns:
-        combined_df['WeekDisplay'] = combined_df['Year-Week'].apply(_get_week_display_str)
-    else: # Should not happen if srs_created_weekly or srs_closed_weekly had data
-        combined_df['WeekDisplay'] = pd.Series(dtype='str')
-
+    combined_df = count_per_iso_week(
+        np.concatenate([created_week_codes, closed_week_codes]),
+        'Count',
+        ['Created'] * len(created_week_codes) + ['Closed'] * len(closed_week_codes),
+        'Category',
+        fill_gaps=fill_gaps
+    )
+    if len(created_week_codes) == 0 or len(closed_week_codes) == 0:
+        # A category without rows keeps the nullable count dtype of the per-category tables
+        combined_df['Count'] = combined_df['Count'].astype(pd.Int64Dtype())
 
-    # Sorting and final column order
-    combined_df = combined_df.sort_values(by=['Year-Week', 'Category']).reset_index(drop=True)
-    
-    final_columns = ['Year-Week', 'WeekDisplay', 'Count', 'Category']
-    # Filter to only include columns that actually exist, in the desired order
-    combined_df = combined_df[[col for col in final_columns if col in combined_df.columns]]
-
-    return combined_df
+    return combined_df[['Year-Week', 'WeekDisplay', 'Count', 'Category']]
 
 
 def test_calculate_srs_created_and_closed_per_week():
@@ -840,7 +933,7 @@ def test_calculate_srs_created_and_closed_per_week():
     print("All test_calculate_srs_created_and_closed_per_week tests passed.")
 
 
-def calculate_incidents_breached_per_week(df: pd.DataFrame, breach_date_col: str = 'Breach Date') -> pd.DataFrame:
+def calculate_incidents_breached_per_week(df: pd.DataFrame, breach_date_col: str = 'Breach Date', fill_gaps: bool = False) -> pd.DataFrame:
     """
     Calculates the number of incidents breached per week from a DataFrame.
 
@@ -848,6 +941,8 @@ def calculate_incidents_breached_per_week(df: pd.DataFrame, breach_date_col: str
         df: DataFrame containing incident data.
         breach_date_col: The name of the column containing the breach dates.
                          Defaults to 'Breach Date'.
+        fill_gaps: If True, weeks without breaches between the first and last
+                   week are included with a count of 0 (for charts).
 
     Returns:
         A DataFrame with columns ['Year-Week', 'WeekDisplay', 'Count']
@@ -901,22 +996,8 @@ def calculate_incidents_breached_per_week(df: pd.DataFrame, breach_date_col: str
     if processed_df.empty:
         return pd.DataFrame(columns=['Year-Week', 'WeekDisplay', 'Count'])
 
-    processed_df['Year-Week'] = processed_df[breach_date_col].dt.strftime('%G-W%V')
-
-    incidents_breached_weekly = processed_df.groupby('Year-Week').size().reset_index(name='Count')
-
-    if not incidents_breached_weekly.empty:
-        incidents_breached_weekly['WeekDisplay'] = incidents_breached_weekly['Year-Week'].apply(_get_week_display_str)
-    else:
-        incidents_breached_weekly['WeekDisplay'] = pd.Series(dtype='str') # Ensure column exists
-
-    incidents_breached_weekly = incidents_breached_weekly.sort_values(by=['Year-Week']).reset_index(drop=True)
-
-    # Reorder columns
-    final_columns = ['Year-Week', 'WeekDisplay', 'Count']
-    incidents_breached_weekly = incidents_breached_weekly[[col for col in final_columns if col in incidents_breached_weekly.columns]]
-
-    return incidents_breached_weekly
+    week_codes = compute_iso_week_codes(processed_df[breach_date_col])
+    return count_per_iso_week(week_codes, 'Count', fill_gaps=fill_gaps)
 
 
 if __name__ == '__main__':
@@ -1067,8 +1148,9 @@ def test_calculate_incidents_breached_per_week():
 
 def calculate_daily_backlog_growth(df, selected_date):
     if 'Created On' in df.columns and 'Source' in df.columns:
-        df['Created On'] = pd.to_datetime(df['Created On'], errors='coerce')
-        daily_backlog = df[df['Created On'].dt.date == selected_date]
+        # Parse into a local Series: the caller's frame is left untouched
+        created_on = pd.to_datetime(df['Created On'], errors='coerce')
+        daily_backlog = df[created_on.dt.date == selected_date]
         if not daily_backlog.empty:
             backlog_counts = daily_backlog.groupby('Source').size().reset_index(name='Count')
             total_row = pd.DataFrame([{'Source': 'Total', 'Count': backlog_counts['Count'].sum()}])
@@ -1161,23 +1243,1630 @@ def test_extract_approver_name():
 
 def calculate_team_progress(df, start_date, end_date, members):
     if 'Last Checked at' in df.columns and 'Last Check By' in df.columns:
-        df['Last Checked at'] = pd.to_datetime(df['Last Checked at'], errors='coerce')
+        return query_team_progress(build_team_progress_index(df), start_date, end_date, members)
 
-        # Filter by date
-        mask = (df['Last Checked at'].dt.date >= start_date) & (df['Last Checked at'].dt.date <= end_date)
-        filtered_df = df.loc[mask]
+    return pd.DataFrame(columns=['Last Check By', 'Ivanti Incidents'])
 
-        # Filter by members
-        if members:
-            filtered_df = filtered_df[filtered_df['Last Check By'].isin(members)]
 
-        if not filtered_df.empty:
-            progress_counts = filtered_df.groupby('Last Check By').size().reset_index(name='Ivanti Incidents')
-            total_row = pd.DataFrame([{'Last Check By': 'Total', 'Ivanti Incidents': progress_counts['Ivanti Incidents'].sum()}])
-            return pd.concat([progress_counts, total_row], ignore_index=True)
+def build_categorical_option_masks(df: pd.DataFrame, columns: list) -> dict:
+    """
+    Precomputes the option codes of each categorical column, from which the
+    row mask of any selection is one np.isin over the codes. Only one int array
+    per column is kept, however many distinct values it has.
 
-    return pd.DataFrame(columns=['Last Check By', 'Ivanti Incidents'])
+    Args:
+        df: Input DataFrame.
+        columns: Columns to index. Columns missing from df are skipped.
+
+    Returns:
+        A dict mapping each column to {'options', 'codes'}, where 'options'
+        are the sorted distinct non-null values and 'codes' is the per-row
+        position into 'options' (-1 for nulls).
+    """
+    option_masks = {}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[col], sort=True)
+        option_masks[col] = {'options': list(uniques), 'codes': codes}
+    return option_masks
+
+
+def apply_categorical_option_masks(option_masks: dict, selections: dict, n_rows: int) -> np.ndarray:
+    """
+    Combines the selections over the precomputed option codes into a single row mask.
+
+    Selected options of one column are OR-ed together and the columns are
+    AND-ed, matching a chain of `isin` filters. A column whose selection is
+    empty (or which is not indexed) does not filter.
+
+    Args:
+        option_masks: Output of build_categorical_option_masks.
+        selections: Mapping of column -> list of selected values.
+        n_rows: Number of rows in the indexed DataFrame.
+
+    Returns:
+        A boolean array of length n_rows.
+    """
+    combined_mask = np.ones(n_rows, dtype=bool)
+    for col, selected_values in selections.items():
+        column_mask = _option_selection_mask(option_masks.get(col), selected_values, n_rows)
+        if column_mask is not None:
+            combined_mask &= column_mask
+    return combined_mask
+
+
+def _option_selection_mask(column_index, selected_values, n_rows):
+    """Returns the rows whose code is one of the selected options, or None when the column does not filter."""
+    if not selected_values or column_index is None:
+        return None
+    option_positions = {option: i for i, option in enumerate(column_index['options'])}
+    selected_option_positions = [option_positions[value] for value in selected_values if value in option_positions]
+    if not selected_option_positions:
+        return np.zeros(n_rows, dtype=bool)
+    return np.isin(column_index['codes'], selected_option_positions)
+
+
+def calculate_facet_counts(option_masks: dict, selections: dict, n_rows: int) -> dict:
+    """
+    Counts, for every option of every indexed column, how many rows would match
+    if that option were selected while the filters on the *other* columns stay
+    as they are.
+
+    All facets are computed in one grouped pass: a row counts towards a facet
+    when it passes every filter, or fails only that facet's own filter. The
+    eligible codes of all columns are offset into one shared code space and
+    counted with a single np.bincount.
+
+    Args:
+        option_masks: Output of build_categorical_option_masks.
+        selections: Mapping of column -> list of selected values.
+        n_rows: Number of rows in the indexed DataFrame.
+
+    Returns:
+        A dict mapping each column to {option: count}.
+    """
+    columns = list(option_masks.keys())
+    if not columns:
+        return {}
+
+    pass_masks = []
+    for col in columns:
+        column_mask = _option_selection_mask(option_masks[col], selections.get(col), n_rows)
+        pass_masks.append(np.ones(n_rows, dtype=bool) if column_mask is None else column_mask)
+    fail_counts = np.sum(~np.vstack(pass_masks), axis=0)
+
+    offsets = np.cumsum([0] + [len(option_masks[col]['options']) for col in columns])
+    eligible_codes = []
+    for i, col in enumerate(columns):
+        codes = option_masks[col]['codes']
+        eligible = ((fail_counts == 0) | ((fail_counts == 1) & ~pass_masks[i])) & (codes >= 0)
+        eligible_codes.append(codes[eligible] + offsets[i])
+    counts = np.bincount(np.concatenate(eligible_codes), minlength=offsets[-1])
+
+    return {
+        col: dict(zip(option_masks[col]['options'], counts[offsets[i]:offsets[i + 1]].tolist()))
+        for i, col in enumerate(columns)
+    }
+
+
+def build_dataset_catalog(df: pd.DataFrame, columns: list) -> dict:
+    """
+    Scans the given columns once and records what widgets need from them:
+    the sorted unique non-null values, the null count and the min/max.
+
+    Args:
+        df: The source DataFrame.
+        columns: Columns to catalog. Columns missing from df are skipped.
+
+    Returns:
+        A dict mapping each column to {'unique', 'null_count', 'min', 'max'}.
+        'min' and 'max' are None when the column has no comparable values.
+    """
+    catalog = {}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        series = df[col]
+        non_null = series.dropna()
+        unique_values = non_null.unique()
+        try:
+            unique_values = sorted(unique_values.tolist())
+        except TypeError:
+            unique_values = sorted(unique_values.tolist(), key=str)
+
+        if non_null.empty:
+            col_min, col_max = None, None
+        elif pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            col_min, col_max = non_null.min(), non_null.max()
+        else:
+            col_min, col_max = (unique_values[0], unique_values[-1]) if unique_values else (None, None)
+
+        catalog[col] = {
+            'unique': unique_values,
+            'null_count': int(series.isna().sum()),
+            'min': col_min,
+            'max': col_max,
+        }
+    return catalog
+
+
+def compute_sort_permutation(series: pd.Series, ascending: bool = True) -> np.ndarray:
+    """
+    Computes the row order that sorts a column, so a table can be paged in
+    sorted order without re-sorting (or copying) the whole DataFrame.
+
+    The sort is stable and puts missing values last. Columns whose values
+    cannot be compared with each other (mixed types) are sorted by their
+    string representation.
+
+    Args:
+        series: The column to sort by.
+        ascending: Sort direction.
+
+    Returns:
+        An array of row positions (suitable for .iloc) in sorted order.
+    """
+    values = series.reset_index(drop=True)
+    try:
+        ordered = values.sort_values(ascending=ascending, kind='stable', na_position='last')
+    except TypeError:
+        ordered = values.where(values.isna(), values.astype(str)).sort_values(
+            ascending=ascending, kind='stable', na_position='last'
+        )
+    return ordered.index.to_numpy()
+
+
+def get_page_bounds(total_rows: int, page_size: int, page_number: int) -> tuple:
+    """
+    Clamps a 1-based page number to the available pages and returns the row
+    range it covers.
+
+    Args:
+        total_rows: Number of rows in the table.
+        page_size: Rows per page (must be positive).
+        page_number: Requested 1-based page number.
+
+    Returns:
+        A tuple (start, stop, page_number, n_pages) where rows[start:stop] is
+        the page and page_number is the clamped page actually shown.
+    """
+    n_pages = max(1, -(-total_rows // page_size))
+    page_number = min(max(1, page_number), n_pages)
+    start = (page_number - 1) * page_size
+    stop = min(start + page_size, total_rows)
+    return start, stop, page_number, n_pages
+
+
+def compute_index_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Returns a short digest of a DataFrame's row labels and columns. Two frames
+    taken from the same dataset version with the same rows in the same order
+    share a fingerprint, which makes it a cheap cache key for per-table
+    computations such as sort permutations.
+
+    Args:
+        df: The DataFrame to fingerprint.
+
+    Returns:
+        A hex digest string.
+    """
+    row_hashes = pd.util.hash_pandas_object(df.index, index=False).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def estimate_payload_bytes(df: pd.DataFrame) -> int:
+    """
+    Estimates how many bytes a DataFrame costs to serialise, using its deep
+    memory usage (string contents included).
+
+    Args:
+        df: The DataFrame to measure.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def trim_table_payload(df: pd.DataFrame, max_text_chars: int = None) -> tuple:
+    """
+    Builds a lighter copy of a table for display. Integer columns (and float
+    columns holding only whole numbers) are downcast to the smallest integer
+    type, repetitive text columns become categoricals, and, when
+    max_text_chars is given, longer strings are cut to a preview ending in '…'.
+
+    Args:
+        df: The table to display. It is not modified.
+        max_text_chars: Maximum characters kept per string, or None to keep
+                        full text.
+
+    Returns:
+        A tuple (display_df, truncated) where truncated tells whether any
+        string was shortened.
+    """
+    display_df = df.copy()
+    truncated = False
+    for col in display_df.columns:
+        series = display_df[col]
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+            display_df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            if series.notna().all() and np.array_equal(series.to_numpy(), np.floor(series.to_numpy())):
+                display_df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            is_str = series.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+            if max_text_chars is not None and is_str.any():
+                lengths = np.zeros(len(series), dtype=np.int64)
+                lengths[is_str] = series[is_str].str.len().to_numpy()
+                too_long = lengths > max_text_chars
+                if too_long.any():
+                    truncated = True
+                    values = series.to_numpy(dtype=object, copy=True)
+                    values[too_long] = [value[:max_text_chars - 1] + '…' for value in values[too_long]]
+                    series = pd.Series(values, index=series.index, name=series.name)
+            is_text = bool((is_str | series.isna().to_numpy()).all())
+            if is_text and len(series) and series.nunique(dropna=True) <= len(series) // 2:
+                series = series.astype('category')
+            display_df[col] = series
+    return display_df, truncated
+
+
+def fit_table_to_payload_budget(df: pd.DataFrame, max_bytes: int, max_text_chars: int = 200,
+                                min_text_chars: int = 40) -> tuple:
+    """
+    Trims a table (see trim_table_payload) and, while it is still over the
+    byte budget, halves the text preview length down to min_text_chars. If the
+    shortest preview is still over budget, trailing rows are dropped until the
+    table fits.
+
+    Args:
+        df: The table to display.
+        max_bytes: Payload budget in bytes.
+        max_text_chars: Initial preview length for strings, or None to keep
+                        full text (rows are then dropped to meet the budget).
+        min_text_chars: Shortest preview the budget may force.
+
+    Returns:
+        A tuple (display_df, payload_bytes, truncated, truncated_rows) where
+        truncated_rows is the number of trailing rows left out.
+    """
+    display_df, truncated = trim_table_payload(df, max_text_chars)
+    payload_bytes = estimate_payload_bytes(display_df)
+    while max_text_chars is not None and payload_bytes > max_bytes and max_text_chars > min_text_chars:
+        max_text_chars = max(min_text_chars, max_text_chars // 2)
+        display_df, truncated = trim_table_payload(df, max_text_chars)
+        payload_bytes = estimate_payload_bytes(display_df)
+
+    # Keep the leading rows that fit, scaling by the average row size until within budget.
+    # The kept rows are trimmed again so categoricals don't carry the dropped rows' categories.
+    while payload_bytes > max_bytes and len(display_df):
+        kept_rows = min(len(display_df) - 1, int(len(display_df) * max_bytes / payload_bytes))
+        display_df, truncated = trim_table_payload(df.iloc[:kept_rows], max_text_chars)
+        payload_bytes = estimate_payload_bytes(display_df)
+    return display_df, payload_bytes, truncated, len(df) - len(display_df)
+
+
+def build_case_id_index(case_ids: pd.Series) -> dict:
+    """
+    Builds a lookup index over a column of case ids: the ids sorted by their
+    string form (for prefix search) and a map from each id to its row position.
+
+    Args:
+        case_ids: The 'Case Id' column. Row positions refer to its order.
+
+    Returns:
+        A dict with 'sorted_keys' (ids as strings, sorted), 'sorted_ids'
+        (original ids in the same order) and 'position_by_id' (id -> first
+        row position).
+    """
+    ids = case_ids.to_numpy(dtype=object)
+    present = ~pd.isna(ids)
+    positions = np.flatnonzero(present)
+    keys = np.array([str(case_id) for case_id in ids[present]], dtype=str)
+    order = np.argsort(keys, kind='stable')
+
+    position_by_id = {}
+    for position in positions[::-1]:
+        position_by_id[ids[position]] = int(position)
+
+    return {
+        'sorted_keys': keys[order],
+        'sorted_ids': ids[positions[order]],
+        'position_by_id': position_by_id,
+    }
+
+
+def search_case_id_prefix(case_index: dict, prefix: str, limit: int = 50) -> tuple:
+    """
+    Finds the case ids starting with a prefix with two binary searches over
+    the sorted keys.
+
+    Args:
+        case_index: Output of build_case_id_index.
+        prefix: The typed prefix. An empty prefix matches every id.
+        limit: Maximum number of ids returned.
+
+    Returns:
+        A tuple (matching_ids, total_matches) with at most `limit` ids in
+        sorted order.
+    """
+    sorted_keys = case_index['sorted_keys']
+    prefix = (prefix or '').strip()
+    start = int(np.searchsorted(sorted_keys, prefix, side='left'))
+    stop = int(np.searchsorted(sorted_keys, prefix + '\U0010ffff', side='left')) if prefix else len(sorted_keys)
+    return case_index['sorted_ids'][start:min(stop, start + limit)].tolist(), stop - start
+
+
+def lookup_case_position(case_index: dict, case_id):
+    """
+    Returns the row position of a case id, or None if it is not indexed.
+
+    Args:
+        case_index: Output of build_case_id_index.
+        case_id: The id to look up.
+
+    Returns:
+        The row position (for .iloc) or None.
+    """
+    return case_index['position_by_id'].get(case_id)
+
+
+# Arabic letter variants folded to one form, diacritics/tatweel removed and
+# Arabic-Indic digits mapped to ASCII so spelling variants index identically.
+_ARABIC_NORMALIZATION_TABLE = str.maketrans({
+    **{variant: 'ا' for variant in 'أإآٱ'},
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و', 'ة': 'ه',
+    **{chr(code): None for code in range(0x064B, 0x0660)},
+    '\u0670': None, '\u0640': None,
+    **{chr(0x0660 + digit): str(digit) for digit in range(10)},
+    **{chr(0x06F0 + digit): str(digit) for digit in range(10)},
+})
+# The Arabic definite article is dropped so 'المرجعي' and 'مرجعي' share a token.
+_NOTE_TOKEN_PATTERN = re.compile(r'(?:ال(?=\w{2}))?(\w+)')
+
+
+def normalize_note_text(text) -> str:
+    """
+    Normalises note text for search: Unicode NFKC, case folding, and Arabic
+    normalisation (alef/yeh/teh marbuta variants, diacritics, tatweel and
+    Arabic-Indic digits).
+
+    Args:
+        text: The note text. Non-string values normalise to an empty string.
+
+    Returns:
+        The normalised text.
+    """
+    if not isinstance(text, str):
+        return ''
+    return unicodedata.normalize('NFKC', text).casefold().translate(_ARABIC_NORMALIZATION_TABLE)
+
+
+def tokenize_note_text(text) -> list:
+    """
+    Splits note text into normalised word tokens (letters and digits in any
+    script; punctuation separates tokens, so 'ORA-12154' gives 'ora', '12154').
+    A leading Arabic definite article is removed from each token.
+
+    Args:
+        text: The note text.
+
+    Returns:
+        A list of tokens.
+    """
+    return _NOTE_TOKEN_PATTERN.findall(normalize_note_text(text))
+
+
+def build_note_search_index(notes: pd.Series) -> dict:
+    """
+    Builds an inverted index from every note token to the sorted row
+    positions whose note contains it.
+
+    Args:
+        notes: The 'Last Note' column. Row positions refer to its order.
+
+    Returns:
+        A dict with 'postings' (token -> sorted np.ndarray of positions) and
+        'n_rows'.
+    """
+    n_rows = len(notes)
+    tokens = notes.reset_index(drop=True).map(normalize_note_text).str.findall(_NOTE_TOKEN_PATTERN).explode().dropna()
+    if tokens.empty:
+        return {'postings': {}, 'n_rows': n_rows}
+
+    codes, vocabulary = pd.factorize(tokens.to_numpy())
+    # Unique (token, position) pairs, sorted by token then position
+    pair_keys = np.sort(codes.astype(np.int64) * n_rows + tokens.index.to_numpy(dtype=np.int64))
+    pair_keys = pair_keys[np.concatenate(([True], pair_keys[1:] != pair_keys[:-1]))]
+    pair_codes = pair_keys // n_rows
+    pair_positions = pair_keys % n_rows
+    boundaries = np.searchsorted(pair_codes, np.arange(len(vocabulary) + 1))
+
+    postings = {
+        token: pair_positions[boundaries[i]:boundaries[i + 1]]
+        for i, token in enumerate(vocabulary)
+    }
+    return {'postings': postings, 'n_rows': n_rows}
+
+
+def search_note_index(note_index: dict, query: str) -> np.ndarray:
+    """
+    Returns the row positions whose note contains every term of the query
+    (AND semantics). Terms are normalised exactly like the notes.
+
+    Args:
+        note_index: Output of build_note_search_index.
+        query: Free-text query.
+
+    Returns:
+        A sorted np.ndarray of row positions. An empty query matches all rows.
+    """
+    terms = set(tokenize_note_text(query))
+    if not terms:
+        return np.arange(note_index['n_rows'])
+
+    postings = note_index['postings']
+    term_postings = sorted((postings.get(term, np.empty(0, dtype=np.int64)) for term in terms), key=len)
+    matches = term_postings[0]
+    for positions in term_postings[1:]:
+        if matches.size == 0:
+            break
+        matches = np.intersect1d(matches, positions, assume_unique=True)
+    return matches
+
+
+def compile_filter_mask(df: pd.DataFrame, spec: dict) -> np.ndarray:
+    """
+    Compiles a filter specification (a saved preset or the current filter
+    widgets) into one boolean row mask, so the filters cost a single indexing
+    operation instead of one intermediate frame per step.
+
+    Args:
+        df: The enriched case DataFrame.
+        spec: A dict with any of:
+              'users': list of 'Current User Id' values (empty = all users),
+              'date_range': [start, end] dates or ISO strings on 'Case Start Date',
+              'triage_status', 'type', 'status': a single value, where 'All'
+              means no filter and status 'None' selects a missing Status.
+
+    Returns:
+        A boolean np.ndarray aligned with df's rows.
+    """
+    mask = np.ones(len(df), dtype=bool)
+
+    users = spec.get('users') or []
+    if users and 'Current User Id' in df.columns:
+        mask &= df['Current User Id'].isin(users).to_numpy()
+
+    date_range = spec.get('date_range')
+    if date_range and len(date_range) == 2 and 'Case Start Date' in df.columns \
+            and pd.api.types.is_datetime64_any_dtype(df['Case Start Date']):
+        start_date, end_date = (pd.Timestamp(value) for value in date_range)
+        if pd.notna(start_date) and pd.notna(end_date):
+            case_days = df['Case Start Date'].dt.normalize()
+            mask &= ((case_days >= start_date.normalize()) & (case_days <= end_date.normalize())).to_numpy()
+
+    for spec_key, column in [('triage_status', 'Triage Status'), ('type', 'Type'), ('status', 'Status')]:
+        value = spec.get(spec_key, 'All')
+        if value in (None, 'All') or column not in df.columns:
+            continue
+        if spec_key == 'status' and value == 'None':
+            mask &= df[column].isna().to_numpy()
+        else:
+            mask &= (df[column] == value).fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def load_filter_presets(path: str) -> dict:
+    """
+    Reads saved filter presets from a JSON file.
+
+    Args:
+        path: Location of the presets file.
+
+    Returns:
+        A dict of preset name -> filter spec. Missing or unreadable files
+        give an empty dict.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as presets_file:
+            presets = json.load(presets_file)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"--- WARNING: Could not read filter presets from '{path}': {e} ---")
+        return {}
+    return presets if isinstance(presets, dict) else {}
+
+
+def save_filter_presets(path: str, presets: dict) -> None:
+    """
+    Writes filter presets to a JSON file. Dates are stored as ISO strings.
+    The file is written to a temporary file next to it and then swapped in
+    with os.replace, so readers never see a half-written file.
+
+    Args:
+        path: Location of the presets file.
+        presets: A dict of preset name -> filter spec.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.filter_presets.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as presets_file:
+            json.dump(presets, presets_file, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def update_filter_preset(path: str, name: str, spec: dict = None) -> dict:
+    """
+    Saves or deletes one preset against the latest copy of the presets file,
+    so presets saved meanwhile by other sessions are kept.
+
+    Args:
+        path: Location of the presets file.
+        name: Preset name.
+        spec: Filter spec to save, or None to delete the preset.
+
+    Returns:
+        The presets as written.
+    """
+    presets = load_filter_presets(path)
+    if spec is None:
+        presets.pop(name, None)
+    else:
+        presets[name] = spec
+    save_filter_presets(path, presets)
+    return presets
+
+
+class FilterResultMemo:
+    """
+    Bounded LRU memo of filter results for one session. Each entry maps a
+    (dataset version, filter state) key to the matching row positions, so a
+    recent filter combination is reapplied with a single .iloc instead of
+    being recomputed, and no filtered frame copies are kept alive.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute) -> np.ndarray:
+        """
+        Returns the memoised positions for key, or computes, stores and
+        returns them, evicting the least recently used entry when full.
+
+        Args:
+            key: A hashable description of the dataset version and filter state.
+            compute: A zero-argument callable returning row positions.
+
+        Returns:
+            The row positions as an np.ndarray.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        positions = np.asarray(compute(), dtype=np.int64)
+        self._entries[key] = positions
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return positions
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the memo's hit/miss statistics and its current footprint.
+
+        Returns:
+            A dict with 'entries', 'max_entries', 'hits', 'misses',
+            'evictions', 'hit_rate' and 'bytes'.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes': int(sum(positions.nbytes for positions in self._entries.values())),
+        }
+
+
+def _append_total_row(summary_df: pd.DataFrame, label_column: str) -> pd.DataFrame:
+    """Appends a 'Total' row summing every count column of a summary table."""
+    total_row = {label_column: 'Total'}
+    for col in summary_df.columns:
+        if col != label_column:
+            total_row[col] = summary_df[col].sum()
+    return pd.concat([summary_df, pd.DataFrame([total_row])], ignore_index=True)
+
+
+def compute_analysis_summaries(df: pd.DataFrame) -> dict:
+    """
+    Computes the Analysis tab summary tables from a single grouped pass.
+
+    The rows are grouped once by (Triage Status, Type, Status, Ticket Number).
+    Every summary is then a cheap reduction of that small grouped table: case
+    counts are sums of group sizes and unique ticket counts are the number of
+    distinct (Status, Ticket Number) pairs among the groups.
+
+    Args:
+        df: The enriched case DataFrame.
+
+    Returns:
+        A dict with:
+        - 'triage': Triage Status / Count, by count, with a Total row.
+        - 'type': Type / Count, by count, with a Total row.
+        - 'sr_status': Status / Cases Count / SR Count for SRs, by status, with a Total row.
+        - 'incident_status': Status / Cases Count / Incident Count for incidents, by status,
+          with a Total row.
+        A status table is empty (no Total row) when there are no rows of that type with a Status.
+    """
+    key_columns = ['Triage Status', 'Type', 'Status', 'Ticket Number']
+    keys = pd.DataFrame({
+        col: df[col] if col in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+        for col in key_columns
+    })
+    groups = keys.groupby(key_columns, dropna=False, sort=False).size().reset_index(name='Cases')
+
+    summaries = {}
+    for label_column, summary_key in [('Triage Status', 'triage'), ('Type', 'type')]:
+        counts = groups.dropna(subset=[label_column]).groupby(label_column)['Cases'].sum()
+        counts = counts.sort_values(ascending=False, kind='stable')
+        summary_df = counts.rename_axis(label_column).reset_index(name='Count')
+        summaries[summary_key] = _append_total_row(summary_df, label_column)
+
+    for ticket_type, summary_key, ticket_count_column in [('SR', 'sr_status', 'SR Count'), ('Incident', 'incident_status', 'Incident Count')]:
+        type_groups = groups[(groups['Type'] == ticket_type) & groups['Status'].notna()]
+        if type_groups.empty:
+            summaries[summary_key] = pd.DataFrame(columns=['Status', 'Cases Count', ticket_count_column])
+            continue
+        case_counts = type_groups.groupby('Status')['Cases'].sum().rename('Cases Count')
+        type_tickets = type_groups[type_groups['Ticket Number'].notna()].drop_duplicates(subset=['Status', 'Ticket Number'])
+        ticket_counts = type_tickets.groupby('Status').size().rename(ticket_count_column)
+        status_df = pd.concat([case_counts, ticket_counts], axis=1).fillna(0).astype(int)
+        status_df = status_df.rename_axis('Status').reset_index()
+        summaries[summary_key] = _append_total_row(status_df, 'Status')
+    return summaries
+
+
+def build_sr_status_breakdown(df_srs: pd.DataFrame, sr_status_summary: pd.DataFrame,
+                              breakdown_statuses: tuple = ('waiting for approval',)) -> pd.DataFrame:
+    """
+    Expands the SR status summary with a 'Pending With' breakdown under the
+    given statuses, without row loops.
+
+    Statuses are matched case- and whitespace-insensitively. The approver
+    counts come from one grouped table over (normalised status, Pending With):
+    'Cases Count' counts cases and 'SR Count' counts unique tickets per status.
+
+    Args:
+        df_srs: The SR cases ('Status', 'Ticket Number' and optionally
+                'Pending With').
+        sr_status_summary: The 'sr_status' table from compute_analysis_summaries
+                           (Status / Cases Count / SR Count, ending with Total).
+        breakdown_statuses: Normalised statuses that get a breakdown.
+
+    Returns:
+        The summary with indented '↳ approver' rows under each matching status,
+        sorted by approver, and the Total row last.
+    """
+    status_rows = sr_status_summary.iloc[:-1].reset_index(drop=True)
+    total_row = sr_status_summary.iloc[[-1]]
+    columns = list(sr_status_summary.columns)
+
+    parents = status_rows.assign(
+        _status_key=status_rows['Status'].astype(str).str.strip().str.lower(),
+        _parent_order=np.arange(len(status_rows)),
+        _child_order=-1,
+    )
+    if 'Pending With' not in df_srs.columns or df_srs.empty:
+        return pd.concat([status_rows, total_row], ignore_index=True)
+
+    srs = df_srs.dropna(subset=['Status'])
+    srs = pd.DataFrame({
+        '_status_key': srs['Status'].astype(str).str.strip().str.lower(),
+        'Pending With': srs['Pending With'],
+        'Ticket Number': srs['Ticket Number'] if 'Ticket Number' in srs.columns else np.nan,
+    })
+    srs = srs[srs['_status_key'].isin(breakdown_statuses)]
+
+    case_counts = srs.groupby(['_status_key', 'Pending With']).size().rename(columns[1])
+    unique_tickets = srs.drop_duplicates(subset=['_status_key', 'Ticket Number'])
+    ticket_counts = unique_tickets.groupby(['_status_key', 'Pending With']).size().rename(columns[2])
+    breakdown = pd.concat([case_counts, ticket_counts], axis=1).fillna(0).astype(int).reset_index()
+
+    children = parents[['_status_key', '_parent_order']].merge(breakdown, on='_status_key')
+    children['_child_order'] = children.groupby('_parent_order').cumcount()
+    children['Status'] = '    \u21b3 ' + children['Pending With'].astype(str)
+
+    combined = pd.concat([parents, children[parents.columns]], ignore_index=True)
+    combined = combined.sort_values(['_parent_order', '_child_order'], kind='stable')[columns]
+    return pd.concat([combined, total_row], ignore_index=True)
+
+
+def build_day_slice_index(dates: pd.Series) -> dict:
+    """
+    Groups row positions by calendar day so the rows of any day are a single
+    dictionary lookup instead of a full-frame date comparison.
+
+    Args:
+        dates: A date/datetime column (e.g. 'Last Note Date'). Unparseable
+               values and NaT are left out of the index.
+
+    Returns:
+        A dict with 'order' (row positions sorted by day, stable within a day)
+        and 'bounds' (datetime.date -> (start, stop) into 'order').
+    """
+    days = pd.to_datetime(dates, errors='coerce').to_numpy(dtype='datetime64[D]')
+    valid_positions = np.flatnonzero(~np.isnat(days))
+    order = valid_positions[np.argsort(days[valid_positions], kind='stable')]
+    sorted_days = days[order]
+
+    unique_days, starts = np.unique(sorted_days, return_index=True)
+    stops = np.append(starts[1:], len(order))
+    bounds = {
+        day.astype(object): (int(start), int(stop))
+        for day, start, stop in zip(unique_days, starts, stops)
+    }
+    return {'order': order, 'bounds': bounds}
+
+
+def get_day_positions(day_index: dict, day) -> np.ndarray:
+    """
+    Returns the row positions (ascending) whose date falls on the given day.
+
+    Args:
+        day_index: Output of build_day_slice_index.
+        day: A datetime.date (or anything pd.Timestamp accepts).
+
+    Returns:
+        An np.ndarray of row positions, empty when the day has no rows.
+    """
+    bounds = day_index['bounds'].get(pd.Timestamp(day).date())
+    if bounds is None:
+        return np.empty(0, dtype=np.int64)
+    return day_index['order'][bounds[0]:bounds[1]]
+
+
+def calculate_user_type_breakdown(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Counts cases per user, split into SRs and Incidents, with a TOTAL row,
+    from a single user x type crosstab.
+
+    Args:
+        df: Cases with 'Current User Id' and 'Type' columns.
+
+    Returns:
+        A DataFrame with 'Current User Id', 'Total', 'SRs' and 'Incidents',
+        one row per user (sorted) followed by the TOTAL row. 'Total' counts
+        every case of the user, whatever its type.
+    """
+    counts = pd.crosstab(df['Current User Id'], df['Type'].fillna('Other'))
+    breakdown = pd.DataFrame({
+        'Total': counts.sum(axis=1),
+        'SRs': counts['SR'] if 'SR' in counts.columns else 0,
+        'Incidents': counts['Incident'] if 'Incident' in counts.columns else 0,
+    }, index=counts.index).astype(int)
+    breakdown = breakdown.rename_axis('Current User Id').reset_index()
+
+    total_row = pd.DataFrame({
+        'Current User Id': ['TOTAL'],
+        'Total': [breakdown['Total'].sum()],
+        'SRs': [breakdown['SRs'].sum()],
+        'Incidents': [breakdown['Incidents'].sum()]
+    })
+    return pd.concat([breakdown, total_row], ignore_index=True)
+
+
+def calculate_daily_triage_counts(df: pd.DataFrame, end_day, n_days: int,
+                                  triage_status: str = 'Pending SR/Incident') -> dict:
+    """
+    Counts triaged notes per (day, user, type) over the n_days ending at end_day
+    with a single np.bincount over the combined codes, instead of filtering the
+    frame once per day.
+
+    Args:
+        df: The enriched DataFrame ('Last Note Date', 'Current User Id',
+            'Triage Status' and 'Type' columns).
+        end_day: The last day of the window (inclusive), a datetime.date.
+        n_days: Number of days in the window.
+        triage_status: The 'Triage Status' value to count.
+
+    Returns:
+        A dict with 'days' (list of datetime.date, oldest first), 'users' and
+        'types' (sorted labels, missing types as 'Other') and 'counts', an
+        int array of shape (len(days), len(users), len(types)).
+    """
+    start = np.datetime64(pd.Timestamp(end_day).date(), 'D') - (n_days - 1)
+    days = [(start + offset).astype(object) for offset in range(n_days)]
+    empty = {'days': days, 'users': [], 'types': [], 'counts': np.zeros((n_days, 0, 0), dtype=np.int64)}
+    if df.empty or not {'Last Note Date', 'Current User Id', 'Triage Status'}.issubset(df.columns):
+        return empty
+
+    day_values = pd.to_datetime(df['Last Note Date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+    valid = ~np.isnat(day_values) & (df['Triage Status'] == triage_status).to_numpy()
+    day_offsets = np.zeros(len(df), dtype=np.int64)
+    day_offsets[valid] = (day_values[valid] - start).astype(np.int64)
+    valid &= (day_offsets >= 0) & (day_offsets < n_days)
+    if not valid.any():
+        return empty
+
+    user_codes, users = pd.factorize(df['Current User Id'].to_numpy()[valid], sort=True)
+    type_values = df['Type'].fillna('Other') if 'Type' in df.columns else pd.Series('Other', index=df.index)
+    type_codes, types = pd.factorize(type_values.to_numpy()[valid], sort=True)
+    # NaN users fall out of the per-user counts, as in a groupby
+    has_user = user_codes >= 0
+
+    n_users, n_types = len(users), len(types)
+    flat_codes = (day_offsets[valid][has_user] * n_users + user_codes[has_user]) * n_types + type_codes[has_user]
+    counts = np.bincount(flat_codes, minlength=n_days * n_users * n_types).reshape(n_days, n_users, n_types)
+    return {'days': days, 'users': list(users), 'types': list(types), 'counts': counts}
+
+
+# Incident statuses counted as open by the breached-incident views
+OPEN_INCIDENT_STATUSES = ['Open', 'In Progress', 'Pending', 'New', 'Waiting for Information - DIT', 'Waiting for Verification', 'Ready for deployment', 'Waiting for Deployment', 'Waiting for Verification – DIT', 'Waiting for Information - Business', 'Resolved']
+
+
+def _is_breach_passed(value) -> bool:
+    """Maps a 'Breach Passed' cell to a flag ('yes'/'passed' text, otherwise truthiness)."""
+    if isinstance(value, str):
+        return 'yes' in value.lower() or 'passed' in value.lower()
+    return bool(value)
+
+
+def build_incident_rollup_cube(df: pd.DataFrame) -> dict:
+    """
+    Materializes the incident counts per combination of the dimensions used by
+    the Incident Overview and Daily Meeting Report tabs, so their tables and
+    charts become a slice-and-sum over the cube cells instead of a rescan of
+    the incident frame.
+
+    Dimensions: 'Created Day', 'Team', 'Status', 'Priority', 'Source',
+    'Creator', 'Is Breached' and 'Breach Month' ('YYYY-MM'). A missing column
+    or value is stored as code -1 and never matches a filter or a group.
+
+    Args:
+        df: The incident DataFrame.
+
+    Returns:
+        A dict with 'labels' (dimension -> sorted label array), 'codes'
+        (dimension -> int array, one entry per cell), 'counts' (incidents per
+        cell) and 'n_rows'.
+    """
+    n_rows = len(df)
+    dimension_values = {}
+    if 'Created On' in df.columns:
+        dimension_values['Created Day'] = pd.to_datetime(df['Created On'], errors='coerce').dt.date
+    for column in ['Team', 'Status', 'Priority', 'Source', 'Creator']:
+        if column in df.columns:
+            dimension_values[column] = df[column]
+    if 'Breach Passed' in df.columns:
+        dimension_values['Is Breached'] = df['Breach Passed'].map(_is_breach_passed).astype(bool)
+    if 'Breach Date' in df.columns:
+        breach_dates = pd.to_datetime(df['Breach Date'], errors='coerce')
+        dimension_values['Breach Month'] = breach_dates.dt.strftime('%Y-%m').where(breach_dates.notna())
+
+    dimensions = ['Created Day', 'Team', 'Status', 'Priority', 'Source', 'Creator', 'Is Breached', 'Breach Month']
+    labels, row_codes = {}, {}
+    for dimension in dimensions:
+        if dimension in dimension_values:
+            codes, uniques = pd.factorize(dimension_values[dimension], sort=True)
+            labels[dimension] = np.asarray(uniques, dtype=object)
+            row_codes[dimension] = codes.astype(np.int64)
+        else:
+            labels[dimension] = np.empty(0, dtype=object)
+            row_codes[dimension] = np.full(n_rows, -1, dtype=np.int64)
+
+    radices = [len(labels[dimension]) + 1 for dimension in dimensions]
+    if np.prod(radices, dtype=object) < 2**63:
+        # One mixed-radix key per row (code + 1 so that missing values get slot 0)
+        row_keys = np.zeros(n_rows, dtype=np.int64)
+        for dimension, radix in zip(dimensions, radices):
+            row_keys = row_keys * radix + (row_codes[dimension] + 1)
+
+        sorted_keys = np.sort(row_keys)
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]) if n_rows else np.empty(0, dtype=np.int64)
+        cell_keys = sorted_keys[starts]
+        cell_counts = np.diff(np.append(starts, n_rows)).astype(np.int64)
+
+        cell_codes = {}
+        remaining_keys = cell_keys.copy()
+        for dimension, radix in zip(reversed(dimensions), reversed(radices)):
+            remaining_keys, slot = np.divmod(remaining_keys, radix)
+            cell_codes[dimension] = slot - 1
+    else:
+        # Too many combinations for an int64 key: group the rows' code tuples directly
+        code_matrix = np.column_stack([row_codes[dimension] for dimension in dimensions])
+        cell_matrix, cell_counts = np.unique(code_matrix, axis=0, return_counts=True)
+        cell_counts = cell_counts.astype(np.int64)
+        cell_codes = {dimension: cell_matrix[:, i] for i, dimension in enumerate(dimensions)}
+
+    return {'labels': labels, 'codes': cell_codes, 'counts': cell_counts, 'n_rows': n_rows}
+
+
+def _rollup_cell_mask(cube: dict, filters: dict = None) -> np.ndarray:
+    """Cells of the cube matching every {dimension: allowed labels} filter (None or empty = no filter)."""
+    mask = np.ones(len(cube['counts']), dtype=bool)
+    for dimension, allowed in (filters or {}).items():
+        if allowed is None or len(allowed) == 0:
+            continue
+        allowed_set = set(allowed)
+        allowed_codes = [code for code, label in enumerate(cube['labels'][dimension]) if label in allowed_set]
+        mask &= np.isin(cube['codes'][dimension], allowed_codes)
+    return mask
+
+
+def rollup_cube_counts(cube: dict, by, filters: dict = None) -> pd.Series:
+    """
+    Sums the cube cells matching the filters, grouped by one or more dimensions.
+
+    Args:
+        cube: Output of build_incident_rollup_cube.
+        by: A dimension name or a list of dimension names.
+        filters: Optional {dimension: allowed labels}. None or an empty list
+                 leaves a dimension unfiltered.
+
+    Returns:
+        A Series of counts named 'Count', indexed (sorted) by the labels of the
+        'by' dimensions. Only non-zero groups are included, as in a groupby.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    mask = _rollup_cell_mask(cube, filters)
+    for dimension in by:
+        mask &= cube['codes'][dimension] >= 0
+
+    sizes = [len(cube['labels'][dimension]) for dimension in by]
+    group_keys = np.ravel_multi_index([cube['codes'][dimension][mask] for dimension in by], sizes) if mask.any() else np.empty(0, dtype=np.int64)
+    totals = np.bincount(group_keys, weights=cube['counts'][mask], minlength=int(np.prod(sizes))).astype(np.int64)
+    present = np.flatnonzero(totals)
+
+    label_codes = np.unravel_index(present, sizes)
+    if len(by) == 1:
+        index = pd.Index(cube['labels'][by[0]][label_codes[0]], name=by[0])
+    else:
+        index = pd.MultiIndex.from_arrays(
+            [cube['labels'][dimension][codes] for dimension, codes in zip(by, label_codes)], names=by
+        )
+    return pd.Series(totals[present], index=index, name='Count')
+
+
+def rollup_counts_with_total(cube: dict, by: str, label_column: str, filters: dict = None) -> pd.DataFrame:
+    """
+    Counts per label of one cube dimension with a 'Total' row, in the shape of
+    the Daily Meeting Report tables.
+
+    Args:
+        cube: Output of build_incident_rollup_cube.
+        by: The dimension to group by.
+        label_column: Name of the label column in the result.
+        filters: Optional {dimension: allowed labels}.
+
+    Returns:
+        A DataFrame [label_column, 'Count'] ending with a 'Total' row, or an
+        empty DataFrame with those columns when no incident matches.
+    """
+    counts = rollup_cube_counts(cube, by, filters)
+    if counts.empty:
+        return pd.DataFrame(columns=[label_column, 'Count'])
+    counts_df = pd.DataFrame({label_column: counts.index.to_numpy(), 'Count': counts.to_numpy()})
+    return _append_total_row(counts_df, label_column)
+
+
+def calculate_open_backlog_series(df: pd.DataFrame, closed_col: str, closed_statuses: list, group_col: str = None,
+                                  created_col: str = 'Created On', status_col: str = 'Status', end_day=None,
+                                  dayfirst: bool = True) -> pd.DataFrame:
+    """
+    Computes the open backlog at the end of every day with an event sweep:
+    +1 on the 'Created On' day, -1 on the closure day of items in a closed
+    status, then a cumulative sum over the day index (per group).
+
+    Args:
+        df: SR or incident DataFrame.
+        closed_col: Column holding the closure timestamp (e.g. 'LastModDateTime').
+        closed_statuses: Statuses (case-insensitive) counted as closed.
+        group_col: Optional column to split the backlog by (e.g. 'Team', 'Status').
+                   Missing values are grouped as 'Unassigned'.
+        created_col: Column holding the creation timestamp.
+        status_col: Column holding the status.
+        end_day: Optional last day of the series (e.g. today); defaults to the
+                 last event day.
+        dayfirst: Passed to pd.to_datetime for string dates.
+
+    Returns:
+        A DataFrame indexed by day ('Day') with one column per group (or a
+        single 'Open Backlog' column). Empty when no creation date parses.
+        Items closed before their creation date are closed on the creation day.
+    """
+    if created_col not in df.columns:
+        return pd.DataFrame()
+    created_days = pd.to_datetime(df[created_col], errors='coerce', dayfirst=dayfirst).to_numpy(dtype='datetime64[D]')
+    valid = ~np.isnat(created_days)
+    if not valid.any():
+        return pd.DataFrame()
+
+    if closed_col in df.columns and status_col in df.columns:
+        closed_days = pd.to_datetime(df[closed_col], errors='coerce', dayfirst=dayfirst).to_numpy(dtype='datetime64[D]')
+        normalized_closed = [status.lower() for status in closed_statuses]
+        is_closed = df[status_col].astype(str).str.lower().str.strip().isin(normalized_closed).to_numpy() & ~np.isnat(closed_days)
+    else:
+        closed_days = np.full(len(df), np.datetime64('NaT'), dtype='datetime64[D]')
+        is_closed = np.zeros(len(df), dtype=bool)
+    is_closed &= valid
+    closed_days = np.where(is_closed, np.maximum(closed_days, created_days), closed_days)
+
+    start_day = created_days[valid].min()
+    last_day = created_days[valid].max()
+    if is_closed.any():
+        last_day = max(last_day, closed_days[is_closed].max())
+    if end_day is not None:
+        last_day = max(last_day, np.datetime64(pd.Timestamp(end_day).date(), 'D'))
+    n_days = int((last_day - start_day).astype(np.int64)) + 1
+
+    if group_col is not None and group_col in df.columns:
+        group_codes, group_labels = pd.factorize(df[group_col].fillna('Unassigned'), sort=True)
+        group_labels = list(group_labels)
+    else:
+        group_codes, group_labels = np.zeros(len(df), dtype=np.int64), ['Open Backlog']
+    n_groups = len(group_labels)
+
+    created_keys = group_codes[valid] * n_days + (created_days[valid] - start_day).astype(np.int64)
+    closed_keys = group_codes[is_closed] * n_days + (closed_days[is_closed] - start_day).astype(np.int64)
+    daily_events = (np.bincount(created_keys, minlength=n_groups * n_days)
+                    - np.bincount(closed_keys, minlength=n_groups * n_days))
+    open_backlog = daily_events.reshape(n_groups, n_days).cumsum(axis=1).T
+
+    day_index = pd.date_range(pd.Timestamp(start_day), periods=n_days, freq='D', name='Day')
+    return pd.DataFrame(open_backlog, index=day_index, columns=group_labels)
+
+
+def build_backlog_growth_matrix(cube: dict) -> dict:
+    """
+    Builds the created-day x team x Source count matrix behind the Ivanti
+    backlog growth tables from the incident rollup cube, so any date, date
+    range or week/month rollup is a slice-and-sum instead of a frame scan.
+
+    Args:
+        cube: Output of build_incident_rollup_cube.
+
+    Returns:
+        A dict with 'days' (sorted datetime.date array of the creation days
+        present), 'teams' and 'sources' (label arrays) and 'counts', an int
+        array of shape (len(days), len(teams) + 1, len(sources)). The last
+        team slot holds incidents without a team.
+    """
+    days = cube['labels']['Created Day']
+    teams = cube['labels']['Team']
+    sources = cube['labels']['Source']
+    day_codes, team_codes, source_codes = cube['codes']['Created Day'], cube['codes']['Team'], cube['codes']['Source']
+
+    cells = (day_codes >= 0) & (source_codes >= 0)
+    team_slots = np.where(team_codes[cells] >= 0, team_codes[cells], len(teams))
+    shape = (len(days), len(teams) + 1, len(sources))
+    flat_keys = np.ravel_multi_index([day_codes[cells], team_slots, source_codes[cells]], shape) if cells.any() else np.empty(0, dtype=np.int64)
+    counts = np.bincount(flat_keys, weights=cube['counts'][cells], minlength=int(np.prod(shape))).astype(np.int64)
+    return {'days': days, 'teams': teams, 'sources': sources, 'counts': counts.reshape(shape)}
+
+
+def _backlog_growth_day_source_counts(matrix: dict, teams: list = None) -> np.ndarray:
+    """Day x Source counts of the matrix for the given teams (all incidents when teams is empty)."""
+    if not teams:
+        return matrix['counts'].sum(axis=1)
+    team_slots = [slot for slot, team in enumerate(matrix['teams']) if team in set(teams)]
+    return matrix['counts'][:, team_slots, :].sum(axis=1)
+
+
+def calculate_backlog_growth_from_matrix(matrix: dict, start_date, end_date=None, teams: list = None) -> pd.DataFrame:
+    """
+    Incidents created per Source on a day or over an inclusive date range,
+    answered from the backlog growth matrix.
+
+    Args:
+        matrix: Output of build_backlog_growth_matrix.
+        start_date: The first (or only) day, a datetime.date.
+        end_date: Optional last day of the range (inclusive); defaults to start_date.
+        teams: Optional list of teams to count (None or empty = all incidents).
+
+    Returns:
+        A DataFrame ['Source', 'Count'] ending with a 'Total' row (same shape
+        as calculate_daily_backlog_growth), or an empty DataFrame with those
+        columns when no incident was created in the range.
+    """
+    end_date = start_date if end_date is None else end_date
+    start = np.searchsorted(matrix['days'], start_date, side='left') if len(matrix['days']) else 0
+    stop = np.searchsorted(matrix['days'], end_date, side='right') if len(matrix['days']) else 0
+    source_counts = _backlog_growth_day_source_counts(matrix, teams)[start:stop].sum(axis=0)
+    present = np.flatnonzero(source_counts)
+    if len(present) == 0:
+        return pd.DataFrame(columns=['Source', 'Count'])
+    counts_df = pd.DataFrame({'Source': matrix['sources'][present], 'Count': source_counts[present]})
+    return _append_total_row(counts_df, 'Source')
+
+
+def rollup_backlog_growth(matrix: dict, freq: str, teams: list = None) -> pd.DataFrame:
+    """
+    Incidents created per week or month and Source, from the backlog growth matrix.
+
+    Args:
+        matrix: Output of build_backlog_growth_matrix.
+        freq: 'W' for ISO weeks (labelled with 'WeekDisplay') or 'M' for months ('YYYY-MM').
+        teams: Optional list of teams to count (None or empty = all incidents).
+
+    Returns:
+        A DataFrame with a 'Period' column, one count column per Source and a
+        'Total' column, one row per period with incidents, in date order.
+    """
+    day_source_counts = _backlog_growth_day_source_counts(matrix, teams)
+    if len(matrix['days']) == 0:
+        return pd.DataFrame(columns=['Period'] + list(matrix['sources']) + ['Total'])
+    if freq == 'W':
+        period_keys = compute_iso_week_codes(pd.Series(pd.to_datetime(matrix['days'])))
+    else:
+        period_keys = pd.DatetimeIndex(pd.to_datetime(matrix['days'])).strftime('%Y-%m').to_numpy()
+
+    per_period = pd.DataFrame(day_source_counts, columns=list(matrix['sources'])).groupby(period_keys, sort=True).sum()
+    per_period['Total'] = per_period.sum(axis=1)
+    per_period = per_period[per_period['Total'] > 0]
+    if freq == 'W':
+        period_labels = get_iso_week_labels(per_period.index.to_numpy())['WeekDisplay'].to_numpy()
+    else:
+        period_labels = per_period.index.to_numpy()
+    per_period.insert(0, 'Period', period_labels)
+    return per_period.reset_index(drop=True)
+
+
+def build_team_progress_index(df: pd.DataFrame) -> dict:
+    """
+    Builds the member x day matrix of incident checks ('Last Check By' x
+    'Last Checked at' day) with per-member cumulative sums, so the checks of
+    any member over any date range are two lookups. The input is not modified.
+
+    Args:
+        df: Incident DataFrame with 'Last Checked at' and 'Last Check By' columns.
+
+    Returns:
+        A dict with 'members' (sorted labels), 'first_day' (datetime64[D] of
+        column 0, or None when there are no checks), 'daily_counts' (int array,
+        members x days) and 'cumulative' (members x (days + 1), starting at 0).
+    """
+    checked_days = pd.to_datetime(df['Last Checked at'], errors='coerce').to_numpy(dtype='datetime64[D]')
+    member_codes, members = pd.factorize(df['Last Check By'], sort=True)
+    valid = ~np.isnat(checked_days) & (member_codes >= 0)
+    if not valid.any():
+        return {'members': np.asarray(members, dtype=object), 'first_day': None,
+                'daily_counts': np.zeros((len(members), 0), dtype=np.int64),
+                'cumulative': np.zeros((len(members), 1), dtype=np.int64)}
+
+    first_day = checked_days[valid].min()
+    day_offsets = (checked_days[valid] - first_day).astype(np.int64)
+    n_days = int(day_offsets.max()) + 1
+    daily_counts = np.bincount(member_codes[valid] * n_days + day_offsets, minlength=len(members) * n_days).reshape(len(members), n_days)
+    cumulative = np.zeros((len(members), n_days + 1), dtype=np.int64)
+    np.cumsum(daily_counts, axis=1, out=cumulative[:, 1:])
+    return {'members': np.asarray(members, dtype=object), 'first_day': first_day,
+            'daily_counts': daily_counts, 'cumulative': cumulative}
+
+
+def _team_progress_window(progress_index: dict, start_date, end_date) -> tuple:
+    """Column bounds [lo, hi) of the inclusive date range in the progress matrix."""
+    n_days = progress_index['daily_counts'].shape[1]
+    if progress_index['first_day'] is None:
+        return 0, 0
+    first_day = progress_index['first_day']
+    lo = int((np.datetime64(start_date, 'D') - first_day).astype(np.int64))
+    hi = int((np.datetime64(end_date, 'D') - first_day).astype(np.int64)) + 1
+    return min(max(lo, 0), n_days), min(max(hi, 0), n_days)
+
+
+def _team_progress_rows(progress_index: dict, members) -> np.ndarray:
+    """Matrix rows of the selected members (every member when none is selected)."""
+    if not members:
+        return np.arange(len(progress_index['members']))
+    selected = set(members)
+    return np.array([row for row, member in enumerate(progress_index['members']) if member in selected], dtype=np.int64)
+
+
+def query_team_progress(progress_index: dict, start_date, end_date, members) -> pd.DataFrame:
+    """
+    Incidents checked per member over an inclusive date range, from the
+    cumulative sums of build_team_progress_index.
+
+    Args:
+        progress_index: Output of build_team_progress_index.
+        start_date: First day of the range (datetime.date).
+        end_date: Last day of the range (datetime.date).
+        members: Members to include (None or empty = all members).
 
+    Returns:
+        A DataFrame ['Last Check By', 'Ivanti Incidents'] with members that
+        have checks in the range and a 'Total' row, or an empty DataFrame with
+        those columns.
+    """
+    lo, hi = _team_progress_window(progress_index, start_date, end_date)
+    rows = _team_progress_rows(progress_index, members)
+    if lo >= hi or len(rows) == 0:
+        return pd.DataFrame(columns=['Last Check By', 'Ivanti Incidents'])
+    checks = progress_index['cumulative'][rows, hi] - progress_index['cumulative'][rows, lo]
+    has_checks = checks > 0
+    if not has_checks.any():
+        return pd.DataFrame(columns=['Last Check By', 'Ivanti Incidents'])
+    progress_counts = pd.DataFrame({
+        'Last Check By': progress_index['members'][rows[has_checks]],
+        'Ivanti Incidents': checks[has_checks]
+    })
+    return _append_total_row(progress_counts, 'Last Check By')
+
+
+def get_team_progress_sparklines(progress_index: dict, start_date, end_date, members) -> dict:
+    """
+    Per-day check counts of each member over an inclusive date range (for sparklines).
+
+    Args:
+        progress_index: Output of build_team_progress_index.
+        start_date: First day of the range (datetime.date).
+        end_date: Last day of the range (datetime.date).
+        members: Members to include (None or empty = all members).
+
+    Returns:
+        A dict member -> list of daily counts, one entry per day of the range
+        (days outside the data count as 0).
+    """
+    n_range_days = max((np.datetime64(end_date, 'D') - np.datetime64(start_date, 'D')).astype(np.int64) + 1, 0)
+    lo, hi = _team_progress_window(progress_index, start_date, end_date)
+    leading_zeros = 0
+    if progress_index['first_day'] is not None:
+        leading_zeros = int(min(max((progress_index['first_day'] - np.datetime64(start_date, 'D')).astype(np.int64), 0), n_range_days))
+    sparklines = {}
+    for row in _team_progress_rows(progress_index, members):
+        daily = [0] * leading_zeros + progress_index['daily_counts'][row, lo:hi].tolist()
+        sparklines[progress_index['members'][row]] = (daily + [0] * n_range_days)[:n_range_days]
+    return sparklines
+
+
+def build_status_team_grid(team_status_counts: pd.Series) -> pd.DataFrame:
+    """
+    Turns (Team, Status) counts into one status x team grid with totals, for
+    rendering every team's status table as a single frame.
+
+    Args:
+        team_status_counts: Counts indexed by a ('Team', 'Status') MultiIndex,
+                            e.g. from rollup_cube_counts.
+
+    Returns:
+        A DataFrame indexed by 'Status' (most frequent first, then a totals
+        row) with one column per team and a totals column last. Both are
+        labelled 'Total', or 'Total (all)' when a status or team is already
+        called 'Total'. Empty when there are no counts.
+    """
+    if team_status_counts.empty:
+        return pd.DataFrame()
+    grid = team_status_counts.unstack('Team', fill_value=0)
+    taken_labels = set(grid.index) | set(grid.columns)
+    total_label = 'Total'
+    while total_label in taken_labels:
+        total_label = f"{total_label} (all)"
+    grid.insert(len(grid.columns), total_label, grid.sum(axis=1))
+    grid = grid.sort_values(total_label, ascending=False, kind='stable')
+    # Appended rather than set with .loc so a status named like the totals row is never overwritten
+    total_row = grid.sum().to_frame(total_label).T
+    return pd.concat([grid, total_row]).rename_axis(index=grid.index.name, columns=grid.columns.name)
+
+
+def build_ticket_case_adjacency(df: pd.DataFrame) -> dict:
+    """
+    Builds a CSR-style ticket -> cases adjacency over the linked cases. Tickets
+    ((Ticket Number, Type) pairs) are ranked by case count, highest first, and
+    the cases of the ticket at rank r are case_positions[offsets[r]:offsets[r + 1]].
+
+    Args:
+        df: Enriched DataFrame with 'Ticket Number' and 'Type' columns
+            (and optionally 'Status').
+
+    Returns:
+        A dict with 'tickets' (DataFrame with 'Ticket Number', 'Type', 'Status'
+        when available and 'Case Count', indexed by rank), 'ticket_index'
+        (MultiIndex of the pairs in rank order), 'degrees' (case counts in rank
+        order), 'offsets' (length tickets + 1) and 'case_positions' (row
+        positions into df, grouped by ticket rank and in row order within one).
+    """
+    valid_positions = np.flatnonzero((df['Ticket Number'].notna() & df['Type'].notna()).to_numpy())
+    pairs = pd.MultiIndex.from_arrays(
+        [df['Ticket Number'].to_numpy()[valid_positions], df['Type'].to_numpy()[valid_positions]],
+        names=['Ticket Number', 'Type']
+    )
+    pair_codes, unique_pairs = pairs.factorize()
+    degrees = np.bincount(pair_codes, minlength=len(unique_pairs))
+
+    ticket_order = np.argsort(-degrees, kind='stable')
+    ticket_ranks = np.empty_like(ticket_order)
+    ticket_ranks[ticket_order] = np.arange(len(ticket_order))
+    case_positions = valid_positions[np.argsort(ticket_ranks[pair_codes], kind='stable')]
+
+    degrees = degrees[ticket_order]
+    offsets = np.zeros(len(degrees) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+
+    ticket_index = unique_pairs[ticket_order]
+    tickets = pd.DataFrame({
+        'Ticket Number': ticket_index.get_level_values(0),
+        'Type': ticket_index.get_level_values(1),
+    })
+    if 'Status' in df.columns:
+        # Status comes from the ticket export, so the first linked case carries it
+        tickets['Status'] = df['Status'].to_numpy()[case_positions[offsets[:-1]]]
+    tickets['Case Count'] = degrees
+    return {'tickets': tickets, 'ticket_index': ticket_index, 'degrees': degrees,
+            'offsets': offsets, 'case_positions': case_positions}
+
+
+def get_linked_tickets(adjacency: dict, min_cases: int, df_subset: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Tickets with at least min_cases linked cases, highest case count first,
+    as a prefix slice of the ranked tickets.
+
+    Args:
+        adjacency: Result of build_ticket_case_adjacency.
+        min_cases: Minimum number of linked cases.
+        df_subset: Optional filtered view of the indexed DataFrame; only tickets
+                   with a case in it are kept. Case counts stay those of the
+                   whole indexed DataFrame.
+
+    Returns:
+        The matching rows of adjacency['tickets'] (the index is the ticket rank).
+    """
+    n_matching = int(np.searchsorted(-adjacency['degrees'], -min_cases, side='right'))
+    tickets = adjacency['tickets'].iloc[:n_matching]
+    if df_subset is None:
+        return tickets
+    subset_ranks = adjacency['ticket_index'].get_indexer(
+        pd.MultiIndex.from_arrays([df_subset['Ticket Number'].to_numpy(), df_subset['Type'].to_numpy()])
+    )
+    in_subset = np.zeros(n_matching, dtype=bool)
+    in_subset[subset_ranks[(subset_ranks >= 0) & (subset_ranks < n_matching)]] = True
+    return tickets[in_subset]
+
+
+def get_ticket_case_positions(adjacency: dict, ticket_rank: int) -> np.ndarray:
+    """Row positions of the cases linked to the ticket at the given rank."""
+    offsets = adjacency['offsets']
+    return adjacency['case_positions'][offsets[ticket_rank]:offsets[ticket_rank + 1]]
+
+def normalize_ticket_ids(values: pd.Series) -> pd.Series:
+    """
+    Normalises ticket ids from any of the files ('Ticket Number', 'Service
+    Request', the incident id column or a typed query) to numbers: the first
+    run of 4+ digits, NaN when there is none.
+
+    Args:
+        values: Raw ticket ids (numbers, or strings such as 'SR 12345').
+
+    Returns:
+        A float Series aligned with the input.
+    """
+    return pd.to_numeric(values.astype(str).str.extract(r'(\d{4,})', expand=False), errors='coerce')
+
+
+def build_ticket_positions(ids: pd.Series) -> dict:
+    """
+    Maps each normalised ticket id to the row positions that reference it.
+
+    Args:
+        ids: Raw ticket ids, one per row.
+
+    Returns:
+        A dict {ticket id (int): int array of row positions, in row order}.
+    """
+    numeric_ids = normalize_ticket_ids(ids).to_numpy(dtype=float)
+    valid_positions = np.flatnonzero(~np.isnan(numeric_ids))
+    ticket_codes, tickets = pd.factorize(numeric_ids[valid_positions].astype(np.int64))
+    grouped_positions = valid_positions[np.argsort(ticket_codes, kind='stable')]
+    bounds = np.zeros(len(tickets) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ticket_codes, minlength=len(tickets)), out=bounds[1:])
+    return {int(ticket): grouped_positions[bounds[i]:bounds[i + 1]] for i, ticket in enumerate(tickets)}
+
+
+def lookup_ticket(ticket_positions: dict, query) -> dict:
+    """
+    Looks a ticket up in several files at once.
+
+    Args:
+        ticket_positions: {source name: result of build_ticket_positions}.
+        query: Ticket number as typed (e.g. 12345, '12345' or 'INC 12345').
+
+    Returns:
+        {source name: int array of matching row positions} (empty arrays when
+        the ticket is absent), or an empty dict when the query holds no ticket id.
+    """
+    ticket = normalize_ticket_ids(pd.Series([query])).iloc[0]
+    if pd.isna(ticket):
+        return {}
+    empty = np.array([], dtype=np.int64)
+    return {source: positions.get(int(ticket), empty) for source, positions in ticket_positions.items()}
+
+def anti_join_ticket_positions(left_positions: dict, right_positions: dict) -> np.ndarray:
+    """
+    Anti-join of two ticket indexes: the rows of the left file whose ticket is
+    absent from the right file.
+
+    Args:
+        left_positions: Result of build_ticket_positions for the left file.
+        right_positions: Result of build_ticket_positions for the right file.
+
+    Returns:
+        Sorted int array of left row positions.
+    """
+    missing = [positions for ticket, positions in left_positions.items() if ticket not in right_positions]
+    if not missing:
+        return np.array([], dtype=np.int64)
+    return np.sort(np.concatenate(missing))
+
+
+def build_open_orphan_tickets(df: pd.DataFrame, positions: np.ndarray, id_column: str, ticket_type: str,
+                              closed_statuses: list) -> pd.DataFrame:
+    """
+    Lists the open tickets of a status file among the given rows (e.g. those
+    no case references).
+
+    Args:
+        df: SR status or incident report DataFrame.
+        positions: Row positions to consider.
+        id_column: Column holding the ticket id.
+        ticket_type: 'SR' or 'Incident', copied to the 'Type' column.
+        closed_statuses: Statuses (lower case) that close a ticket.
+
+    Returns:
+        A DataFrame with 'Ticket Number', 'Type', 'Status' and, when present,
+        'Created On', one row per open ticket.
+    """
+    rows = df.iloc[positions]
+    orphans = pd.DataFrame({
+        'Ticket Number': normalize_ticket_ids(rows[id_column]).astype('Int64').to_numpy(),
+        'Type': ticket_type,
+        'Status': rows['Status'].to_numpy() if 'Status' in rows.columns else None,
+    })
+    if 'Created On' in rows.columns:
+        orphans['Created On'] = rows['Created On'].to_numpy()
+    is_open = ~orphans['Status'].astype(str).str.strip().str.lower().isin(closed_statuses)
+    return orphans[is_open.to_numpy()].reset_index(drop=True)
+
+# Work queue orderings: each ranks a user's cases by days waiting, largest first
+WORK_QUEUE_ORDERS = ['Age (Days)', 'Days Since Last Note']
+
+
+def build_user_work_queue_index(df: pd.DataFrame, today=None) -> dict:
+    """
+    Orders each user's cases once, oldest first by 'Age (Days)' and stalest
+    first by days since 'Last Note Date', so the top K of any users are
+    prefix slices of their segments instead of a sort per query.
+
+    Args:
+        df: Enriched DataFrame with 'Current User Id', 'Age (Days)' and
+            'Last Note Date' columns.
+        today: Reference day for the days since the last note (default: today).
+
+    Returns:
+        A dict with 'users' (sorted labels), 'offsets' (length users + 1),
+        'orders' ({order label: row positions grouped by user, largest value
+        first, missing values last, ties by the other ordering}) and 'days_since_last_note' (float array
+        aligned with df).
+    """
+    user_codes, users = pd.factorize(df['Current User Id'], sort=True)
+    today = np.datetime64(pd.Timestamp(today if today is not None else datetime.now()).date(), 'D')
+    last_note_days = pd.to_datetime(df['Last Note Date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+    days_since_last_note = np.where(np.isnat(last_note_days), np.nan, (today - last_note_days).astype(np.int64)).astype(float)
+    order_values = {
+        'Age (Days)': pd.to_numeric(df['Age (Days)'], errors='coerce').to_numpy(dtype=float),
+        'Days Since Last Note': days_since_last_note,
+    }
+
+    # Cases without a user sort after every user segment and are never returned
+    segment_codes = np.where(user_codes >= 0, user_codes, len(users))
+    sort_keys = {label: np.where(np.isnan(values), np.inf, -values) for label, values in order_values.items()}
+    orders = {}
+    for label, sort_key in sort_keys.items():
+        # Ties are broken by the other ordering (e.g. the stalest of equally old cases first)
+        tie_break = sort_keys['Days Since Last Note' if label == 'Age (Days)' else 'Age (Days)']
+        orders[label] = np.lexsort((tie_break, sort_key, segment_codes))
+    offsets = np.zeros(len(users) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(user_codes[user_codes >= 0], minlength=len(users)), out=offsets[1:])
+    return {'users': np.asarray(users, dtype=object), 'offsets': offsets, 'orders': orders,
+            'days_since_last_note': days_since_last_note}
+
+
+def query_user_work_queue(queue_index: dict, users, k: int, order_by: str = 'Age (Days)') -> np.ndarray:
+    """
+    Row positions of the top k cases of each selected user by one ordering.
+
+    Args:
+        queue_index: Result of build_user_work_queue_index.
+        users: Users to include (every user when empty).
+        k: Number of cases per user.
+        order_by: One of WORK_QUEUE_ORDERS.
+
+    Returns:
+        Int array of row positions, grouped by user (in sorted user order),
+        ranked within each user.
+    """
+    order = queue_index['orders'][order_by]
+    offsets = queue_index['offsets']
+    selected = set(users) if users else None
+    slices = [
+        order[offsets[row]:min(offsets[row] + k, offsets[row + 1])]
+        for row, user in enumerate(queue_index['users'])
+        if selected is None or user in selected
+    ]
+    return np.concatenate(slices) if slices else np.array([], dtype=np.int64)
+
+# Default ageing buckets: lower edges (days) of every bucket after the first, i.e. 0-2, 3-7, 8-14, 15-30, 31+
+AGE_BUCKET_EDGES = [3, 8, 15, 31]
+
+
+def get_age_bucket_labels(edges: list) -> list:
+    """
+    Labels of the ageing buckets delimited by the given edges.
+
+    Args:
+        edges: Increasing lower edges (days) of every bucket after the first.
+
+    Returns:
+        One label per bucket, e.g. ['0-2', '3-7', '8-14', '15-30', '31+'].
+    """
+    lower_edges = [0] + list(edges)
+    labels = [f"{lo}-{hi - 1}" if hi - 1 > lo else str(lo) for lo, hi in zip(lower_edges[:-1], lower_edges[1:])]
+    return labels + [f"{lower_edges[-1]}+"]
+
+
+def calculate_age_bucket_counts(df: pd.DataFrame, group_column: str, edges: list = None,
+                                missing_label: str = None) -> pd.DataFrame:
+    """
+    Counts cases per ageing bucket and group in one pass: 'Age (Days)' is
+    bucketed with np.digitize and the (group, bucket) pairs are counted with
+    np.bincount.
+
+    Args:
+        df: Enriched DataFrame with 'Age (Days)' and the group column.
+        group_column: Column to split the counts by (e.g. 'Current User Id', 'Type').
+        edges: Bucket edges (default AGE_BUCKET_EDGES).
+        missing_label: Group label for rows with no group value; such rows are
+                       skipped when None. Rows without an age are always skipped.
+
+    Returns:
+        A DataFrame indexed by 'Age Bucket' (every bucket, in order) with one
+        column per group (sorted).
+    """
+    edges = AGE_BUCKET_EDGES if edges is None else list(edges)
+    labels = get_age_bucket_labels(edges)
+    ages = pd.to_numeric(df['Age (Days)'], errors='coerce').to_numpy(dtype=float)
+    groups = df[group_column] if missing_label is None else df[group_column].fillna(missing_label)
+    group_codes, group_labels = pd.factorize(groups, sort=True)
+    valid = ~np.isnan(ages) & (group_codes >= 0)
+
+    buckets = np.digitize(ages[valid], edges)
+    counts = np.bincount(group_codes[valid] * len(labels) + buckets, minlength=len(group_labels) * len(labels))
+    return pd.DataFrame(
+        counts.reshape(len(group_labels), len(labels)).T,
+        index=pd.Index(labels, name='Age Bucket'),
+        columns=pd.Index(np.asarray(group_labels, dtype=object), name=group_column)
+    )
 
 if __name__ == '__main__':
     test_calculate_team_status_summary()